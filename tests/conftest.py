@@ -0,0 +1,41 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'vech-challan.py')
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location('vech_challan', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Registered under an importable name so pickled references to its functions resolve
+    sys.modules['vech_challan'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+vech_challan = _load()
+
+
+@pytest.fixture
+def vech():
+    return vech_challan
+
+
+class OfflineSession:
+    """ Stands in for a requests session with the network unplugged """
+
+    def get(self, url, **kwargs):
+        raise vech_challan.requests.ConnectionError(f"offline: {url}")
+
+    post = get
+
+
+@pytest.fixture
+def offline(vech, monkeypatch):
+    monkeypatch.setattr(vech, 'get_http_session', lambda: OfflineSession())
+    monkeypatch.setattr(vech, 'SOURCE_ROUTER', vech.SourceRouter())
+    vech.LOOKUP_CACHE._entries.clear()
+    return vech
@@ -0,0 +1,108 @@
+import json
+import threading
+
+import pytest
+
+PLATES = [f"MH12AB{n:04d}" for n in range(1, 41)]
+
+
+def _fake_record(plate_number):
+    return {'plate': plate_number.upper(), 'status': 'ok', 'sources': {},
+            'vehicle_info': {}, 'challan_data': [], 'generated_on': ''}
+
+
+def _run_batch(vech, tmp_path, **kwargs):
+    """ Run a batch in a thread so a hang fails the test instead of the session """
+    input_file = tmp_path / 'plates.txt'
+    if not input_file.exists():
+        input_file.write_text('\n'.join(PLATES) + '\n')
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(
+        stats=vech.run_batch(str(input_file), str(tmp_path / 'out.jsonl'), **kwargs)), daemon=True)
+    thread.start()
+    thread.join(30)
+    assert not thread.is_alive(), "batch hung"
+    return outcome['stats']
+
+
+def _output_plates(tmp_path):
+    with open(tmp_path / 'out.jsonl') as f:
+        return [json.loads(line)['plate'] for line in f]
+
+
+def test_journal_load_reads_finished_plates_and_result_end(vech, tmp_path):
+    path = tmp_path / 'out.jsonl.journal'
+    path.write_text("MH12AB0001\tok\t0\t40\nMH12AB0002\tinvalid\t0\t0\nMH12AB0003\tfailed\t40\t35\n")
+    journal = vech.CheckpointJournal(str(path))
+
+    assert journal.load() == {'MH12AB0001': 'ok', 'MH12AB0002': 'invalid', 'MH12AB0003': 'failed'}
+    assert journal.result_end() == 75
+    assert journal.is_done('MH12AB0001') and journal.is_done('MH12AB0002')
+    # Failed plates are retried on resume
+    assert not journal.is_done('MH12AB0003')
+
+
+@pytest.mark.parametrize('torn', ["MH12AB0002\tok\t40\t3", "MH12AB0002\tok\t40", "MH12AB0002\tok\t40\t35\t9\n"])
+def test_journal_load_ignores_a_torn_last_line(vech, tmp_path, torn):
+    path = tmp_path / 'out.jsonl.journal'
+    path.write_text("MH12AB0001\tok\t0\t40\n" + torn)
+    journal = vech.CheckpointJournal(str(path))
+
+    assert journal.load() == {'MH12AB0001': 'ok'}
+    assert journal.result_end() == 40
+
+
+def test_resume_skips_finished_plates_and_drops_a_torn_result(vech, tmp_path, monkeypatch):
+    looked_up = []
+
+    def interrupted_record(plate_number):
+        if len(looked_up) == 15:
+            raise KeyboardInterrupt
+        looked_up.append(plate_number)
+        return _fake_record(plate_number)
+
+    monkeypatch.setattr(vech, 'lookup_record', interrupted_record)
+    first = _run_batch(vech, tmp_path)
+    assert first['ok'] == 15
+    # A result line cut off by the crash, after the last journaled one
+    with open(tmp_path / 'out.jsonl', 'ab') as out:
+        out.write(b'{"plate": "MH12AB00')
+
+    looked_up.clear()
+    monkeypatch.setattr(vech, 'lookup_record', lambda plate_number: looked_up.append(plate_number) or
+                        _fake_record(plate_number))
+    second = _run_batch(vech, tmp_path)
+
+    assert second['skipped'] == 15
+    assert looked_up == PLATES[15:]
+    assert _output_plates(tmp_path) == PLATES
+
+
+def test_interrupted_pipeline_batch_stops_its_threads_before_closing_the_journal(vech, tmp_path, monkeypatch):
+    plate_reader = vech.PlateReader
+
+    class InterruptedReader(plate_reader):
+        def __iter__(self):
+            for count, plate in enumerate(super().__iter__()):
+                if count == 20:
+                    raise KeyboardInterrupt
+                yield plate
+
+    def slow_record(plate_number):
+        threading.Event().wait(0.005)
+        return _fake_record(plate_number)
+
+    monkeypatch.setattr(vech, 'lookup_record', slow_record)
+    monkeypatch.setattr(vech, 'PlateReader', InterruptedReader)
+    first = _run_batch(vech, tmp_path, workers=4, queue_size=2)
+
+    assert not [thread.name for thread in threading.enumerate() if thread.name.startswith('vech-')]
+    # Every journaled result is in the output, and nothing was written after the journal closed
+    journal = vech.CheckpointJournal(str(tmp_path / 'out.jsonl.journal'))
+    finished = [plate for plate in journal.load() if journal.is_done(plate)]
+    assert len(finished) == first['ok'] <= 20
+    assert journal.result_end() == (tmp_path / 'out.jsonl').stat().st_size
+
+    monkeypatch.setattr(vech, 'PlateReader', plate_reader)
+    _run_batch(vech, tmp_path, workers=4, queue_size=2)
+    assert sorted(_output_plates(tmp_path)) == PLATES
@@ -0,0 +1,62 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+
+def _write_results(path, plates):
+    with open(path, 'w') as f:
+        for n, plate in enumerate(plates):
+            f.write(json.dumps({'plate': plate, 'status': 'ok',
+                                'vehicle_info': {'registration_number': plate, 'owner_name': f"Owner {n}"},
+                                'challan_data': [], 'generated_on': '01-01-2025 10:00:00'}) + '\n')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_directory_and_archive_modes_name_duplicates_alike(vech, tmp_path, workers):
+    results = tmp_path / 'results.jsonl'
+    _write_results(results, ['MH12AB0001', 'KA01CD0002', 'MH12AB0001', 'MH12AB0001'])
+
+    report_dir = tmp_path / 'reports'
+    archive = tmp_path / 'reports.zip'
+    assert vech.run_bulk_reports([str(results)], report_dir=str(report_dir), workers=workers, chunk_size=1)
+    assert vech.run_bulk_reports([str(results)], archive=str(archive), workers=workers, chunk_size=1)
+
+    with zipfile.ZipFile(archive) as zf:
+        archived = {name: zf.read(name) for name in zf.namelist()}
+    on_disk = {name: (report_dir / name).read_bytes() for name in os.listdir(report_dir)}
+
+    assert sorted(on_disk) == ['KA01CD0002.txt', 'MH12AB0001.txt', 'MH12AB0001_2.txt', 'MH12AB0001_3.txt']
+    assert on_disk == archived
+    # Numbered in input order: the third line is the second report for the plate
+    assert b'Owner 2' in on_disk['MH12AB0001_2.txt']
+
+
+def test_failed_chunk_write_removes_its_temporary_files(vech, tmp_path, monkeypatch):
+    lines = [json.dumps({'plate': plate, 'vehicle_info': {'registration_number': plate}})
+             for plate in ('MH12AB0001', 'MH12AB0002', 'MH12AB0003')]
+    opened = []
+
+    def disk_full_open(path, mode='r', *args, **kwargs):
+        opened.append(path)
+        if len(opened) == 2:
+            raise OSError("No space left on device")
+        return open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(vech, 'open', disk_full_open, raising=False)
+    with pytest.raises(OSError):
+        vech.render_report_chunk(lines, str(tmp_path), 0)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_run_removes_unrenamed_temporary_files(vech, tmp_path):
+    results = tmp_path / 'results.jsonl'
+    _write_results(results, ['MH12AB0001', 'KA01CD0002', 'DL01EF0003'])
+    report_dir = tmp_path / 'reports'
+    # A directory in the way makes renaming the first report fail
+    (report_dir / 'MH12AB0001.txt').mkdir(parents=True)
+
+    assert vech.run_bulk_reports([str(results)], report_dir=str(report_dir), workers=1, chunk_size=3) is None
+    assert os.listdir(report_dir) == ['MH12AB0001.txt']
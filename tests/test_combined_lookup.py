@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def sources(vech, monkeypatch):
+    """ Replace both lookup chains; set behaviour per kind with sources[kind] = func """
+    behaviour = {}
+
+    @vech.instrument_lookup('vehicle')
+    def lookup_vehicle_info(plate_number):
+        return behaviour['vehicle'](plate_number)
+
+    @vech.instrument_lookup('challan')
+    def lookup_challan_data(plate_number):
+        return behaviour['challan'](plate_number)
+
+    monkeypatch.setattr(vech, 'lookup_vehicle_info', lookup_vehicle_info)
+    monkeypatch.setattr(vech, 'lookup_challan_data', lookup_challan_data)
+    return behaviour
+
+
+def _answered_by(vech, source, make):
+    """ A lookup that gets its result from source on the first attempt """
+    def lookup(plate_number):
+        with vech.source_span(source, 'https://example.test/') as span:
+            span.mark_hit()
+        return vech.tag_source(make(plate_number), source)
+    return lookup
+
+
+@pytest.fixture
+def vehicle_ok(vech):
+    return _answered_by(vech, 'vahan_api', lambda plate_number: {'registration_number': plate_number.upper()})
+
+
+@pytest.fixture
+def challans_ok(vech):
+    return _answered_by(vech, 'echallan_api', lambda plate_number: [{'challan_number': 'C1'}])
+
+
+def test_both_parts_succeed(vech, sources, vehicle_ok, challans_ok):
+    sources['vehicle'], sources['challan'] = vehicle_ok, challans_ok
+
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    assert result['status'] == 'ok'
+    assert result['vehicle_info']['registration_number'] == 'MH12AB1234'
+    assert result['challan_data'][0]['challan_number'] == 'C1'
+    assert {kind: part['source'] for kind, part in result['parts'].items()} == {
+        'vehicle': 'vahan_api', 'challan': 'echallan_api'}
+
+
+def test_one_part_raising_leaves_the_other(vech, sources, vehicle_ok):
+    def broken(plate_number):
+        raise RuntimeError("eChallan down")
+    sources['vehicle'], sources['challan'] = vehicle_ok, broken
+
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    assert result['status'] == 'partial'
+    assert result['vehicle_info']['registration_number'] == 'MH12AB1234'
+    assert result['challan_data'] is None
+    assert result['parts']['challan']['status'] == 'error'
+    assert result['parts']['challan']['error'] == "eChallan down"
+
+
+def test_one_part_timing_out(vech, sources, challans_ok):
+    def timed_out(plate_number):
+        raise vech.requests.Timeout("read timed out")
+    sources['vehicle'], sources['challan'] = timed_out, challans_ok
+
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    assert result['status'] == 'partial'
+    assert result['parts']['vehicle']['status'] == 'error'
+    assert result['parts']['challan']['status'] == 'ok'
+
+
+def test_both_parts_failing(vech, sources):
+    sources['vehicle'] = sources['challan'] = lambda plate_number: None
+
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    assert result['status'] == 'failed'
+    assert [part['status'] for part in result['parts'].values()] == ['not_found', 'not_found']
+
+
+def test_generated_data_is_reported_as_synthetic(vech, sources, challans_ok):
+    def generated(plate_number):
+        vech.mark_synthetic('vehicle')
+        return {'registration_number': plate_number.upper()}
+    sources['vehicle'], sources['challan'] = generated, challans_ok
+
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    # Generated data still counts as an answer, but is labelled as such
+    assert result['status'] == 'ok'
+    assert result['parts']['vehicle']['status'] == 'synthetic'
+    assert result['parts']['vehicle']['source'] == 'synthetic'
+
+
+def test_parts_run_concurrently(vech, sources):
+    def slow(result):
+        def lookup(plate_number):
+            time.sleep(0.3)
+            return result
+        return lookup
+    sources['vehicle'], sources['challan'] = slow({'registration_number': 'X'}), slow([])
+
+    started = time.perf_counter()
+    result = vech.fetch_vehicle_and_challan('MH12AB1234')
+
+    assert result['status'] == 'ok'
+    assert time.perf_counter() - started < 0.55
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+
+TODAY = date(2025, 6, 1).toordinal()
+
+
+def _day(offset):
+    return date.fromordinal(TODAY + offset).strftime('%d-%m-%Y')
+
+
+@pytest.fixture
+def alerts(vech):
+    return vech.ExpiryAlerts(lead_days=(30, 7, 1, 0), hooks=[lambda batch: None])
+
+
+def _fired(alerts, today):
+    return [(alert['plate'], alert['field'], alert['lead_days']) for alert in alerts.due(today)]
+
+
+def test_each_lead_time_fires_once_and_missed_ones_collapse(alerts):
+    alerts.update('MH12AB1234', {'insurance_upto': _day(10)}, today=TODAY)
+
+    # 30 days ahead already went by: one alert, not a backlog
+    assert _fired(alerts, TODAY) == [('MH12AB1234', 'insurance_upto', 30)]
+    assert _fired(alerts, TODAY) == []
+    assert _fired(alerts, TODAY + 3) == [('MH12AB1234', 'insurance_upto', 7)]
+    # Asleep past the 1-day mark: only the shortest lead due is raised
+    assert _fired(alerts, TODAY + 10) == [('MH12AB1234', 'insurance_upto', 0)]
+    assert _fired(alerts, TODAY + 20) == []
+
+
+def test_changed_date_replaces_the_pending_alert(alerts):
+    alerts.update('MH12AB1234', {'puc_upto': _day(40)}, today=TODAY)
+    alerts.update('MH12AB1234', {'puc_upto': _day(100)}, today=TODAY)
+
+    assert _fired(alerts, TODAY + 10) == []
+    assert [alert['expires'] for alert in alerts.due(TODAY + 70)] == [
+        date.fromordinal(TODAY + 100).strftime('%Y-%m-%d')]
+
+
+def test_disabled_without_hooks_and_unavailable_records_ignored(vech, alerts):
+    idle = vech.ExpiryAlerts()
+    idle.update('MH12AB1234', {'insurance_upto': _day(1)}, today=TODAY)
+    alerts.update('MH12AB1234', vech.Unavailable('vehicle', 'MH12AB1234'), today=TODAY)
+
+    assert idle.heap == [] and alerts.heap == []
+
+
+def test_state_file_suppresses_alerts_already_sent(vech, alerts, tmp_path):
+    today = date.today().toordinal()
+    record = {'fitness_upto': date.fromordinal(today + 5).strftime('%d-%m-%Y')}
+    alerts.update('MH12AB1234', record, today=today)
+    assert [alert['lead_days'] for alert in alerts.due(today)] == [7]
+    state = tmp_path / 'alerts.json'
+    alerts.save(str(state))
+
+    restarted = vech.ExpiryAlerts(lead_days=(30, 7, 1, 0), hooks=[lambda batch: None])
+    assert restarted.load(str(state))
+    restarted.update('MH12AB1234', record, today=today)
+    assert restarted.due(today) == []
+    assert [alert['lead_days'] for alert in restarted.due(today + 4)] == [1]
+
+
+def test_failing_hook_does_not_stop_the_others(vech, capsys):
+    delivered = []
+
+    def broken(batch):
+        raise RuntimeError("webhook down")
+    broken.spec = 'broken'
+
+    alerts = vech.ExpiryAlerts(hooks=[broken, delivered.extend])
+    alerts.update('MH12AB1234', {'insurance_upto': _day(0)}, today=TODAY)
+
+    assert alerts.dispatch(alerts.due(TODAY)) == 1
+    assert len(delivered) == 1
+    assert 'webhook down' in capsys.readouterr().out
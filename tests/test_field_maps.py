@@ -0,0 +1,115 @@
+import pytest
+
+VAHAN_ROW = {
+    'regn_no': 'MH12AB1234', 'owner_name': 'A KUMAR', 'f_name': 'B KUMAR', 'c_add': 'Pune', 'p_code': '411001',
+    'mobile': '98XXXXXX10', 'vh_class': 'LMV', 'maker_desc': 'MARUTI', 'maker_model': 'SWIFT',
+    'fuel_type': 'PETROL', 'reg_dt': '15-03-2015', 'reg_upto': '14-03-2030', 'fit_upto': '14-03-2030',
+    'ins_upto': '01-01-2027', 'puc_upto': '01-07-2026', 'colr_desc': 'WHITE', 'eng_no': 'AB123456',
+    'chasi_no': 'MA123456789', 'blacklist_status': 'N', 'rc_status': 'ACTIVE',
+}
+ALT_ROW = {
+    'owner_name': 'A KUMAR', 'father_name': 'B KUMAR', 'address': 'Pune', 'pincode': '411001',
+    'vehicle_class': 'LMV', 'maker': 'MARUTI', 'model': 'SWIFT', 'fuel_type': 'DIESEL',
+    'registration_date': '2015-03-15', 'insurance_upto': '01-01-2027', 'vehicle_color': 'RED',
+    'blacklist_status': 'NO', 'rc_status': 'ACTIVE',
+}
+CHALLAN_ROW = {
+    'challanNo': 'DL123', 'issueDate': '01-02-2025', 'offenceDate': '01-02-2025', 'offenceTime': '10:30',
+    'offencePlace': 'ITO', 'offenceSection': '184', 'offenceDesc': 'Red light', 'amount': 1000,
+    'paymentStatus': 'UNPAID',
+}
+
+
+# The hand-written mappings the registry replaced, as they were inline in the fetch functions
+def baseline_vahan(vehicle_data, calculate_vehicle_age):
+    return {
+        "registration_number": vehicle_data.get('regn_no', 'N/A'),
+        "owner_name": vehicle_data.get('owner_name', 'N/A'),
+        "father_name": vehicle_data.get('f_name', 'N/A'),
+        "address": vehicle_data.get('c_add', 'N/A'),
+        "pincode": vehicle_data.get('p_code', 'N/A'),
+        "mobile": vehicle_data.get('mobile', 'N/A'),
+        "vehicle_class": vehicle_data.get('vh_class', 'N/A'),
+        "maker": vehicle_data.get('maker_desc', 'N/A'),
+        "model": vehicle_data.get('maker_model', 'N/A'),
+        "fuel_type": vehicle_data.get('fuel_type', 'N/A'),
+        "registration_date": vehicle_data.get('reg_dt', 'N/A'),
+        "registration_upto": vehicle_data.get('reg_upto', 'N/A'),
+        "fitness_upto": vehicle_data.get('fit_upto', 'N/A'),
+        "insurance_upto": vehicle_data.get('ins_upto', 'N/A'),
+        "puc_upto": vehicle_data.get('puc_upto', 'N/A'),
+        "vehicle_color": vehicle_data.get('colr_desc', 'N/A'),
+        "engine_number": vehicle_data.get('eng_no', 'N/A'),
+        "chassis_number": vehicle_data.get('chasi_no', 'N/A'),
+        "blacklist_status": "NO" if vehicle_data.get('blacklist_status') == 'N' else "YES",
+        "rc_status": vehicle_data.get('rc_status', 'N/A'),
+        "vehicle_age_years": calculate_vehicle_age(vehicle_data.get('reg_dt', ''))
+    }
+
+
+def baseline_alt(data, plate_number, calculate_vehicle_age):
+    return {
+        "registration_number": plate_number.upper(),
+        "owner_name": data.get('owner_name', 'N/A'),
+        "father_name": data.get('father_name', 'N/A'),
+        "address": data.get('address', 'N/A'),
+        "pincode": data.get('pincode', 'N/A'),
+        "mobile": data.get('mobile', 'N/A'),
+        "vehicle_class": data.get('vehicle_class', 'N/A'),
+        "maker": data.get('maker', 'N/A'),
+        "model": data.get('model', 'N/A'),
+        "fuel_type": data.get('fuel_type', 'N/A'),
+        "registration_date": data.get('registration_date', 'N/A'),
+        "registration_upto": data.get('registration_upto', 'N/A'),
+        "fitness_upto": data.get('fitness_upto', 'N/A'),
+        "insurance_upto": data.get('insurance_upto', 'N/A'),
+        "puc_upto": data.get('puc_upto', 'N/A'),
+        "vehicle_color": data.get('vehicle_color', 'N/A'),
+        "engine_number": data.get('engine_number', 'N/A'),
+        "chassis_number": data.get('chassis_number', 'N/A'),
+        "blacklist_status": data.get('blacklist_status', 'N/A'),
+        "rc_status": data.get('rc_status', 'N/A'),
+        "vehicle_age_years": calculate_vehicle_age(data.get('registration_date', ''))
+    }
+
+
+def baseline_challan(challan):
+    return {
+        "challan_number": challan.get('challanNo', 'N/A'),
+        "issue_date": challan.get('issueDate', 'N/A'),
+        "offence_date": challan.get('offenceDate', 'N/A'),
+        "offence_time": challan.get('offenceTime', 'N/A'),
+        "offence_place": challan.get('offencePlace', 'N/A'),
+        "offence_section": challan.get('offenceSection', 'N/A'),
+        "offence_desc": challan.get('offenceDesc', 'N/A'),
+        "amount": challan.get('amount', 'N/A'),
+        "payment_status": challan.get('paymentStatus', 'N/A'),
+        "payment_date": challan.get('paymentDate', 'N/A'),
+        "court_name": challan.get('courtName', 'N/A'),
+        "court_address": challan.get('courtAddress', 'N/A')
+    }
+
+
+@pytest.mark.parametrize('row', [VAHAN_ROW, {}, dict(VAHAN_ROW, blacklist_status='Y', reg_dt='garbage')])
+def test_vahan_mapper_matches_the_inline_mapping(vech, row):
+    extract = vech.compile_field_map(vech.VAHAN_FIELD_MAP)
+    assert extract(row, 'MH12AB1234') == baseline_vahan(row, vech.calculate_vehicle_age)
+
+
+@pytest.mark.parametrize('row', [ALT_ROW, {}, dict(ALT_ROW, registration_date='15-03-2015')])
+def test_alt_api_mapper_matches_the_inline_mapping(vech, row):
+    extract = vech.compile_field_map(vech.ALT_VEHICLE_FIELD_MAP)
+    assert extract(row, 'mh12ab1234') == baseline_alt(row, 'mh12ab1234', vech.calculate_vehicle_age)
+
+
+@pytest.mark.parametrize('row', [CHALLAN_ROW, {}])
+def test_challan_mapper_matches_the_inline_mapping(vech, row):
+    extract = vech.compile_field_map(vech.ECHALLAN_FIELD_MAP)
+    assert extract(row) == baseline_challan(row)
+
+
+def test_registered_sources_use_the_compiled_mappers(vech):
+    assert vech.SOURCE_REGISTRY['vahan_api']['mapper'](VAHAN_ROW, 'MH12AB1234') == \
+        baseline_vahan(VAHAN_ROW, vech.calculate_vehicle_age)
+    assert list(vech.SOURCE_REGISTRY['vehicle_alt_api']['mapper'](ALT_ROW, 'MH12AB1234')) == \
+        list(baseline_alt(ALT_ROW, 'MH12AB1234', vech.calculate_vehicle_age))
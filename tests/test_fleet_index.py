@@ -0,0 +1,99 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+
+def _record(plate, challans=(), **vehicle):
+    vehicle_info = {'registration_number': plate, 'owner_name': f"Owner of {plate}", 'maker': 'MARUTI',
+                    'model': 'SWIFT', 'blacklist_status': 'NO', 'rc_status': 'ACTIVE'}
+    vehicle_info.update(vehicle)
+    return {'plate': plate, 'status': 'ok', 'vehicle_info': vehicle_info,
+            'challan_data': [dict(challan_number=f"{plate}-{n}", **challan) for n, challan in enumerate(challans)]}
+
+
+def _append(path, *records, partial=None):
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+        if partial:
+            f.write(partial)
+
+
+@pytest.fixture
+def index(vech, tmp_path):
+    index = vech.FleetIndex(str(tmp_path / 'fleet.db'))
+    yield index
+    index.close()
+
+
+def test_ingest_only_reads_new_complete_lines(index, tmp_path):
+    results = tmp_path / 'results.jsonl'
+    _append(results, _record('MH12AB0001'), _record('DL01CD0002'), partial='{"plate": "KA0')
+
+    assert index.ingest(str(results)) == 2
+    assert index.ingest(str(results)) == 0
+
+    # The half-written line is picked up once it is finished
+    with open(results, 'a') as f:
+        f.write('1EF0003", "status": "ok", "vehicle_info": {}, "challan_data": []}\n')
+    assert index.ingest(str(results)) == 1
+    assert index.counts() == (2, 0)
+
+
+def test_rewritten_file_is_read_from_the_start(index, tmp_path):
+    results = tmp_path / 'results.jsonl'
+    _append(results, _record('MH12AB0001'))
+    index.ingest(str(results))
+
+    results.write_text(json.dumps(_record('DL01CD0002')) + '\n' + json.dumps(_record('KA01EF0003')) + '\n')
+    assert index.ingest(str(results)) == 2
+    assert index.counts()[0] == 3
+
+
+def test_newest_result_for_a_plate_wins(index, tmp_path):
+    results = tmp_path / 'results.jsonl'
+    _append(results, _record('MH12AB0001', [{'amount': 500, 'payment_status': 'Unpaid'}] * 3))
+    _append(results, _record('MH12AB0001', [{'amount': 200, 'payment_status': 'Paid'}], owner_name='New Owner'))
+    index.ingest(str(results))
+
+    assert index.counts() == (1, 1)
+    assert index.outstanding_by_state() == []
+
+
+def test_queries(index, tmp_path):
+    soon = (date.today() + timedelta(days=10)).strftime('%d-%m-%Y')
+    later = (date.today() + timedelta(days=90)).strftime('%d-%m-%Y')
+    lapsed = (date.today() - timedelta(days=5)).strftime('%d-%m-%Y')
+    results = tmp_path / 'results.jsonl'
+    _append(results,
+            _record('MH12AB0001', [{'amount': '₹1,000', 'payment_status': 'Unpaid', 'offence_section': '184'},
+                                   {'amount': 500, 'payment_status': 'Paid', 'offence_section': '177'},
+                                   {'amount': 500, 'payment_status': 'Paid', 'offence_section': '177'}],
+                    insurance_upto=soon),
+            _record('MH14CD0002', [{'amount': 'Rs. 300', 'payment_status': 'Pending', 'offence_section': '177'}],
+                    blacklist_status='Yes', insurance_upto=later),
+            _record('DL01EF0003', rc_status='SUSPENDED', insurance_upto=lapsed))
+    index.ingest(str(results))
+
+    assert index.outstanding_by_state() == [('MH', 2, 2, 1300.0)]
+    assert [row[0] for row in index.flagged_vehicles()] == ['DL01EF0003', 'MH14CD0002']
+    assert [row[0] for row in index.flagged_vehicles(state='dl')] == ['DL01EF0003']
+    assert [(row[0], row[3]) for row in index.top_sections()] == [('177', 1300.0), ('184', 1000.0)]
+    assert [(row[0], row[3]) for row in index.top_sections(outstanding_only=True)] == [('184', 1000.0), ('177', 300.0)]
+    assert [row[0] for row in index.expiring('insurance_upto', 30)] == ['MH12AB0001']
+    assert [row[0] for row in index.expiring('insurance_upto', 30, include_expired=True)] == ['DL01EF0003', 'MH12AB0001']
+    with pytest.raises(ValueError):
+        index.expiring('owner_name')
+
+
+def test_outstanding_only_is_reachable_from_the_command_line(vech, tmp_path, capsys):
+    results = tmp_path / 'results.jsonl'
+    _append(results, _record('MH12AB0001', [{'amount': 100, 'payment_status': 'Paid', 'offence_section': '177'},
+                                            {'amount': 50, 'payment_status': 'Unpaid', 'offence_section': '184'}]))
+    args = vech.parse_arguments(['query', 'top-sections', '--outstanding-only', '--json',
+                                 '-r', str(results), '--index', str(tmp_path / 'fleet.db')])
+    assert args.outstanding_only
+
+    rows = vech.run_query(args.query, args.results, args.index, as_json=True, outstanding_only=args.outstanding_only)
+    assert [row[0] for row in rows] == ['184']
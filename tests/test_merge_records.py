@@ -0,0 +1,47 @@
+VAHAN = {'source': 'VAHAN', 'owner_name': 'A KUMAR', 'maker_model': 'N/A', 'fuel_type': 'PETROL',
+         'registration_date': '15-03-2015', 'vehicle_age_years': 'N/A', 'insurance_upto': ''}
+ALT = {'source': 'AltAPI', 'owner_name': 'ANIL KUMAR', 'maker_model': 'MARUTI SWIFT', 'fuel_type': 'DIESEL',
+       'registration_date': '01-01-2010', 'vehicle_age_years': 16, 'insurance_upto': None, 'color': 'WHITE'}
+SCRAPED = {'owner_name': 'N/A', 'insurance_upto': '31-12-2026', 'color': 'RED'}
+
+
+def test_more_trusted_source_wins_conflicts(vech):
+    merged = vech.merge_vehicle_records([('VAHAN', VAHAN), ('AltAPI', ALT)])
+
+    assert merged['owner_name'] == 'A KUMAR'
+    assert merged['fuel_type'] == 'PETROL'
+    assert merged['registration_date'] == '15-03-2015'
+    assert merged['field_sources']['owner_name'] == 'VAHAN'
+
+
+def test_missing_fields_are_filled_from_later_sources(vech):
+    merged = vech.merge_vehicle_records([('VAHAN', VAHAN), ('AltAPI', ALT), ('Scraper', SCRAPED)])
+
+    # 'N/A', '' and None all count as missing
+    assert (merged['maker_model'], merged['field_sources']['maker_model']) == ('MARUTI SWIFT', 'AltAPI')
+    assert (merged['insurance_upto'], merged['field_sources']['insurance_upto']) == ('31-12-2026', 'Scraper')
+    # A field only a later source knows is still taken from the first one that has it
+    assert (merged['color'], merged['field_sources']['color']) == ('WHITE', 'AltAPI')
+
+
+def test_fields_no_source_knows_stay_na_without_a_source(vech):
+    merged = vech.merge_vehicle_records([('VAHAN', {'owner_name': '', 'fuel_type': None}),
+                                         ('AltAPI', {'owner_name': 'N/A'})])
+
+    assert merged['owner_name'] == 'N/A' and merged['fuel_type'] == 'N/A'
+    assert merged['field_sources'] == {}
+
+
+def test_age_follows_the_winning_registration_date(vech):
+    merged = vech.merge_vehicle_records([('VAHAN', VAHAN), ('AltAPI', ALT)])
+
+    # AltAPI's age belongs to its own (losing) registration date
+    assert merged['vehicle_age_years'] == vech.calculate_vehicle_age('15-03-2015')
+    assert merged['field_sources']['vehicle_age_years'] == 'VAHAN'
+
+
+def test_bookkeeping_keys_are_not_merged(vech):
+    merged = vech.merge_vehicle_records([('VAHAN', VAHAN), ('AltAPI', dict(ALT, field_sources={'x': 'y'}))])
+
+    assert 'source' not in merged
+    assert 'x' not in merged['field_sources']
@@ -0,0 +1,93 @@
+import pytest
+
+
+@pytest.fixture
+def metrics(vech, monkeypatch):
+    registry = vech.MetricsRegistry()
+    monkeypatch.setattr(vech, 'METRICS', registry)
+    return registry
+
+
+def test_counters_and_gauges_render_with_help_and_type(vech):
+    registry = vech.MetricsRegistry()
+    registry.inc('vech_requests_total', {'source': 'vahan_api'}, help_text="Requests by source")
+    registry.inc('vech_requests_total', {'source': 'vahan_api'}, 2)
+    registry.set('vech_queue_depth', 7, {'stage': 'fetch'}, help_text="Queue depth")
+
+    assert registry.render().splitlines() == [
+        '# HELP vech_requests_total Requests by source',
+        '# TYPE vech_requests_total counter',
+        'vech_requests_total{source="vahan_api"} 3',
+        '# HELP vech_queue_depth Queue depth',
+        '# TYPE vech_queue_depth gauge',
+        'vech_queue_depth{stage="fetch"} 7',
+    ]
+
+
+def test_label_values_are_escaped(vech):
+    registry = vech.MetricsRegistry()
+    registry.inc('vech_errors_total', {'error': 'bad "quote" \\ and\nnewline'})
+
+    assert 'vech_errors_total{error="bad \\"quote\\" \\\\ and\\nnewline"} 1' in registry.render().splitlines()
+
+
+def test_help_text_is_escaped(vech):
+    registry = vech.MetricsRegistry()
+    registry.inc('vech_x_total', help_text="first line\nsecond \\ line")
+
+    assert registry.render().splitlines()[0] == '# HELP vech_x_total first line\\nsecond \\\\ line'
+
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count(vech):
+    registry = vech.MetricsRegistry()
+    for value in (0.2, 0.7, 3.0):
+        registry.observe('vech_latency_seconds', value, {'source': 's'}, buckets=(0.5, 1.0, 2.5))
+
+    assert registry.render().splitlines() == [
+        '# TYPE vech_latency_seconds histogram',
+        'vech_latency_seconds_bucket{source="s",le="0.5"} 1',
+        'vech_latency_seconds_bucket{source="s",le="1.0"} 2',
+        'vech_latency_seconds_bucket{source="s",le="2.5"} 2',
+        'vech_latency_seconds_bucket{source="s",le="+Inf"} 3',
+        'vech_latency_seconds_sum{source="s"} 3.900000',
+        'vech_latency_seconds_count{source="s"} 3',
+    ]
+
+
+def test_source_span_outcomes(vech, metrics):
+    with vech.source_span('vahan_api', 'https://vahan.example/api') as span:
+        span.mark_hit()
+    with vech.source_span('vahan_api', 'https://vahan.example/api'):
+        pass
+    with pytest.raises(ValueError):
+        with vech.source_span('vahan_api', 'https://vahan.example/api'):
+            raise ValueError("bad json")
+
+    counters = metrics.snapshot()['counters']
+    for outcome in ('hit', 'miss', 'error'):
+        assert counters[f'vech_source_outcomes_total{{outcome="{outcome}",source="vahan_api"}}'] == 1
+    # Failed attempts are labelled with the exception instead of an HTTP status
+    assert counters['vech_source_requests_total{host="vahan.example",source="vahan_api",status="ValueError"}'] == 1
+
+
+def test_lookup_outcomes(vech, metrics):
+    @vech.instrument_lookup('vehicle')
+    def found(plate_number):
+        return {'registration_number': plate_number}
+
+    @vech.instrument_lookup('vehicle')
+    def generated(plate_number):
+        vech.mark_synthetic('vehicle')
+        return {'registration_number': plate_number}
+
+    @vech.instrument_lookup('vehicle')
+    def missing(plate_number):
+        return None
+
+    for lookup in (found, generated, missing):
+        lookup('MH12AB1234')
+
+    counters = metrics.snapshot()['counters']
+    for outcome in ('ok', 'synthetic', 'failed'):
+        assert counters[f'vech_lookups_total{{kind="vehicle",outcome="{outcome}"}}'] == 1
+    assert vech.last_lookup_was_synthetic() is False
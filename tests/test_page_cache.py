@@ -0,0 +1,115 @@
+import os
+
+import pytest
+import requests
+
+URL = 'https://vahan.example/landing'
+PAGE = b'<html><form id="search">v1</form></html>'
+
+
+def _response(status, body=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.url = URL
+    return response
+
+
+class ScriptedSession:
+    """ Answers GETs from a list of responses and keeps the headers each request sent """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(vech, tmp_path):
+    cache = vech.PageCache()
+    cache.open(str(tmp_path / 'pages'))
+    return cache
+
+
+def _first_page(etag='"v1"', body=PAGE):
+    return _response(200, body, {'ETag': etag, 'Last-Modified': 'Mon, 05 Jan 2026 10:00:00 GMT',
+                                 'Content-Type': 'text/html; charset=utf-8'})
+
+
+def test_revalidation_sends_both_validators(cache):
+    session = ScriptedSession(_first_page(), _response(304))
+
+    cache.get(session, URL, {'User-Agent': 'test'})
+    cache.get(session, URL, {'User-Agent': 'test'})
+
+    assert 'If-None-Match' not in session.sent[0] and 'If-Modified-Since' not in session.sent[0]
+    assert session.sent[1] == {'User-Agent': 'test', 'If-None-Match': '"v1"',
+                               'If-Modified-Since': 'Mon, 05 Jan 2026 10:00:00 GMT'}
+
+
+def test_not_modified_serves_the_stored_body(cache):
+    session = ScriptedSession(_first_page(), _response(304))
+
+    cache.get(session, URL)
+    response = cache.get(session, URL)
+
+    assert response.status_code == 200
+    assert response.content == PAGE
+    assert response.from_cache
+    assert response.headers['Content-Type'] == 'text/html; charset=utf-8'
+    assert cache.summary()['not_modified'] == 1
+    assert cache.summary()['bytes_saved'] == len(PAGE)
+
+
+def test_a_new_page_replaces_the_stored_entry(cache):
+    new_page = b'<html><form id="search">v2</form></html>'
+    session = ScriptedSession(_first_page(), _first_page('"v2"', new_page), _response(304))
+
+    cache.get(session, URL)
+    changed = cache.get(session, URL)
+    revalidated = cache.get(session, URL)
+
+    assert changed.content == new_page and not getattr(changed, 'from_cache', False)
+    assert session.sent[2]['If-None-Match'] == '"v2"'
+    assert revalidated.content == new_page
+    assert cache.summary()['stored'] == 2
+
+
+def test_pages_without_validators_are_not_stored(cache):
+    session = ScriptedSession(_response(200, PAGE), _response(200, PAGE))
+
+    cache.get(session, URL)
+    cache.get(session, URL)
+
+    assert 'If-None-Match' not in session.sent[1]
+    assert cache.summary()['stored'] == 0
+
+
+def test_torn_body_is_not_served(cache):
+    session = ScriptedSession(_first_page(), _response(200, PAGE))
+    cache.get(session, URL)
+    meta_path, body_path = cache._paths(URL)
+    with open(body_path, 'ab') as f:
+        f.write(b'partial')
+
+    response = cache.get(session, URL)
+
+    assert 'If-None-Match' not in session.sent[1]
+    assert response.content == PAGE
+
+
+def test_unopened_cache_fetches_without_storing(vech, tmp_path):
+    cache = vech.PageCache()
+    session = ScriptedSession(_first_page(), _first_page())
+
+    cache.get(session, URL)
+    cache.get(session, URL)
+
+    assert 'If-None-Match' not in session.sent[1]
+    assert cache.summary() == {'requests': 2, 'not_modified': 0, 'stored': 0,
+                               'bytes_received': 2 * len(PAGE), 'bytes_saved': 0}
+    assert not os.listdir(tmp_path)
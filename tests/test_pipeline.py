@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+
+PLATES = [f"MH12AB{n:04d}" for n in range(1, 201)]
+
+
+def _fake_record(plate_number):
+    return {'plate': plate_number.upper(), 'status': 'ok', 'sources': {},
+            'vehicle_info': {}, 'challan_data': [], 'generated_on': ''}
+
+
+def _run_with_timeout(pipeline, plates, sink, timeout=30):
+    """ Run the pipeline in a thread so a hang fails the test instead of the session """
+    outcome = {}
+
+    def target():
+        try:
+            outcome['report'] = pipeline.run(plates, sink)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline hung"
+    return outcome
+
+
+def test_failing_sink_stops_the_pipeline_and_reraises(vech, monkeypatch):
+    monkeypatch.setattr(vech, 'lookup_record', _fake_record)
+    pipeline = vech.LookupPipeline(fetch_workers=4, queue_size=2, sample_interval=0.01)
+    delivered = []
+
+    def sink(kind, plate_key, plate_number, record, line):
+        if len(delivered) == 5:
+            raise OSError("disk full")
+        delivered.append(plate_number)
+
+    outcome = _run_with_timeout(pipeline, iter(PLATES), sink)
+
+    assert isinstance(outcome.get('error'), OSError)
+    assert len(delivered) == 5
+    # The reader stops early instead of pushing the whole input through
+    assert pipeline.counts['read'] < len(PLATES)
+
+
+def test_failing_item_is_counted_and_the_rest_continue(vech, monkeypatch):
+    def flaky_record(plate_number):
+        if plate_number.endswith('7'):
+            raise ValueError("bad response")
+        return _fake_record(plate_number)
+
+    monkeypatch.setattr(vech, 'lookup_record', flaky_record)
+    pipeline = vech.LookupPipeline(fetch_workers=4, queue_size=2, sample_interval=0.01)
+    delivered = []
+
+    outcome = _run_with_timeout(pipeline, iter(PLATES),
+                                lambda kind, plate_key, plate_number, record, line: delivered.append(plate_number))
+
+    failing = [plate for plate in PLATES if plate.endswith('7')]
+    assert 'error' not in outcome
+    assert outcome['report']['errors'] == len(failing)
+    assert outcome['report']['found'] == len(PLATES) - len(failing)
+    assert sorted(delivered) == sorted(set(PLATES) - set(failing))
+
+
+@pytest.mark.parametrize('plates', [[], ['not a plate', 'MH12AB0001']])
+def test_pipeline_finishes_on_short_input(vech, monkeypatch, plates):
+    monkeypatch.setattr(vech, 'lookup_record', _fake_record)
+    pipeline = vech.LookupPipeline(fetch_workers=2, queue_size=1, sample_interval=0.01)
+    kinds = []
+
+    outcome = _run_with_timeout(pipeline, iter(plates),
+                                lambda kind, plate_key, plate_number, record, line: kinds.append(kind))
+
+    assert outcome['report']['plates'] == len(plates)
+    assert sorted(kinds) == sorted('result' if vech.validate_license_plate(p) else 'invalid' for p in plates)
+
+
+def test_scrape_pipeline_returns_permits_when_the_sink_raises(offline):
+    # Offline, every site fails and each plate reaches the sink with no result
+    pipeline = offline.ScrapePipeline('vehicle', fetch_workers=2, parse_processes=1, queue_size=2)
+    delivered = []
+
+    def sink(plate_number, result):
+        if len(delivered) == 3:
+            raise OSError("disk full")
+        delivered.append(plate_number)
+
+    outcome = _run_with_timeout(pipeline, iter(PLATES[:50]), sink)
+
+    assert isinstance(outcome.get('error'), OSError)
+    assert len(delivered) == 3
+    # Every permit taken was given back
+    assert pipeline.in_flight._value == 2
+
+
+def test_scrape_pipeline_queues_are_bounded_and_do_not_deadlock(offline):
+    # Every plate walks through all sites, re-queueing itself on the full fetch queue
+    pipeline = offline.ScrapePipeline('vehicle', fetch_workers=3, parse_processes=1, queue_size=4, max_in_flight=2)
+    assert (pipeline.fetch_queue.maxsize, pipeline.parse_queue.maxsize) == (2, 4)
+    delivered = []
+
+    outcome = _run_with_timeout(pipeline, iter(PLATES[:40]), lambda plate_number, result: delivered.append(plate_number))
+
+    assert outcome['report']['plates'] == 40
+    assert sorted(delivered) == sorted(PLATES[:40])
+    assert pipeline.stats['fetch'].max_depth <= 2
@@ -0,0 +1,64 @@
+import pytest
+
+
+@pytest.fixture
+def plates_file(tmp_path):
+    path = tmp_path / 'plates.txt'
+    path.write_bytes(b"# fleet export\n"
+                     b"MH12AB1234\n"
+                     b"\n"
+                     b"mh 12 ab 1234   # same plate, other spelling\n"
+                     b"KA01-CD-0002\r\n"
+                     b"ka01cd0002\n"
+                     b"DL3CAF0001\n"
+                     b"MH12AB1234")
+    return path
+
+
+@pytest.mark.parametrize('capacity', [None, 1000])
+def test_duplicates_are_dropped_in_original_spelling(vech, plates_file, capacity):
+    reader = vech.PlateReader(str(plates_file), capacity=capacity)
+
+    assert list(reader) == ['MH12AB1234', 'KA01-CD-0002', 'DL3CAF0001']
+    assert (reader.read, reader.unique, reader.duplicates) == (6, 3, 3)
+    assert reader.duplicate_rate() == pytest.approx(0.5)
+
+
+def test_dedup_off_keeps_every_line(vech, plates_file):
+    reader = vech.PlateReader(str(plates_file), dedup=False)
+
+    assert len(list(reader)) == 6
+    assert reader.duplicates == 0
+
+
+def test_empty_file(vech, tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    reader = vech.PlateReader(str(path))
+
+    assert list(reader) == []
+    assert reader.duplicate_rate() == 0.0
+
+
+def test_packed_keys_keep_leading_zeros_apart(vech, tmp_path):
+    path = tmp_path / 'plates.txt'
+    path.write_bytes(b"0A\nA\n00A\n")
+
+    assert list(vech.PlateReader(str(path))) == ['0A', 'A', '00A']
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives(vech):
+    bloom = vech.BloomFilter(10000, error_rate=0.01)
+    keys = [f"MH{n:08d}".encode() for n in range(10000)]
+
+    false_positives = sum(bloom.add(key) for key in keys)
+    assert all(bloom.add(key) for key in keys)
+    assert false_positives < 0.02 * len(keys)
+
+
+def test_long_keys_are_not_packed_into_colliding_ints(vech, tmp_path):
+    path = tmp_path / 'plates.txt'
+    # With 16 characters the length no longer fits beside the packed value
+    path.write_bytes(b"0000000000000000\n0000000000000001\nABCDEFGHIJKLMNOPQ\nABCDEFGHIJKLMNOPQ\n")
+
+    assert list(vech.PlateReader(str(path))) == ['0000000000000000', '0000000000000001', 'ABCDEFGHIJKLMNOPQ']
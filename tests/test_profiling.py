@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _work(n):
+    return sum(i * i for i in range(n))
+
+
+def test_threaded_profile_sees_worker_threads_without_hanging(vech):
+    profile = vech.ThreadedProfile()
+    profile.enable()
+    executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        # A thread that died while starting to profile would leave these unfinished
+        futures = [executor.submit(_work, 10000) for _ in range(8)]
+        results = [future.result(timeout=30) for future in futures]
+    finally:
+        profile.disable()
+        executor.shutdown(wait=False)
+
+    assert results == [_work(10000)] * 8
+    stats = profile.stats()
+    assert any(name == '_work' for (filename, line, name) in stats.stats)
@@ -0,0 +1,81 @@
+import gzip
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+@pytest.fixture
+def service(offline):
+    vech = offline
+    server = vech.ThreadingHTTPServer(('127.0.0.1', 0), vech.LookupRequestHandler)
+    server.daemon_threads = True
+    server.service = vech.LookupService(workers=2, snapshot_token='s3cret')
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.service.shutdown()
+
+
+def _request(server, path, body=None, headers=None):
+    """ (status, headers, body bytes) of one request to the test server """
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_health_and_metrics(service):
+    status, headers, body = _request(service, '/health')
+    assert status == 200 and json.loads(body)['status'] == 'ok'
+
+    status, headers, body = _request(service, '/metrics')
+    assert status == 200
+    assert headers['Content-Type'].startswith('text/plain')
+    assert b'# TYPE vech_http_requests_total counter' in body
+
+
+def test_lookup_valid_and_invalid_plates(service):
+    status, headers, body = _request(service, '/vehicle/MH12AB1234')
+    assert status == 200
+    assert json.loads(body)['plate'] == 'MH12AB1234'
+
+    status, headers, body = _request(service, '/vehicle/MH12%21AB')
+    assert status == 400
+    assert json.loads(body)['status'] == 'invalid'
+
+
+def test_bulk_reports_invalid_plates_per_item(service):
+    status, headers, body = _request(service, '/vehicle/bulk', {'plates': ['MH12AB1234', 'nope']})
+    assert status == 200
+    assert [result['status'] for result in json.loads(body)['results']][1] == 'invalid'
+
+    assert _request(service, '/vehicle/bulk', {'plates': 'MH12AB1234'})[0] == 400
+    assert _request(service, '/vehicle/bulk', {'plates': ['X'] * 1001})[0] == 413
+
+
+def test_unknown_paths_are_404(service):
+    assert _request(service, '/owners/MH12AB1234')[0] == 404
+    assert _request(service, '/vehicle/MH12AB1234', {'plates': []})[0] == 404
+
+
+def test_snapshot_needs_the_token(service):
+    assert _request(service, '/snapshot')[0] == 401
+    assert _request(service, '/snapshot', headers={'Authorization': 'Bearer wrong'})[0] == 401
+
+    status, headers, body = _request(service, '/snapshot', headers={'Authorization': 'Bearer s3cret'})
+    assert status == 200
+    assert json.loads(gzip.decompress(body).splitlines()[0])['format'] == 'vech-challan-snapshot'
+
+
+def test_snapshot_is_disabled_without_a_token(service):
+    service.service.snapshot_token = None
+    assert _request(service, '/snapshot', headers={'Authorization': 'Bearer s3cret'})[0] == 403
@@ -0,0 +1,85 @@
+import gzip
+import time
+
+import pytest
+
+
+@pytest.fixture
+def caches(vech, monkeypatch):
+    """ Fresh, empty module-level caches for one test; call it to empty them again mid-test """
+    def reset():
+        monkeypatch.setattr(vech, 'LOOKUP_CACHE', vech.LookupCache())
+        monkeypatch.setattr(vech, 'FORM_SCHEMAS', vech.LookupCache(ttl=7 * 24 * 3600, max_entries=1024))
+        monkeypatch.setattr(vech, 'SOURCE_ROUTER', vech.SourceRouter())
+
+    reset()
+    return reset
+
+
+def test_full_snapshot_round_trip(vech, caches, tmp_path):
+    vech.LOOKUP_CACHE.put(('vehicle', 'MH12AB0001'), {'owner_name': 'A'})
+    vech.LOOKUP_CACHE.put(('challan', 'MH12AB0001'), [{'challan_number': 'C1'}])
+    vech.FORM_SCHEMAS.put(('https://example.test/', 'abc'), {'action': '/lookup'})
+    vech.SOURCE_ROUTER.restore_health('MH', 'vahan_api', 10, 7)
+    path = str(tmp_path / 'full.snap')
+
+    header = vech.save_snapshot(path)
+    assert header['base'] is None
+    assert header['counts'] == {'vehicle': 1, 'challan': 1, 'health': 1, 'form': 1}
+
+    caches()
+    loaded, counts = vech.load_snapshot(path)
+    assert loaded['id'] == header['id']
+    assert counts == {'vehicle': 1, 'challan': 1, 'health': 1, 'form': 1, 'skipped': 0}
+    assert vech.LOOKUP_CACHE.get(('vehicle', 'MH12AB0001')) == {'owner_name': 'A'}
+    assert vech.FORM_SCHEMAS.get(('https://example.test/', 'abc')) == {'action': '/lookup'}
+    assert vech.SOURCE_ROUTER.health() == [('MH', 'vahan_api', 10, 7)]
+
+    # Loading the same file again changes nothing
+    assert vech.load_snapshot(path)[1]['skipped'] == 4
+
+
+def test_delta_holds_only_newer_entries_and_chains_onto_its_base(vech, caches, tmp_path):
+    vech.LOOKUP_CACHE.put(('vehicle', 'MH12AB0001'), {'owner_name': 'A'})
+    base_path, delta_path = str(tmp_path / 'base.snap'), str(tmp_path / 'delta.snap')
+    base = vech.save_snapshot(base_path)
+    time.sleep(0.01)
+    vech.LOOKUP_CACHE.put(('vehicle', 'KA01CD0002'), {'owner_name': 'B'})
+
+    delta = vech.save_snapshot(delta_path, base_path)
+    assert delta['base'] == base['id']
+    assert delta['counts']['vehicle'] == 1
+
+    # Deltas may be applied in either order
+    caches()
+    vech.load_snapshot(delta_path)
+    vech.load_snapshot(base_path)
+    assert vech.LOOKUP_CACHE.get(('vehicle', 'MH12AB0001')) == {'owner_name': 'A'}
+    assert vech.LOOKUP_CACHE.get(('vehicle', 'KA01CD0002')) == {'owner_name': 'B'}
+
+
+def test_truncated_snapshot_loads_what_came_before_the_cut(vech, caches, tmp_path, capsys):
+    for n in range(200):
+        vech.LOOKUP_CACHE.put(('vehicle', f"MH12AB{n:04d}"), {'owner_name': f"Owner {n}" * 20})
+    path = tmp_path / 'full.snap'
+    vech.save_snapshot(str(path))
+    raw = gzip.decompress(path.read_bytes())
+    cut = tmp_path / 'cut.snap'
+    cut.write_bytes(gzip.compress(raw[:len(raw) // 2]))
+
+    caches()
+    header, counts = vech.load_snapshot(str(cut))
+    assert 0 < counts['vehicle'] < 200
+    assert 'truncated' in capsys.readouterr().out
+
+
+def test_foreign_and_newer_files_are_rejected(vech, tmp_path):
+    other = tmp_path / 'other.gz'
+    other.write_bytes(gzip.compress(b'{"hello": 1}\n'))
+    newer = tmp_path / 'newer.snap'
+    newer.write_bytes(gzip.compress(
+        f'{{"format": "{vech.SNAPSHOT_FORMAT}", "version": {vech.SNAPSHOT_VERSION + 1}}}\n'.encode()))
+
+    for path in (other, newer):
+        with pytest.raises(ValueError):
+            vech.read_snapshot_header(str(path))
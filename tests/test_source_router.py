@@ -0,0 +1,92 @@
+SOURCES = [('vahan', 'fetch_vahan'), ('alt_api', 'fetch_alt'), ('scraping', 'fetch_scraped')]
+
+
+def _names(routed):
+    return [source for source, fetcher in routed]
+
+
+def _fail(router, plate, source, times):
+    for _ in range(times):
+        router.record(plate, source, False)
+
+
+def test_unobserved_sources_keep_the_default_order(vech):
+    router = vech.SourceRouter()
+    assert _names(router.order(SOURCES, 'MH12AB1234')) == ['vahan', 'alt_api', 'scraping']
+
+
+def test_sources_are_ranked_by_smoothed_success_rate(vech):
+    router = vech.SourceRouter()
+    _fail(router, 'MH12AB1234', 'vahan', 5)
+    for _ in range(5):
+        router.record('MH12AB1234', 'scraping', True)
+
+    assert _names(router.order(SOURCES, 'MH12AB1234')) == ['scraping', 'alt_api', 'vahan']
+
+
+def test_dead_source_is_skipped_except_for_a_probe(vech):
+    router = vech.SourceRouter(min_attempts=20, probe_every=5)
+    _fail(router, 'KA01AB1234', 'vahan', 19)
+    # Not enough attempts to give up on it yet
+    assert 'vahan' in _names(router.order(SOURCES, 'KA01AB1234'))
+
+    router.record('KA01AB1234', 'vahan', False)
+    picked = [_names(router.order(SOURCES, 'KA01AB1234')) for _ in range(10)]
+    assert ['vahan' in names for names in picked] == [False, False, False, False, True] * 2
+    # The other sources are unaffected and the probe goes last
+    assert all(names[:2] == ['alt_api', 'scraping'] for names in picked)
+
+
+def test_probe_success_brings_a_source_back(vech):
+    router = vech.SourceRouter(min_attempts=10, skip_below=0.2)
+    _fail(router, 'KA01AB1234', 'vahan', 10)
+    assert 'vahan' not in _names(router.order(SOURCES, 'KA01AB1234'))
+
+    for _ in range(3):
+        router.record('KA01AB1234', 'vahan', True)
+    assert 'vahan' in _names(router.order(SOURCES, 'KA01AB1234'))
+
+
+def test_rto_with_enough_samples_is_routed_on_its_own(vech):
+    router = vech.SourceRouter(min_attempts=20)
+    # VAHAN fails for Pune (MH12) but works across the rest of Maharashtra
+    _fail(router, 'MH12AB0001', 'vahan', 20)
+    for _ in range(200):
+        router.record('MH04AB0001', 'vahan', True)
+
+    assert router.regions('MH12 CD 9999') == ('MH12', 'MH')
+    assert 'vahan' not in _names(router.order(SOURCES, 'MH12CD9999'))
+    assert 'vahan' in _names(router.order(SOURCES, 'MH14CD9999'))
+
+
+def test_rto_without_enough_samples_falls_back_to_the_state(vech):
+    router = vech.SourceRouter(min_attempts=20)
+    _fail(router, 'MH04AB0001', 'vahan', 20)
+
+    # MH12 has never been seen: the state's numbers decide
+    assert 'vahan' not in _names(router.order(SOURCES, 'MH12AB0001'))
+    # A few good MH12 lookups are not yet enough to override the state
+    for _ in range(19):
+        router.record('MH12AB0001', 'vahan', True)
+    assert _names(router.order(SOURCES, 'MH12AB0001'))[0] != 'vahan'
+    router.record('MH12AB0001', 'vahan', True)
+    assert _names(router.order(SOURCES, 'MH12AB0001'))[0] == 'vahan'
+
+
+def test_plates_without_an_rto_use_the_state(vech):
+    router = vech.SourceRouter()
+    assert vech.plate_rto('DL3CAB1234') == 'DL03'
+    assert router.regions('XX12AB1234') == (vech.DEFAULT_STATE,)
+
+
+def test_health_round_trips_rto_and_state_counts(vech):
+    router = vech.SourceRouter()
+    _fail(router, 'MH12AB0001', 'vahan', 3)
+    router.record('MH12AB0001', 'vahan', True)
+
+    assert sorted(router.health()) == [('MH', 'vahan', 4, 1), ('MH12', 'vahan', 4, 1)]
+    restored = vech.SourceRouter()
+    for row in router.health():
+        assert restored.restore_health(*row)
+    assert sorted(restored.health()) == sorted(router.health())
+    assert [row[0] for row in restored.rows('mh')] == ['MH', 'MH12']
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+DOCUMENT = {
+    'status': 200,
+    'message': "Données reçues ✓",
+    'data': [
+        {'challan_no': f"MH{n:06d}", 'amount': n * 250 + 0.5, 'place': "Pune – Hinjewadi ₹",
+         'offences': [{'act': "MVA 194D", 'paid': n % 2 == 0}], 'remark': None}
+        for n in range(25)
+    ] + [12345678901234567890, -1.5e-7, "tail \"quoted\" \\ string", [], {}],
+    'meta': {'page': 1, 'pages': [1, 2, 3]},
+    'empty': []
+}
+
+
+def _chunks(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 4096])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_matches_json_loads_at_any_chunk_size(vech, size, indent):
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=indent).encode('utf-8')
+    fields = {}
+
+    items = list(vech.iter_json_array(_chunks(data, size), 'data', fields))
+
+    assert items == DOCUMENT['data']
+    assert fields == {key: value for key, value in DOCUMENT.items() if key != 'data'}
+
+
+@pytest.mark.parametrize('document', [{}, {'data': []}, {'data': None, 'x': 1}, {'x': [1, 2]}])
+def test_missing_empty_or_non_array_key(vech, document):
+    fields = {}
+    assert list(vech.iter_json_array(_chunks(json.dumps(document).encode(), 3), 'data', fields)) == []
+    assert fields == {key: value for key, value in document.items() if key != 'data' or value is None}
+
+
+@pytest.mark.parametrize('data', [b'{"data": [1, 2', b'[1, 2]', b'{"data": [1 2]}', b''])
+def test_malformed_or_truncated_stream_raises(vech, data):
+    with pytest.raises(ValueError):
+        list(vech.iter_json_array(_chunks(data, 4), 'data'))
@@ -0,0 +1,39 @@
+import io
+import re
+
+
+def _cell_text(output, column):
+    """ Join the wrapped pieces of one grid column back together """
+    pieces = []
+    for line in output.splitlines():
+        if line.startswith('|'):
+            pieces.append(line.split('|')[column + 1].strip())
+    return ' '.join(piece for piece in pieces if piece)
+
+
+def test_long_cells_wrap_instead_of_truncating(vech):
+    address = "Flat 12, Some Very Long Housing Society Name, Near The Old Railway Station, Pune 411001"
+    out = io.StringIO()
+    vech.render_table(["Field", "Value"], [["Address", address]], out=out, plain=False, max_width=20)
+    output = out.getvalue()
+
+    assert '…' not in output
+    assert all(len(line) == len(output.splitlines()[0]) for line in output.splitlines())
+    assert _cell_text(output, 1) == "Value " + address
+
+
+def test_rows_after_the_sample_wrap_too(vech):
+    rows = [["a", "short"]] * 3 + [["b", "x" * 95]]
+    out = io.StringIO()
+    vech.render_table(["K", "V"], rows, out=out, plain=False, sample_size=2)
+
+    assert '…' not in out.getvalue()
+    assert ''.join(re.findall(r'x+', out.getvalue())) == "x" * 95
+
+
+def test_plain_mode_keeps_values_whole(vech):
+    value = "y" * 300
+    out = io.StringIO()
+    vech.render_table(["K", "V"], [["k", value]], out=out, plain=True)
+
+    assert out.getvalue().splitlines() == ["K\tV", "k\t" + value]
@@ -0,0 +1,82 @@
+import json
+import os
+
+
+def test_unavailable_challans_are_not_shown_as_a_clean_record(offline, monkeypatch, capsys, tmp_path):
+    vech = offline
+    monkeypatch.setitem(vech.LOOKUP_OPTIONS, 'strict', True)
+    monkeypatch.chdir(tmp_path)
+
+    vehicle_info, challan_data = vech.run_lookup('DL01AB1234', save_format='txt', plain=True)
+
+    out = capsys.readouterr().out
+    assert vech.is_unavailable(vehicle_info) and vech.is_unavailable(challan_data)
+    assert 'Challan data unavailable' in out
+    assert 'Vehicle information unavailable' in out
+    assert 'No challans found' not in out
+    # Nothing any source could back up, so nothing is saved
+    assert 'Nothing to save' in out
+    assert os.listdir(tmp_path) == []
+
+
+def test_report_says_challans_unavailable(vech):
+    vehicle_info = {'registration_number': 'DL01AB1234', 'owner_name': 'X'}
+    unavailable = vech.Unavailable('challan', 'DL01AB1234')
+
+    text = vech.REPORT_TEMPLATE.render(vehicle_info, unavailable, '01-01-2026 00:00:00')
+    assert 'Challan data unavailable' in text
+    assert 'No challans found' not in text
+
+    # Stored results carry it as a plain dict
+    line = json.dumps({'plate': 'DL01AB1234', 'vehicle_info': vehicle_info, 'challan_data': unavailable})
+    (name, data), = vech.render_report_chunk([line])[0]
+    assert b'Challan data unavailable' in data
+    assert b'No challans found' not in data
+
+
+def test_empty_challan_list_still_reads_as_no_challans(vech, capsys):
+    vech.display_challan_info([], plain=True)
+    assert 'No challans found' in capsys.readouterr().out
+    assert 'No challans found' in vech.REPORT_TEMPLATE.render({'registration_number': 'X'}, [], 'now')
+
+
+def test_csv_export_marks_unavailable_challans(vech, tmp_path):
+    path = tmp_path / 'out.csv'
+    vech.export_to_csv({'registration_number': 'DL01AB1234'}, vech.Unavailable('challan', 'DL01AB1234'), str(path))
+    text = path.read_text()
+    assert 'Challan data unavailable' in text
+    assert 'No challans found' not in text
+
+
+def _menu(vech, monkeypatch, answers):
+    """ Drive the interactive menu with canned answers (exit is appended) """
+    answers = iter(answers + ['4'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    monkeypatch.setattr(vech, 'print_banner', lambda: None)
+    vech.interactive_menu()
+
+
+def test_menu_vehicle_lookup_reports_unavailable(vech, monkeypatch, capsys):
+    monkeypatch.setattr(vech, 'lookup_vehicle_info', lambda plate_number: vech.Unavailable('vehicle', plate_number))
+
+    _menu(vech, monkeypatch, ['1', 'DL01AB1234'])
+
+    out = capsys.readouterr().out
+    assert 'Vehicle information unavailable' in out
+    assert 'Failed to retrieve' not in out
+
+
+def test_menu_combined_lookup_shows_challans_when_the_vehicle_is_unavailable(vech, monkeypatch, capsys, tmp_path):
+    challans = [{'challan_number': 'DL123456789', 'amount': '500', 'payment_status': 'Unpaid'}]
+    monkeypatch.setattr(vech, 'fetch_vehicle_and_challan', lambda plate_number, **kwargs: {
+        'vehicle_info': vech.Unavailable('vehicle', plate_number), 'challan_data': challans})
+    monkeypatch.chdir(tmp_path)
+
+    _menu(vech, monkeypatch, ['3', 'DL01AB1234', 'y', '3'])
+
+    out = capsys.readouterr().out
+    assert 'Vehicle information unavailable' in out
+    assert 'DL123456789' in out
+    assert 'Failed to retrieve' not in out
+    saved, = tmp_path.iterdir()
+    assert 'DL123456789' in saved.read_text()
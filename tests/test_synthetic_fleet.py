@@ -0,0 +1,50 @@
+from datetime import datetime
+
+
+def _fleet_records(fleet, count=50):
+    records = [record for batch in fleet.batches(count, batch_size=20) for record in batch]
+    for record in records:
+        record.pop('generated_on')
+    return records
+
+
+def test_same_seed_gives_the_same_fleet(vech):
+    as_of = datetime(2026, 1, 15)
+    first = _fleet_records(vech.SyntheticFleet(seed=42, as_of=as_of))
+
+    assert _fleet_records(vech.SyntheticFleet(seed=42, as_of=as_of)) == first
+    assert _fleet_records(vech.SyntheticFleet(seed=43, as_of=as_of)) != first
+    assert len({record['plate'] for record in first}) == len(first)
+
+
+def test_same_seed_gives_the_same_fleet_on_the_same_day(vech, tmp_path):
+    vech.run_synthetic_fleet(30, str(tmp_path / 'a.jsonl'), seed=7, batch_size=8, plates_only=True)
+    vech.run_synthetic_fleet(30, str(tmp_path / 'b.jsonl'), seed=7, batch_size=8, plates_only=True)
+
+    assert (tmp_path / 'a.jsonl').read_text() == (tmp_path / 'b.jsonl').read_text()
+
+
+def test_dates_follow_the_current_day_without_as_of(vech, monkeypatch):
+    fleet = vech.SyntheticFleet(seed=1)
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2031, 6, 1)
+
+    # A long-lived fleet (like the module's fallback generator) must not keep its import day
+    monkeypatch.setattr(vech, 'datetime', LaterDatetime)
+    record = fleet.vehicle('MH12AB1234')
+
+    registered = LaterDatetime.strptime(record['registration_date'], '%d-%m-%Y')
+    assert 1 <= (LaterDatetime(2031, 6, 1) - registered).days // 365 <= 13
+    assert record['vehicle_age_years'] == (LaterDatetime(2031, 6, 1) - registered).days // 365
+    assert all(LaterDatetime.strptime(challan['issue_date'], '%d-%m-%Y').year >= 2028
+               for challan in fleet.challans('MH12AB1234'))
+
+
+def test_fixed_as_of_is_kept(vech):
+    fleet = vech.SyntheticFleet(seed=1, as_of=datetime(2020, 3, 1))
+
+    assert fleet.as_of == datetime(2020, 3, 1).toordinal()
+    assert int(fleet.vehicle('MH12AB1234')['registration_date'][-4:]) <= 2019
@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.fixture
+def work_queue(vech, tmp_path):
+    work_queue = vech.WorkQueue(str(tmp_path / 'queue.db'))
+    yield work_queue
+    work_queue.close()
+
+
+def test_batches_are_leased_once_and_completed_by_their_holder(work_queue):
+    assert work_queue.enqueue([f"MH12AB000{n}" for n in range(5)], batch_size=2) == 3
+
+    first = work_queue.lease('w1')
+    second = work_queue.lease('w2')
+    assert first[1] == ['MH12AB0000', 'MH12AB0001']
+    assert second[0] != first[0]
+
+    assert work_queue.heartbeat(first[0], 'w1')
+    assert not work_queue.heartbeat(first[0], 'w2')
+    assert not work_queue.complete(first[0], 'w2')
+    assert work_queue.complete(first[0], 'w1')
+
+    progress = work_queue.progress()
+    assert (progress['pending'], progress['leased'], progress['done'], progress['workers']) == (1, 1, 1, 1)
+
+
+def test_expired_lease_is_reassigned_and_the_old_holder_loses_it(work_queue):
+    work_queue.enqueue(['MH12AB0001', 'MH12AB0002'], batch_size=2)
+    batch_id, plates = work_queue.lease('w1', lease_seconds=-1)
+    assert work_queue.progress()['expired'] == 1
+
+    assert work_queue.lease('w2') == (batch_id, plates)
+    assert not work_queue.heartbeat(batch_id, 'w1')
+    assert not work_queue.complete(batch_id, 'w1')
+    assert work_queue.lease('w3') is None
+
+
+def test_reassigned_batch_only_redoes_unfinished_plates(work_queue, tmp_path):
+    work_queue.enqueue(['MH12AB0001', 'mh 12 ab 0002'], batch_size=2)
+    batch_id, plates = work_queue.lease('w1', lease_seconds=-1)
+    work_queue.store_result(batch_id, 'w1', {'plate': 'MH12AB0001', 'status': 'ok'})
+    work_queue.store_result(batch_id, 'w1', {'plate': 'MH12AB0002', 'status': 'failed'})
+
+    batch_id, plates = work_queue.lease('w2')
+    assert work_queue.finished_plates(plates) == {'MH12AB0001'}
+
+    output = tmp_path / 'merged.jsonl'
+    assert work_queue.merge(str(output)) == 2
+    assert len(output.read_text().splitlines()) == 2
@@ -8,11 +8,38 @@ Description: A tool to retrieve vehicle information and challan data from licens
 
 import os
 import sys
+import csv
 import json
 import requests
 import argparse
 import time
 import random
+import logging
+import threading
+import itertools
+import functools
+import queue
+import codecs
+import gzip
+import io
+import re
+import hashlib
+import hmac
+import heapq
+import math
+import mmap
+import shutil
+import sqlite3
+import subprocess
+import textwrap
+import zipfile
+from collections import OrderedDict, deque
+import cProfile
+import pstats
+from contextlib import contextmanager
+from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 from tabulate import tabulate
 import colorama
@@ -31,6 +58,759 @@ AUTHOR = "azod814"
 VAHAN_API_BASE = "https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4"
 CHALLAN_API_BASE = "https://echallan.parivahan.gov.in/"
 
+# VAHAN and third-party JSON APIs (headers mimic a browser)
+VAHAN_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Referer': 'https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4',
+    'X-Requested-With': 'XMLHttpRequest',
+    'Connection': 'keep-alive',
+}
+API_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# eChallan citizen API (headers mimic a browser)
+ECHALLAN_API_URL = "https://echallan.parivahan.gov.in/ecitizen/services/echallan/ChallanCitizen/ChallanCitizenAction"
+ECHALLAN_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows .0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Referer': 'https://echallan.parivahan.gov.in/',
+    'X-Requested-With': 'XMLHttpRequest',
+    'Connection': 'keep-alive',
+}
+
+# Web scraping sources
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # gzip/deflate, plus br/zstd when the decoders are installed
+    'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+}
+VEHICLE_SCRAPE_SITES = [
+    "https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4",
+    "https://www.rtovehicleinformation.com/",
+    "https://www.carinfo.in/",
+    "https://www.drivinglicence.in/"
+]
+CHALLAN_SCRAPE_SITES = [
+    "https://echallan.parivahan.gov.in/",
+    "https://www.trafficchallan.in/",
+    "https://www.mychallan.in/",
+    "https://www.checkchallan.com/"
+]
+# Form fields whose name contains one of these words receive the plate number
+VEHICLE_FORM_KEYWORDS = ('reg', 'number', 'plate')
+CHALLAN_FORM_KEYWORDS = ('vehicle', 'number', 'plate')
+
+# Instrumentation
+# Structured (JSON lines) events go to this logger; it stays silent until
+# configure_structured_logging() attaches a handler.
+METRICS_LOGGER = logging.getLogger("vech_challan")
+METRICS_LOGGER.addHandler(logging.NullHandler())
+METRICS_LOGGER.propagate = False
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+class MetricsRegistry:
+    """ Thread-safe counters, gauges and histograms exported in Prometheus text format """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return (name, tuple(sorted((labels or {}).items())))
+
+    def inc(self, name, labels=None, value=1, help_text=None):
+        """ Increment a counter """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def set(self, name, value, labels=None, help_text=None):
+        """ Set a gauge """
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def observe(self, name, value, labels=None, buckets=LATENCY_BUCKETS, help_text=None):
+        """ Record one observation in a histogram """
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = {'buckets': buckets, 'counts': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+                self._histograms[key] = hist
+            for i, bound in enumerate(hist['buckets']):
+                if value <= bound:
+                    hist['counts'][i] += 1
+            hist['sum'] += value
+            hist['count'] += 1
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def snapshot(self):
+        """ Return a plain-dict copy of all counters, gauges and histograms """
+        with self._lock:
+            counters = {f"{name}{self._format_labels(labels)}": value
+                        for (name, labels), value in self._counters.items()}
+            gauges = {f"{name}{self._format_labels(labels)}": value
+                      for (name, labels), value in self._gauges.items()}
+            histograms = {f"{name}{self._format_labels(labels)}": {'count': h['count'], 'sum': round(h['sum'], 6)}
+                          for (name, labels), h in self._histograms.items()}
+        return {'counters': counters, 'gauges': gauges, 'histograms': histograms}
+
+    @staticmethod
+    def _format_labels(labels, extra=None):
+        items = list(labels) + list(extra or [])
+        if not items:
+            return ""
+        parts = []
+        for k, v in items:
+            v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            parts.append(f'{k}="{v}"')
+        return "{" + ",".join(parts) + "}"
+
+    def _help_line(self, name):
+        # HELP text escapes backslashes and newlines (label values also escape quotes)
+        return f"# HELP {name} " + self._help[name].replace('\\', '\\\\').replace('\n', '\\n')
+
+    def render(self):
+        """ Render all metrics in the Prometheus text exposition format """
+        lines = []
+        with self._lock:
+            for name in sorted({n for n, _ in self._counters}):
+                if name in self._help:
+                    lines.append(self._help_line(name))
+                lines.append(f"# TYPE {name} counter")
+                for (n, labels), value in sorted(self._counters.items()):
+                    if n == name:
+                        lines.append(f"{name}{self._format_labels(labels)} {value}")
+            for name in sorted({n for n, _ in self._gauges}):
+                if name in self._help:
+                    lines.append(self._help_line(name))
+                lines.append(f"# TYPE {name} gauge")
+                for (n, labels), value in sorted(self._gauges.items()):
+                    if n == name:
+                        lines.append(f"{name}{self._format_labels(labels)} {value}")
+            for name in sorted({n for n, _ in self._histograms}):
+                if name in self._help:
+                    lines.append(self._help_line(name))
+                lines.append(f"# TYPE {name} histogram")
+                for (n, labels), hist in sorted(self._histograms.items()):
+                    if n != name:
+                        continue
+                    for bound, count in zip(hist['buckets'], hist['counts']):
+                        lines.append(f"{name}_bucket{self._format_labels(labels, [('le', bound)])} {count}")
+                    lines.append(f"{name}_bucket{self._format_labels(labels, [('le', '+Inf')])} {hist['count']}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {hist['sum']:.6f}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {hist['count']}")
+        return "\n".join(lines) + "\n"
+
+METRICS = MetricsRegistry()
+
+# Per-thread state for the lookup currently in progress
+_instrumentation = threading.local()
+_lookup_ids = itertools.count(1)
+
+def log_event(event, **fields):
+    """ Emit one structured (JSON) log record """
+    if not METRICS_LOGGER.isEnabledFor(logging.INFO):
+        return
+    record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'event': event}
+    record.update(fields)
+    METRICS_LOGGER.info(json.dumps(record, default=str))
+
+def configure_structured_logging(filename, level=logging.INFO):
+    """ Send structured events to a JSON-lines file ('-' for stderr) """
+    handler = logging.StreamHandler(sys.stderr) if filename == '-' else logging.FileHandler(filename)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    METRICS_LOGGER.addHandler(handler)
+    METRICS_LOGGER.setLevel(level)
+    return handler
+
+def write_metrics(filename):
+    """ Write the Prometheus text export of all collected metrics """
+    try:
+        with open(filename, 'w') as f:
+            f.write(METRICS.render())
+        print(f"{Fore.GREEN}[+] Metrics written to {filename}")
+        return filename
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error writing metrics: {str(e)}")
+        return None
+
+class SourceSpan:
+    """ Timing span around a single source attempt (one HTTP request plus parsing) """
+
+    def __init__(self, source, url, stage=None):
+        self.source = source
+        self.url = url
+        self.host = urlparse(url).netloc or 'local'
+        self.stage = stage
+        self.status = None
+        self.bytes = 0
+        self.parse_time = 0.0
+        self.hit = False
+        self.error = None
+        self.started = time.perf_counter()
+        self.latency = 0.0
+
+    def record_response(self, response):
+        """ Record the HTTP status and body size of a response """
+        self.status = response.status_code
+        self.bytes = len(response.content or b'')
+
+    @contextmanager
+    def parsing(self):
+        """ Time a parsing / extraction block """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_time += time.perf_counter() - start
+
+    def mark_hit(self):
+        """ Mark this attempt as the one that produced the returned data """
+        self.hit = True
+        lookup = getattr(_instrumentation, 'lookup', None)
+        if lookup is not None:
+            lookup.source = self.source
+
+    def finish(self):
+        self.latency = time.perf_counter() - self.started
+        status = str(self.status) if self.status is not None else (self.error or 'error')
+        outcome = 'hit' if self.hit else ('error' if self.error else 'miss')
+        labels = {'source': self.source, 'host': self.host, 'status': status}
+        METRICS.inc('vech_source_requests_total', labels,
+                    help_text="Source attempts by source, host and HTTP status")
+        METRICS.inc('vech_source_outcomes_total', {'source': self.source, 'outcome': outcome},
+                    help_text="Source attempts by outcome (hit, miss, error)")
+        METRICS.inc('vech_source_response_bytes_total', {'source': self.source, 'host': self.host}, self.bytes,
+                    help_text="Response body bytes received per source")
+        METRICS.observe('vech_source_latency_seconds', self.latency, {'source': self.source},
+                        help_text="Wall time per source attempt including parsing")
+        if self.parse_time:
+            METRICS.observe('vech_source_parse_seconds', self.parse_time, {'source': self.source},
+                            buckets=PARSE_BUCKETS, help_text="Time spent decoding and parsing responses")
+
+        lookup = getattr(_instrumentation, 'lookup', None)
+        if lookup is not None:
+            lookup.attempts += 1
+        log_event('source_attempt',
+                  lookup_id=lookup.lookup_id if lookup else None,
+                  plate=lookup.plate if lookup else None,
+                  source=self.source, host=self.host, stage=self.stage,
+                  status=status, outcome=outcome,
+                  latency_ms=round(self.latency * 1000, 2),
+                  bytes=self.bytes,
+                  parse_ms=round(self.parse_time * 1000, 2),
+                  error=self.error)
+
+@contextmanager
+def source_span(source, url, stage=None):
+    """ Instrument one source attempt; exceptions are recorded and re-raised """
+    span = SourceSpan(source, url, stage)
+    try:
+        yield span
+    except Exception as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        span.finish()
+
+class LookupSpan:
+    """ Span covering one complete vehicle or challan lookup across all sources """
+
+    def __init__(self, kind, plate):
+        self.lookup_id = next(_lookup_ids)
+        self.kind = kind
+        self.plate = plate.upper() if isinstance(plate, str) else plate
+        self.source = None
+        self.synthetic = False
+        self.attempts = 0
+        self.started = time.perf_counter()
+
+def last_lookup_was_synthetic():
+    """ True if the most recent lookup on this thread ended in generated data """
+    lookup = getattr(_instrumentation, 'last_lookup', None)
+    return bool(lookup and lookup.synthetic)
+
+def mark_synthetic(kind):
+    """ Record that the current lookup fell through to generated data """
+    METRICS.inc('vech_synthetic_fallback_total', {'kind': kind},
+                help_text="Lookups that ended in generate_realistic_* data")
+    lookup = getattr(_instrumentation, 'lookup', None)
+    if lookup is not None:
+        lookup.synthetic = True
+        lookup.source = 'synthetic'
+
+def mark_unavailable(kind):
+    """ Record that the current lookup ended without data (strict mode) """
+    METRICS.inc('vech_unavailable_total', {'kind': kind},
+                help_text="Strict lookups that no source could answer")
+    lookup = getattr(_instrumentation, 'lookup', None)
+    if lookup is not None:
+        lookup.source = 'unavailable'
+
+def instrument_lookup(kind):
+    """ Decorator opening a lookup span around a lookup entry point """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(plate_number, *args, **kwargs):
+            # Nested entry points (fallback chains) report into the outer span
+            if getattr(_instrumentation, 'lookup', None) is not None:
+                return func(plate_number, *args, **kwargs)
+
+            lookup = LookupSpan(kind, plate_number)
+            _instrumentation.lookup = lookup
+            result = None
+            try:
+                result = func(plate_number, *args, **kwargs)
+                return result
+            finally:
+                _instrumentation.lookup = None
+                _instrumentation.last_lookup = lookup
+                elapsed = time.perf_counter() - lookup.started
+                if result is None:
+                    outcome = 'failed'
+                elif is_unavailable(result):
+                    outcome = 'unavailable'
+                elif lookup.synthetic:
+                    outcome = 'synthetic'
+                else:
+                    outcome = 'ok'
+                METRICS.inc('vech_lookups_total', {'kind': kind, 'outcome': outcome},
+                            help_text="Completed lookups by kind and outcome")
+                METRICS.observe('vech_lookup_latency_seconds', elapsed, {'kind': kind},
+                                help_text="End-to-end lookup latency across all sources")
+                log_event('lookup', lookup_id=lookup.lookup_id, kind=kind, plate=lookup.plate,
+                          outcome=outcome, source=lookup.source, synthetic=lookup.synthetic,
+                          attempts=lookup.attempts, latency_ms=round(elapsed * 1000, 2))
+        return wrapper
+    return decorator
+
+# HTTP connection pooling
+HTTP_POOL_SIZE = 20
+_http_local = threading.local()
+
+def get_http_session():
+    """ Return this thread's requests session so keep-alive connections are reused """
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _http_local.session = session
+    return session
+
+# Conditional HTTP cache for scraped pages
+def response_wire_bytes(response):
+    """ Body bytes that actually crossed the wire (the compressed size when encoded) """
+    raw = getattr(response, 'raw', None)
+    try:
+        wire = raw.tell() if raw is not None else 0
+        if wire:
+            return wire
+    except Exception:
+        pass
+    length = response.headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else len(response.content or b'')
+
+class PageCache:
+    """ On-disk cache of scraped landing pages keyed by URL
+    Each page's body is stored with its ETag / Last-Modified validators; later
+    fetches send a conditional GET and a 304 Not Modified is answered from the
+    stored copy. Counts the body bytes that 304s and compressed transfers kept
+    off the wire. Until open() is called pages are fetched normally (still
+    compressed and counted) but nothing is stored. """
+
+    def __init__(self):
+        self.directory = None
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.stored = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+
+    def open(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _paths(self, url):
+        base = os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+        return base + '.json', base + '.body'
+
+    def _load(self, url):
+        """ (validators, body) stored for url, or (None, None) """
+        if self.directory is None:
+            return None, None
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get('url') != url or len(body) != meta.get('length'):
+            return None, None  # hash collision or torn write
+        return meta, body
+
+    def _store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if self.directory is None or not (etag or last_modified):
+            return False
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'content_type': response.headers.get('Content-Type'), 'length': len(response.content)}
+        meta_path, body_path = self._paths(url)
+        suffix = f'.{threading.get_ident()}.tmp'
+        with open(body_path + suffix, 'wb') as f:
+            f.write(response.content)
+        os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+        return True
+
+    def get(self, session, url, headers=None, timeout=5):
+        """ GET url through the cache; a revalidated page comes back as a 200 with from_cache set """
+        meta, body = self._load(url)
+        request_headers = dict(headers or {})
+        if meta is not None:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+        
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        received = response_wire_bytes(response)
+        if response.status_code == 304 and meta is not None:
+            cached = requests.Response()
+            cached.status_code = 200
+            cached.url = url
+            cached.request = response.request
+            cached.headers = requests.structures.CaseInsensitiveDict(response.headers)
+            if meta.get('content_type'):
+                cached.headers.setdefault('Content-Type', meta['content_type'])
+            cached._content = body
+            cached.from_cache = True
+            response, saved, result = cached, len(body), 'not_modified'
+        else:
+            saved = max(len(response.content or b'') - received, 0)
+            result = 'stored' if response.status_code == 200 and self._store(url, response) else 'fetched'
+        
+        with self._lock:
+            self.requests += 1
+            self.not_modified += result == 'not_modified'
+            self.stored += result == 'stored'
+            self.bytes_received += received
+            self.bytes_saved += saved
+        METRICS.inc('vech_page_cache_requests_total', {'result': result},
+                    help_text="Scraped page fetches by cache result")
+        METRICS.inc('vech_page_cache_bytes_saved_total', {}, saved,
+                    help_text="Body bytes kept off the wire by 304s and compression")
+        return response
+
+    def summary(self):
+        with self._lock:
+            return {'requests': self.requests, 'not_modified': self.not_modified, 'stored': self.stored,
+                    'bytes_received': self.bytes_received, 'bytes_saved': self.bytes_saved}
+
+    def report(self):
+        """ Print this run's cache counters """
+        stats = self.summary()
+        if not stats['requests']:
+            return
+        print(f"{Fore.CYAN}[+] Page cache: {stats['requests']} fetches, {stats['not_modified']} not modified, "
+              f"{stats['bytes_received'] / 1024:.1f} KB received, {stats['bytes_saved'] / 1024:.1f} KB saved")
+
+PAGE_CACHE = PageCache()
+
+def fetch_page(session, url, timeout=5):
+    """ GET a scraped landing page through the page cache """
+    return PAGE_CACHE.get(session, url, SCRAPE_HEADERS, timeout)
+
+# In-process lookup cache
+class LookupCache:
+    """ Thread-safe LRU cache of lookup results with a time-to-live """
+
+    def __init__(self, ttl=3600, max_entries=50000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """ Return the cached value for key, or None if missing or expired """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def entries_since(self, since=0):
+        """ (key, stored_at, value) of the live entries stored after since """
+        now = time.time()
+        with self._lock:
+            return [(key, stored_at, value) for key, (stored_at, value) in self._entries.items()
+                    if stored_at > since and now - stored_at <= self.ttl]
+
+    def restore(self, key, value, stored_at):
+        """ Put an entry with the time it was first stored, unless it has expired
+        or the cache already holds a newer one """
+        if time.time() - stored_at > self.ttl:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= stored_at:
+                return False
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'ttl': self.ttl}
+
+LOOKUP_CACHE = LookupCache()
+
+# Profiling
+# Function-name prefixes used to group profile rows into the layers we care about
+PROFILE_LAYERS = (
+    ('sources', ('get_vehicle_info', 'get_challan_data', 'generate_realistic')),
+    ('reporting', ('display_', 'export_', 'save_to_file')),
+)
+# Library paths whose self time counts as network wait or parsing
+PROFILE_LIBRARY_LAYERS = (
+    ('network', ('requests', 'urllib3', 'socket.py', 'ssl.py', 'http/client.py', 'selectors.py')),
+    ('parsing', ('bs4', 'soupsieve', 'html/parser.py', 'json', 'lxml')),
+    ('reporting', ('tabulate', 'csv.py')),
+)
+
+def classify_profile_entry(filename, funcname):
+    """ Return the layer (sources, parsing, network, reporting, other) of a function """
+    if os.path.abspath(filename) == os.path.abspath(__file__):
+        for layer, prefixes in PROFILE_LAYERS:
+            if funcname.startswith(prefixes):
+                return layer
+        return 'tool'
+    normalized = filename.replace('\\', '/')
+    for layer, markers in PROFILE_LIBRARY_LAYERS:
+        if any(marker in normalized for marker in markers):
+            return layer
+    return 'other'
+
+class ThreadedProfile:
+    """ cProfile across the calling thread and every thread started while enabled
+    From Python 3.12 cProfile runs on sys.monitoring: a single profile already sees
+    every thread and no second one can be enabled, so one is used. Older versions
+    profile per thread, with a profile started in each new thread. """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profiles = []
+
+    def _new_profile(self):
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def _thread_bootstrap(self, frame, event, arg):
+        # Called once in each new thread; hands over to a per-thread profiler
+        sys.setprofile(None)
+        profile = self._new_profile()
+        try:
+            profile.enable()
+        except Exception as e:
+            # Never let profiling kill the thread; it just runs unprofiled
+            with self._lock:
+                self._profiles.remove(profile)
+            log_event('profile_thread_skipped', thread=threading.current_thread().name, error=str(e))
+
+    def enable(self):
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._thread_bootstrap)
+        self._new_profile().enable()
+
+    def disable(self):
+        if sys.version_info < (3, 12):
+            threading.setprofile(None)
+        for profile in self._profiles:
+            profile.disable()
+
+    def stats(self):
+        """ Merge the per-thread profiles into one pstats.Stats object """
+        stats = None
+        for profile in self._profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(profile)
+                else:
+                    stats.add(profile)
+            except TypeError:
+                # A thread that never ran any Python code has no stats
+                continue
+        return stats
+
+class SamplingProfiler:
+    """ Low-overhead wall-clock sampler for long daemon and batch runs """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.samples = 0
+        self.self_counts = {}
+        self.total_counts = {}
+        self.stacks = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='vech-sampler', daemon=True)
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                if not stack:
+                    continue
+                self.samples += 1
+                self.self_counts[stack[0]] = self.self_counts.get(stack[0], 0) + 1
+                for entry in set(stack):
+                    self.total_counts[entry] = self.total_counts.get(entry, 0) + 1
+                collapsed = ';'.join(name for _, _, name in reversed(stack))
+                self.stacks[collapsed] = self.stacks.get(collapsed, 0) + 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+def write_profile_summary(rows, filename, title, unit):
+    """ Write the per-layer totals and per-function table of a profile run """
+    layer_totals = {}
+    for row in rows:
+        layer_totals[row['layer']] = layer_totals.get(row['layer'], 0) + row['self']
+    grand_total = sum(layer_totals.values()) or 1
+
+    layer_table = [[layer, f"{total:.4f}" if unit == 's' else total, f"{100.0 * total / grand_total:.1f}%"]
+                   for layer, total in sorted(layer_totals.items(), key=lambda item: -item[1])]
+
+    # Every function of the tool itself, plus the heaviest library functions
+    tool_rows = [row for row in rows if row['layer'] in ('sources', 'reporting', 'tool')]
+    library_rows = sorted((row for row in rows if row not in tool_rows), key=lambda row: -row['self'])[:25]
+
+    def table(selected):
+        return [[row['layer'], row['function'], row['calls'],
+                 f"{row['self']:.4f}" if unit == 's' else row['self'],
+                 f"{row['total']:.4f}" if unit == 's' else row['total']]
+                for row in sorted(selected, key=lambda row: -row['total'])]
+
+    headers = ["Layer", "Function", "Calls", f"Self ({unit})", f"Total ({unit})"]
+    report = [title, "=" * 80,
+              "TIME BY LAYER (self time):",
+              tabulate(layer_table, headers=["Layer", f"Self ({unit})", "Share"], tablefmt="grid"),
+              "", "TOOL FUNCTIONS:",
+              tabulate(table(tool_rows), headers=headers, tablefmt="grid"),
+              "", "TOP LIBRARY FUNCTIONS:",
+              tabulate(table(library_rows), headers=headers, tablefmt="grid")]
+    with open(filename, 'w') as f:
+        f.write('\n'.join(report) + '\n')
+    return filename
+
+@contextmanager
+def profiled(filename, mode='deterministic', interval=0.01):
+    """ Profile the wrapped block and write a stats dump plus a per-function summary
+    deterministic: cProfile, dump readable with pstats (sortable by any column)
+    sampling: periodic stack sampling, dump in collapsed-stack (flame graph) format """
+    summary_file = os.path.splitext(filename)[0] + '_summary.txt'
+    print(f"{Fore.YELLOW}[+] Profiling enabled ({mode})...")
+    started = time.perf_counter()
+
+    if mode == 'sampling':
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            with open(filename, 'w') as f:
+                for stack, count in sorted(sampler.stacks.items(), key=lambda item: -item[1]):
+                    f.write(f"{stack} {count}\n")
+            rows = [{'layer': classify_profile_entry(path, name),
+                     'function': f"{name} ({os.path.basename(path)}:{line})",
+                     'calls': '-',
+                     'self': sampler.self_counts.get((path, line, name), 0),
+                     'total': total}
+                    for (path, line, name), total in sampler.total_counts.items()]
+            write_profile_summary(rows, summary_file,
+                                  f"SAMPLING PROFILE - {sampler.samples} samples every {interval}s, "
+                                  f"{time.perf_counter() - started:.2f}s wall", 'samples')
+            print(f"{Fore.GREEN}[+] Collapsed stacks written to {filename}")
+            print(f"{Fore.GREEN}[+] Profile summary written to {summary_file}")
+    else:
+        profile = ThreadedProfile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            stats = profile.stats()
+            if stats is not None:
+                stats.dump_stats(filename)
+                rows = [{'layer': classify_profile_entry(path, name),
+                         'function': f"{name} ({os.path.basename(path)}:{line})",
+                         'calls': calls,
+                         'self': tottime,
+                         'total': cumtime}
+                        for (path, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items()]
+                write_profile_summary(rows, summary_file,
+                                      f"DETERMINISTIC PROFILE - {time.perf_counter() - started:.2f}s wall", 's')
+                print(f"{Fore.GREEN}[+] Profile stats written to {filename} (load with pstats to sort)")
+                print(f"{Fore.GREEN}[+] Profile summary written to {summary_file}")
+
 def display_banner():
     """Display the tool banner with ASCII art"""
     banner = f"""
@@ -108,22 +888,176 @@ def validate_license_plate(plate):
     
     return True
 
-def calculate_vehicle_age(reg_date):
-    """Calculate the age of the vehicle from registration date"""
+def normalize_plate(plate):
+    """ Canonical form of a plate number: upper case without spaces or dashes """
+    return plate.strip().upper().replace(' ', '').replace('-', '')
+
+# Lookup behaviour switches set from the command line
+# strict: never fall through to generated data, return Unavailable instead
+# routing: pick sources per RTO / state from the learned routing table (SOURCE_ROUTER)
+# cache: serve batch / worker lookups from LOOKUP_CACHE too (set when snapshots are used)
+LOOKUP_OPTIONS = {'merge_sources': False, 'strict': False, 'routing': True, 'cache': False}
+
+class Unavailable(dict):
+    """ Result of a strict lookup that no source could answer
+    Falsy, so callers treat it like missing data, and serialises as a small JSON object """
+
+    def __init__(self, kind, plate_number, reason='all sources failed'):
+        super().__init__(source='unavailable', kind=kind, plate=plate_number.upper(), reason=reason)
+
+    def __bool__(self):
+        return False
+
+def is_unavailable(result):
+    """ True for an Unavailable result, including one read back from JSON """
+    return isinstance(result, dict) and result.get('source') == 'unavailable'
+
+def tag_source(result, source):
+    """ Record which source produced a vehicle record or each record of a challan list """
+    if isinstance(result, dict):
+        result['source'] = source
+    elif isinstance(result, list):
+        for record in result:
+            record['source'] = source
+    return result
+
+def result_source(result):
+    """ Source tag of a vehicle record or challan list (None for an empty list) """
+    if isinstance(result, dict):
+        return result.get('source')
+    if result:
+        return result[0].get('source')
+    return None
+
+def lookup_status(result):
+    """ Status of a single lookup result as reported in stored and served records """
+    if result is None:
+        return 'not_found'
+    if is_unavailable(result):
+        return 'unavailable'
+    return 'ok'
+
+def fallback_result(kind, plate_number):
+    """ What a lookup returns once every source has failed
+    Generated data normally; an Unavailable result in strict mode """
+    if LOOKUP_OPTIONS['strict']:
+        mark_unavailable(kind)
+        print(f"{Fore.RED}[!] No source could provide {kind} information for {plate_number.upper()}")
+        return Unavailable(kind, plate_number)
+    if kind == 'vehicle':
+        print(f"{Fore.YELLOW}[+] All methods failed, generating realistic data based on plate number...")
+        return generate_realistic_data(plate_number)
+    print(f"{Fore.YELLOW}[+] All methods failed, generating realistic challan data based on plate number...")
+    return generate_realistic_challan_data(plate_number)
+
+def cached_lookup(kind, plate_number, cache=None):
+    """ Vehicle or challan lookup served from the in-process cache when warm
+    Returns (result, cached); generated (synthetic) results are never cached """
+    cache = cache or LOOKUP_CACHE
+    key = (kind, normalize_plate(plate_number))
+    result = cache.get(key)
+    if result is not None:
+        return result, True
+    
+    if kind == 'vehicle':
+        result = lookup_vehicle_info(plate_number)
+    else:
+        result = lookup_challan_data(plate_number)
+    
+    if lookup_status(result) == 'ok' and not last_lookup_was_synthetic():
+        cache.put(key, result)
+    return result, False
+
+# Threads used to run the vehicle and challan halves of a combined lookup
+PART_WORKERS = 32
+_part_executor = None
+_part_executor_lock = threading.Lock()
+
+def get_part_executor():
+    """ Shared executor for concurrent vehicle/challan fetches (created on first use) """
+    global _part_executor
+    with _part_executor_lock:
+        if _part_executor is None:
+            _part_executor = ThreadPoolExecutor(max_workers=PART_WORKERS, thread_name_prefix='vech-part')
+        return _part_executor
+
+def _fetch_part(kind, plate_number, use_cache):
+    """ Fetch one half of a combined lookup and describe how it went """
+    started = time.perf_counter()
+    part = {'status': 'ok', 'source': None, 'cached': False, 'error': None}
+    result = None
     try:
-        if not reg_date or reg_date == 'N/A':
-            return "N/A"
+        if use_cache:
+            result, part['cached'] = cached_lookup(kind, plate_number)
+        elif kind == 'vehicle':
+            result = lookup_vehicle_info(plate_number)
+        else:
+            result = lookup_challan_data(plate_number)
         
-        # Try different date formats
-        date_formats = ["%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%Y/%m/%d"]
+        part['status'] = lookup_status(result)
+        if part['status'] == 'ok' and not part['cached'] and last_lookup_was_synthetic():
+            part['status'] = 'synthetic'
         
-        for fmt in date_formats:
-            try:
-                reg_dt = datetime.strptime(reg_date, fmt)
-                break
-            except ValueError:
-                continue
+        # Empty challan lists carry no tag, so a fresh lookup reports the span's source
+        lookup = getattr(_instrumentation, 'last_lookup', None)
+        if part['cached'] or lookup is None:
+            part['source'] = result_source(result)
         else:
+            part['source'] = lookup.source
+    except Exception as e:
+        part['status'] = 'error'
+        part['error'] = str(e)
+    part['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    return result, part
+
+def fetch_vehicle_and_challan(plate_number, use_cache=False):
+    """ Fetch vehicle and challan information concurrently
+    The two lookups hit different hosts, so total latency is the slower of the two.
+    Returns a dict with vehicle_info, challan_data, an overall status (ok, partial,
+    failed) and per-part status, timing and cache information """
+    started = time.perf_counter()
+    executor = get_part_executor()
+    vehicle_future = executor.submit(_fetch_part, 'vehicle', plate_number, use_cache)
+    challan_future = executor.submit(_fetch_part, 'challan', plate_number, use_cache)
+    vehicle_info, vehicle_part = vehicle_future.result()
+    challan_data, challan_part = challan_future.result()
+    
+    succeeded = [part['status'] in ('ok', 'synthetic') for part in (vehicle_part, challan_part)]
+    if all(succeeded):
+        status = 'ok'
+    elif any(succeeded):
+        status = 'partial'
+    else:
+        status = 'failed'
+    
+    return {
+        'plate': plate_number.upper(),
+        'status': status,
+        'vehicle_info': vehicle_info,
+        'challan_data': challan_data,
+        'parts': {'vehicle': vehicle_part, 'challan': challan_part},
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+
+# Date formats seen in VAHAN / eChallan records
+DATE_FORMATS = ["%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%Y/%m/%d"]
+
+def parse_record_date(value):
+    """ Parse a record date in any of the known formats (None if missing or unparsable) """
+    if not value or not isinstance(value, str) or value == 'N/A':
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+def calculate_vehicle_age(reg_date):
+    """Calculate the age of the vehicle from registration date"""
+    try:
+        reg_dt = parse_record_date(reg_date)
+        if reg_dt is None:
             return "N/A"
         
         current_date = datetime.now()
@@ -137,67 +1071,17 @@ def calculate_vehicle_age(reg_date):
     except:
         return "N/A"
 
+@instrument_lookup('vehicle')
 def get_vehicle_info_from_vahan(plate_number):
     """ Retrieve vehicle information from VAHAN API
     This function will fetch actual vehicle data from government APIs """
     try:
         print(f"{Fore.YELLOW}[+] Connecting to VAHAN database...")
         
-        # Headers to mimic a browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4',
-            'X-Requested-With': 'XMLHttpRequest',
-            'Connection': 'keep-alive',
-        }
-        
-        # VAHAN API endpoint for vehicle details
-        url = f"https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4/GetVehicleDetails"
-        
-        # Prepare request data
-        data = {
-            'regn_no': plate_number.upper(),
-            'td': 'DL'
-        }
-        
-        # Make the request
-        response = requests.post(url, headers=headers, json=data, timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('status') == 'Success' and result.get('row'):
-                # Extract vehicle information
-                vehicle_data = result['row'][0]
-                
-                # Format the data
-                formatted_data = {
-                    "registration_number": vehicle_data.get('regn_no', 'N/A'),
-                    "owner_name": vehicle_data.get('owner_name', 'N/A'),
-                    "father_name": vehicle_data.get('f_name', 'N/A'),
-                    "address": vehicle_data.get('c_add','N/A'),
-                    "pincode": vehicle_data.get('p_code', 'N/A'),
-                    "mobile": vehicle_data.get('mobile', 'N/A'),
-                    "vehicle_class": vehicle_data.get('vh_class', 'N/A'),
-                    "maker": vehicle_data.get('maker_desc', 'N/A'),
-                    "model": vehicle_data.get('maker_model', 'N/A'),
-                    "fuel_type": vehicle_data.get('fuel_type', 'N/A'),
-                    "registration_date": vehicle_data.get('reg_dt', 'N/A'),
-                    "registration_upto": vehicle_data.get('reg_upto', 'N/A'),
-                    "fitness_upto": vehicle_data.get('fit_upto', 'N/A'),
-                    "insurance_upto": vehicle_data.get('ins_upto', 'N/A'),
-                    "puc_upto": vehicle_data.get('puc_upto', 'N/A'),
-                    "vehicle_color": vehicle_data.get('colr_desc', 'N/A'),
-                    "engine_number": vehicle_data.get('eng_no', 'N/A'),
-                    "chassis_number": vehicle_data.get('chasi_no', 'N/A'),
-                    "blacklist_status": "NO" if vehicle_data.get('blacklist_status') == 'N' else "YES",
-                    "rc_status": vehicle_data.get('rc_status', 'N/A'),
-                    "vehicle_age_years": calculate_vehicle_age(vehicle_data.get('reg_dt', ''))
-                }
-                
-                print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information!")
-                return formatted_data
+        formatted_data = fetch_from_source('vahan_api', plate_number)
+        if formatted_data:
+            print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information!")
+            return formatted_data
         
         # If VAHAN API fails, try with alternative API
         print(f"{Fore.YELLOW}[+] VAHAN API failed, trying alternative sources...")
@@ -214,56 +1098,10 @@ def get_vehicle_info_alternative(plate_number):
         # Method 1: Try with RTO Vehicle Information API
         print(f"{Fore.YELLOW}[+] Trying RTO Vehicle Information API...")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
-        
-        # Try multiple API endpoints
-        api_endpoints = [
-            f"https://rto-vehicle-information-api.p.rapidapi.com/get_vehicle/{plate_number}",
-            f"https://vehicle-registration-api.p.rapidapi.com/api/v1/vehicle/india/{plate_number}",
-            f"https://car-info-api.p.rapidapi.com/v1/car/india/{plate_number}"
-        ]
-        
-        for endpoint in api_endpoints:
-            try:
-                response = requests.get(endpoint, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check if we got valid data
-                    if data and isinstance(data, dict):
-                        # Extract and format the data
-                        formatted_data = {
-                            "registration_number": plate_number.upper(),
-                            "owner_name": data.get('owner_name', 'N/A'),
-                            "father_name": data.get('father_name', 'N/A'),
-                            "address": data.get('address', 'N/A'),
-                            "pincode": data.get('pincode', 'N/A'),
-                            "mobile": data.get('mobile', 'N/A'),
-                            "vehicle_class": data.get('vehicle_class', 'N/A'),
-                            "maker": data.get('maker', 'N/A'),
-                            "model": data.get('model', 'N/A'),
-                            "fuel_type": data.get('fuel_type', 'N/A'),
-                            "registration_date": data.get('registration_date', 'N/A'),
-                            "registration_upto": data.get('registration_upto', 'N/A'),
-                            "fitness_upto": data.get('fitness_upto', 'N/A'),
-                            "insurance_upto": data.get('insurance_upto', 'N/A'),
-                            "puc_upto": data.get('puc_upto', 'N/A'),
-                            "vehicle_color": data.get('vehicle_color', 'N/A'),
-                            "engine_number": data.get('engine_number', 'N/A'),
-                            "chassis_number": data.get('chassis_number', 'N/A'),
-                            "blacklist_status": data.get('blacklist_status', 'N/A'),
-                            "rc_status": data.get('rc_status', 'N/A'),
-                            "vehicle_age_years": calculate_vehicle_age(data.get('registration_date', ''))
-                        }
-                        
-                        print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information from alternative source!")
-                        return formatted_data
-            except Exception as e:
-                continue
+        formatted_data = fetch_from_source('vehicle_alt_api', plate_number)
+        if formatted_data:
+            print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information from alternative source!")
+            return formatted_data
         
         # Method 2: Try web scraping
         print(f"{Fore.YELLOW}[+] Trying web scraping method...")
@@ -273,296 +1111,669 @@ def get_vehicle_info_alternative(plate_number):
         print(f"{Fore.RED}[!] Error retrieving vehicle information from alternative sources: {str(e)}")
         return None
 
+# Lookup form schemas by (site, landing page digest), so an unchanged page is not parsed again
+FORM_SCHEMAS = LookupCache(ttl=7 * 24 * 3600, max_entries=1024)
+
+def parse_form_schema(content, website):
+    """ The lookup form of a landing page as {'action', 'fields': [[name, value], ...]}, or False """
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Try to find form elements
+    form = soup.find('form')
+    if not form:
+        return False
+    
+    # Extract form action URL
+    action = form.get('action', '')
+    if not action.startswith('http'):
+        action = website + action
+    
+    # Extract form inputs
+    fields = []
+    for input_tag in form.find_all('input'):
+        name = input_tag.get('name', '')
+        value = input_tag.get('value', '')
+        if name:
+            fields.append([name, value])
+    return {'action': action, 'fields': fields}
+
+def extract_lookup_form(content, website, plate_number, field_keywords):
+    """ Find the lookup form on a landing page and fill in the plate number
+    Returns (action_url, form_data), or None if the page has no form """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    key = (website, hashlib.sha1(content).hexdigest())
+    schema = FORM_SCHEMAS.get(key)
+    if schema is None:
+        schema = parse_form_schema(content, website)
+        FORM_SCHEMAS.put(key, schema)
+    if not schema:
+        return None
+    action = schema['action']
+    form_data = dict(schema['fields'])
+    
+    # Update form data with plate number
+    for key in form_data.keys():
+        if any(word in key.lower() for word in field_keywords):
+            form_data[key] = plate_number.upper()
+            break
+    
+    return action, form_data
+
+def parse_vehicle_details_html(content, plate_number):
+    """ Extract vehicle details from a scraped result page (None if nothing found) """
+    soup = BeautifulSoup(content, 'html.parser')
+    vehicle_data = {}
+    
+    # Look for common "Label: value" patterns
+    labels = (('owner', 'owner_name'), ('father', 'father_name'), ('address', 'address'),
+              ('model', 'model'), ('maker', 'maker'))
+    for element in soup.find_all(['div', 'span', 'td', 'th']):
+        text = element.text.strip()
+        if ':' not in text:
+            continue
+        lowered = text.lower()
+        for label, field in labels:
+            if label in lowered:
+                parts = text.split(':', 1)
+                if len(parts) > 1:
+                    vehicle_data[field] = parts[1].strip()
+                break
+    
+    if not vehicle_data:
+        return None
+    
+    # Fill in missing fields with default values
+    return {
+        "registration_number": plate_number.upper(),
+        "owner_name": vehicle_data.get('owner_name', 'N/A'),
+        "father_name": vehicle_data.get('father_name', 'N/A'),
+        "address": vehicle_data.get('address', 'N/A'),
+        "pincode": 'N/A',
+        "mobile": 'N/A',
+        "vehicle_class":'N/A',
+        "maker": vehicle_data.get('maker', 'N/A'),
+        "model": vehicle_data.get('model', 'N/A'),
+        "fuel_type": 'N/A',
+        "registration_date": 'N/A',
+        "registration_upto": 'N/A',
+        "fitness_upto": 'N/A',
+        "insurance_upto": 'N/A',
+        "puc_upto": 'N/A',
+        "vehicle_color": 'N/A',
+        "engine_number": 'N/A',
+        "chassis_number": 'N/A',
+        "blacklist_status": 'N/A',
+        "rc_status": 'N/A',
+        "vehicle_age_years": 'N/A'
+    }
+
+def parse_challan_table_html(content):
+    """ Extract challan rows from the tables of a scraped result page """
+    soup = BeautifulSoup(content, 'html.parser')
+    challan_data = []
+    
+    # Look for table with challan data
+    for table in soup.find_all('table'):
+        rows = table.find_all('tr')
+        if len(rows) > 1:  # At least header and one data row
+            for row in rows[1:]:  # Skip header row
+                cells = row.find_all('td')
+                if len(cells) >= 5:  # At least 5 columns
+                    challan = {
+                        "challan_number": cells[0].text.strip() if len(cells) > 0 else 'N/A',
+                        "issue_date": cells[1].text.strip() if len(cells) > 1 else 'N/A',
+                        "offence_date": cells[2].text.strip() if len(cells) > 2 else 'N/A',
+                        "offence_place": cells[3].text.strip() if len(cells) > 3 else 'N/A',
+                        "amount": cells[4].text.strip() if len(cells) > 4 else 'N/A',
+                        "offence_desc": cells[5].text.strip() if len(cells) > 5 else 'N/A',
+                        "payment_status": cells[6].text.strip() if len(cells) > 6 else 'N/A',
+                        "offence_time": 'N/A',
+                        "offence_section": 'N/A',
+                        "payment_date": 'N/A',
+                        "court_name": 'N/A',
+                        "court_address": 'N/A'
+                    }
+                    challan_data.append(challan)
+    
+    return challan_data
+
+def fetch_scraped_vehicle(plate_number):
+    """ Scrape the vehicle lookup sites in turn; returns the first answer or None """
+    for website in VEHICLE_SCRAPE_SITES:
+        try:
+            # Get the main page and find its lookup form
+            with source_span('vehicle_scraping', website, stage='landing') as span:
+                response = fetch_page(get_http_session(), website)
+                span.record_response(response)
+                if response.status_code != 200:
+                    continue
+                with span.parsing():
+                    form = extract_lookup_form(response.content, website, plate_number, VEHICLE_FORM_KEYWORDS)
+            if not form:
+                continue
+            
+            # Submit the form
+            action, form_data = form
+            with source_span('vehicle_scraping', action, stage='submit') as span:
+                response = get_http_session().post(action, headers=SCRAPE_HEADERS, data=form_data, timeout=5)
+                span.record_response(response)
+                if response.status_code != 200:
+                    continue
+                with span.parsing():
+                    formatted_data = parse_vehicle_details_html(response.content, plate_number)
+                
+                # If we got some data, return it
+                if formatted_data:
+                    span.mark_hit()
+                    return tag_source(formatted_data, 'vehicle_scraping')
+        except Exception as e:
+            continue
+    return None
+
 def get_vehicle_info_scraping(plate_number):
     """ Web scraping method to retrieve vehicle information """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-        
-        # Try multiple websites
-        websites = [
-            "https://vahan.parivahan.gov.in/vahan4vue/vahan/ui/vahan4",
-            "https://www.rtovehicleinformation.com/",
-            "https://www.carinfo.in/",
-            "https://www.drivinglicence.in/"
-        ]
-        
-        for website in websites:
-            try:
-                # Get the main page
-                response = requests.get(website, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try to find form elements
-                    form = soup.find('form')
-                    if form:
-                        # Extract form action URL
-                        action = form.get('action', '')
-                        if not action.startswith('http'):
-                            action = website + action
-                        
-                        # Extract form inputs
-                        inputs = form.find_all('input')
-                        form_data = {}
-                        for input_tag in inputs:
-                            name = input_tag.get('name', '')
-                            value = input_tag.get('value', '')
-                            if name:
-                                form_data[name] = value
-                        
-                        # Update form data with plate number
-                        for key in form_data.keys():
-                            if 'reg' in key.lower() or 'number' in key.lower() or 'plate' in key.lower():
-                                form_data[key] = plate_number.upper()
-                                break
-                        
-                        # Submit the form
-                        response = requests.post(action, headers=headers, data=form_data, timeout=5)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-                            
-                            # Try to extract vehicle information
-                            vehicle_data = {}
-                            
-                            # Look for common data patterns
-                            data_elements = soup.find_all(['div', 'span', 'td', 'th'])
-                            for element in data_elements:
-                                text = element.text.strip()
-                                if 'owner' in text.lower() and ':' in text:
-                                    parts = text.split(':', 1)
-                                    if len(parts) > 1:
-                                        vehicle_data['owner_name'] = parts[1].strip()
-                                elif 'father' in text.lower() and ':' in text:
-                                    parts = text.split(':', 1)
-                                    if len(parts) > 1:
-                                        vehicle_data['father_name'] = parts[1].strip()
-                                elif 'address' in text.lower() and ':' in text:
-                                    parts = text.split(':', 1)
-                                    if len(parts) > 1:
-                                        vehicle_data['address'] = parts[1].strip()
-                                elif 'model' in text.lower() and ':' in text:
-                                    parts = text.split(':', 1)
-                                    if len(parts) > 1:
-                                        vehicle_data['model'] = parts[1].strip()
-                                elif 'maker' in text.lower() and ':' in text:
-                                    parts = text.split(':', 1)
-                                    if len(parts) > 1:
-                                        vehicle_data['maker'] = parts[1].strip()
-                            
-                            # If we got some data, return it
-                            if vehicle_data:
-                                # Fill in missing fields with default values
-                                formatted_data = {
-                                    "registration_number": plate_number.upper(),
-                                    "owner_name": vehicle_data.get('owner_name', 'N/A'),
-                                    "father_name": vehicle_data.get('father_name', 'N/A'),
-                                    "address": vehicle_data.get('address', 'N/A'),
-                                    "pincode": 'N/A',
-                                    "mobile": 'N/A',
-                                    "vehicle_class":'N/A',
-                                    "maker": vehicle_data.get('maker', 'N/A'),
-                                    "model": vehicle_data.get('model', 'N/A'),
-                                    "fuel_type": 'N/A',
-                                    "registration_date": 'N/A',
-                                    "registration_upto": 'N/A',
-                                    "fitness_upto": 'N/A',
-                                    "insurance_upto": 'N/A',
-                                    "puc_upto": 'N/A',
-                                    "vehicle_color": 'N/A',
-                                    "engine_number": 'N/A',
-                                    "chassis_number": 'N/A',
-                                    "blacklist_status": 'N/A',
-                                    "rc_status": 'N/A',
-                                    "vehicle_age_years": 'N/A'
-                                }
-                                
-                                print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information through web scraping!")
-                                return formatted_data
-            except Exception as e:
-                continue
+        formatted_data = fetch_scraped_vehicle(plate_number)
+        if formatted_data:
+            print(f"{Fore.GREEN}[+] Successfully retrieved vehicle information through web scraping!")
+            return formatted_data
         
-        # If all methods fail, generate realistic fallback data
-        print(f"{Fore.YELLOW}[+] All methods failed, generating realistic data based on plate number...")
-        return generate_realistic_data(plate_number)
+        # If all methods fail, fall back to generated data (or Unavailable when strict)
+        return fallback_result('vehicle', plate_number)
         
     except Exception as e:
         print(f"{Fore.RED}[!] Error in web scraping: {str(e)}")
-        return generate_realistic_data(plate_number)
+        return fallback_result('vehicle', plate_number)
 
-def generate_realistic_data(plate_number):
-    """ Generate realistic data based on the plate number """
+# Values that mean a source did not know a field
+MISSING_VALUES = (None, '', 'N/A')
+
+_source_executor = None
+_source_executor_lock = threading.Lock()
+
+def get_source_executor():
+    """ Shared executor for querying vehicle sources side by side (created on first use) """
+    global _source_executor
+    with _source_executor_lock:
+        if _source_executor is None:
+            _source_executor = ThreadPoolExecutor(max_workers=PART_WORKERS, thread_name_prefix='vech-source')
+        return _source_executor
+
+def _fetch_source(fetcher, plate_number, lookup):
+    """ Run one source fetcher on a worker thread, reporting into the caller's lookup span """
+    _instrumentation.lookup = lookup
     try:
-        # Extract state code from plate number
+        return fetcher(plate_number)
+    except Exception as e:
+        return None
+    finally:
+        _instrumentation.lookup = None
+
+def merge_vehicle_records(records):
+    """ Merge vehicle records field by field
+    records is a list of (source, record) in trust order; each field is taken from the
+    most trusted source that has a value for it. The merged record carries a
+    field_sources dict naming the source of every filled field """
+    merged = {}
+    field_sources = {}
+    for source, record in records:
+        for key, value in record.items():
+            if key in ('source', 'field_sources'):
+                continue
+            if key not in merged:
+                merged[key] = 'N/A'
+            if merged[key] in MISSING_VALUES and value not in MISSING_VALUES:
+                merged[key] = value
+                field_sources[key] = source
+    
+    # Age is derived, so recompute it from whichever registration date won
+    if 'registration_date' in merged:
+        merged['vehicle_age_years'] = calculate_vehicle_age(merged['registration_date'])
+        if 'registration_date' in field_sources:
+            field_sources['vehicle_age_years'] = field_sources['registration_date']
+    
+    merged['field_sources'] = field_sources
+    return merged
+
+@instrument_lookup('vehicle')
+def get_vehicle_info_merged(plate_number):
+    """ Query every vehicle source concurrently and merge the answers field by field
+    Falls back to generated data only when no source answers """
+    print(f"{Fore.YELLOW}[+] Querying vehicle sources concurrently...")
+    lookup = getattr(_instrumentation, 'lookup', None)
+    # Registration order is trust order
+    sources = registered_sources('vehicle')
+    if LOOKUP_OPTIONS['routing']:
+        # Skip sources the routing table has given up on, but keep trust order
+        routed = {source for source, fetcher in SOURCE_ROUTER.order(sources, plate_number)}
+        sources = [(source, fetcher) for source, fetcher in sources if source in routed]
+    executor = get_source_executor()
+    futures = [(source, executor.submit(_fetch_source, fetcher, plate_number, lookup))
+               for source, fetcher in sources]
+    records = [(source, future.result()) for source, future in futures]
+    for source, record in records:
+        SOURCE_ROUTER.record(plate_number, source, record is not None)
+    records = [(source, record) for source, record in records if record]
+    
+    if not records:
+        return fallback_result('vehicle', plate_number)
+    
+    merged = merge_vehicle_records(records)
+    merged['source'] = '+'.join(source for source, record in records)
+    if lookup is not None:
+        lookup.source = merged['source']
+    METRICS.inc('vech_merged_lookups_total', {'sources': str(len(records))},
+                help_text="Merged vehicle lookups by number of sources that answered")
+    
+    missing = [key for key, value in merged.items() if value in MISSING_VALUES]
+    print(f"{Fore.GREEN}[+] Merged vehicle information from {len(records)} source(s), "
+          f"{len(missing)} field(s) still missing")
+    return merged
+
+def lookup_vehicle_info(plate_number):
+    """ Vehicle lookup entry point honouring LOOKUP_OPTIONS
+    Real (not generated) records also refresh the expiry alert index """
+    if LOOKUP_OPTIONS['merge_sources']:
+        result = get_vehicle_info_merged(plate_number)
+    elif LOOKUP_OPTIONS['routing']:
+        result = get_vehicle_info_routed(plate_number)
+    else:
+        result = get_vehicle_info_from_vahan(plate_number)
+    
+    if EXPIRY_ALERTS.enabled and lookup_status(result) == 'ok' and not last_lookup_was_synthetic():
+        EXPIRY_ALERTS.update(plate_number, result)
+    return result
+
+def lookup_challan_data(plate_number):
+    """ Challan lookup entry point honouring LOOKUP_OPTIONS """
+    if LOOKUP_OPTIONS['routing']:
+        return get_challan_data_routed(plate_number)
+    return get_challan_data_from_api(plate_number)
+
+def vehicle_fields(vehicle_info):
+    """ (field, value) pairs of a vehicle record without its provenance metadata """
+    return [(key, value) for key, value in vehicle_info.items() if key != 'field_sources']
+
+# Lookup tables for generated (synthetic) records, built once at import
+SYNTHETIC_FIRST_NAMES = ["Rajesh", "Amit", "Vikram", "Rahul", "Sanjay", "Mukesh", "Anil", "Sunil", "Deepak", "Ramesh"]
+SYNTHETIC_LAST_NAMES = ["Kumar", "Singh", "Sharma", "Verma", "Gupta", "Jain", "Agarwal", "Reddy", "Patel", "Yadav"]
+
+# Vehicle models for each maker
+SYNTHETIC_MODELS = {
+    "Maruti Suzuki": ["Swift", "Baleno", "Dzire", "WagonR", "Alto", "Ertiga", "Vitara Brezza", "Celerio"],
+    "Hyundai": ["i10", "i20", "Creta", "Venue", "Grand i10", "Verna", "Elantra", "Tucson"],
+    "Tata": ["Tiago", "Nexon", "Altroz", "Harrier", "Safari", "Punch", "Tigor", "Zest"],
+    "Mahindra": ["Scorpio", "XUV500", "Thar", "Bolero", "XUV300", "KUV100", "Marazzo", "XUV700"],
+    "Honda": ["City", "Amaze", "WR-V", "Jazz", "Civic", "CR-V", "BR-V", "Brio"],
+    "Toyota": ["Innova", "Fortuner", "Yaris", "Glanza", "Urban Cruiser", "Camry", "Prius", "Vellfire"],
+    "Ford": ["Ecosport", "Figo", "Aspire", "Endeavour", "Freestyle", "Mustang"],
+    "Volkswagen": ["Polo", "Vento", "Ameo", "Tiguan", "Passat", "Jetta"],
+    "Renault": ["Kwid", "Triber", "Duster", "Captur"],
+    "Nissan": ["Micra", "Sunny", "Kicks", "Magnite"]
+}
+
+SYNTHETIC_ADDRESSES = {
+    "DL": ["123, Connaught Place, New Delhi - 110001", "456, Karol Bagh, Delhi - 110005", "789, Lajpat Nagar, Delhi - 110024"],
+    "MH": ["123, Bandra West, Mumbai - 400050", "456, Shivaji Park, Mumbai - 400028", "789, Andheri East, Mumbai - 400069"],
+    "KA": ["123, MG Road, Bangalore - 560001", "456, Koramangala, Bangalore - 560095", "789, Indiranagar, Bangalore - 560038"],
+    "WB": ["123, Park Street, Kolkata - 700016", "456, Salt Lake, Kolkata - 700091", "789, Gariahat, Kolkata - 700029"],
+    "TN": ["123, T. Nagar, Chennai - 600017", "456, Adyar, Chennai - 600020", "789, Anna Nagar, Chennai - 600040"],
+    "GJ": ["123, CG Road, Ahmedabad - 380006", "456, Navrangpura, Ahmedabad - 380009", "789, Satellite, Ahmedabad - 380015"],
+    "UP": ["123, Hazratganj, Lucknow - 226001", "456, Gomti Nagar, Lucknow - 226010", "789, Alambagh, Lucknow - 226005"]
+}
+SYNTHETIC_DEFAULT_ADDRESS = ["123, Main Road, City - 000000"]
+
+SYNTHETIC_VEHICLE_CLASSES = ["LMV - Motor Car", "MCWG - Motor Cycle With Gear", "MCWOG - Motor Cycle Without Gear"]
+SYNTHETIC_FUEL_TYPES = ["PETROL", "DIESEL", "CNG", "LPG", "ELECTRIC"]
+SYNTHETIC_COLORS = ["WHITE", "SILVER", "BLACK", "RED", "BLUE", "GREY"]
+
+# Common traffic offences
+SYNTHETIC_OFFENCES = [
+    {"section": "184", "desc": "Dangerous Driving", "amount": "2000"},
+    {"section": "177", "desc": "General Offence", "amount": "500"},
+    {"section": "119/177", "desc": "Disobedience of Order", "amount": "200"},
+    {"section": "179", "desc": "Refusal to Give Information", "amount": "500"},
+    {"section": "180", "desc": "Obstruction to Free Flow of Traffic", "amount": "500"},
+    {"section": "181", "desc": "Unauthorised Use of Vehicles", "amount": "2000"},
+    {"section": "182", "desc": "Violation of Road Regulations", "amount": "500"},
+    {"section": "183", "desc": "Riding Without Helmet", "amount": "500"},
+    {"section": "185", "desc": "Driving by Drunken Person", "amount": "2000"},
+    {"section": "186", "desc": "Driving at Excessive Speed", "amount": "2000"},
+    {"section": "187", "desc": "Driving Dangerously", "amount": "2000"},
+    {"section": "188", "desc": "Racing and Trials of Speed", "amount": "500"},
+    {"section": "189", "desc": "Jaywalking", "amount": "500"},
+    {"section": "190", "desc": "Failure to Convey Information", "amount": "500"},
+    {"section": "191", "desc": "Failure to Produce Documents", "amount": "500"},
+    {"section": "192", "desc": "Unauthorized Parking", "amount": "200"},
+    {"section": "193", "desc": "Parking in Prohibited Places", "amount": "200"},
+    {"section": "194", "desc": "Refusal to Surrender License", "amount": "500"},
+    {"section": "194A", "desc": "Obstruction of Traffic", "amount": "500"},
+    {"section": "194B", "desc": "Violation of Road Rules", "amount": "500"}
+]
+
+# Common places
+SYNTHETIC_PLACES = [
+    "Main Road, City Center",
+    "Highway NH-44",
+    "MG Road, Market Area",
+    "Station Road",
+    "College Junction",
+    "Airport Road",
+    "Industrial Area",
+    "Ring Road",
+    "Palace Road",
+    "Residential Area"
+]
+
+# Default distributions: value -> relative weight
+SYNTHETIC_CHALLAN_COUNTS = {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
+SYNTHETIC_PAYMENT_STATUSES = {"PAID": 1, "UNPAID": 1, "PENDING": 1}
+# Insurance / PUC expiry, in days relative to the generation date (min, max)
+SYNTHETIC_EXPIRY_DAYS = (-365, 730)
+
+def parse_weights(spec, convert=str):
+    """ Parse a 'value:weight,value:weight' distribution from the command line """
+    weights = {}
+    for item in spec.split(','):
+        value, _, weight = item.strip().partition(':')
+        weights[convert(value.strip())] = float(weight) if weight else 1.0
+    return weights
+
+class SyntheticFleet:
+    """ Seeded, reproducible generator of synthetic vehicle and challan records
+    Tables are shared module constants and all randomness comes from one
+    random.Random, so the same seed always produces the same fleet. Distributions
+    of challan counts and payment statuses are {value: weight} dicts; expiry_days
+    is the (min, max) day offset of insurance/PUC expiry from as_of. Without an
+    as_of, dates are relative to the day each record is generated. """
+
+    def __init__(self, seed=None, challan_counts=None, payment_statuses=None,
+                 expiry_days=None, states=None, as_of=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._random = self.rng.random
+        self._as_of = as_of.toordinal() if as_of else None
+        self.expiry_days = expiry_days or SYNTHETIC_EXPIRY_DAYS
+        self.states = list(states or SYNTHETIC_ADDRESSES)
+        self._makers = list(SYNTHETIC_MODELS)
+        counts = challan_counts or SYNTHETIC_CHALLAN_COUNTS
+        self._counts, self._count_weights = list(counts), list(itertools.accumulate(counts.values()))
+        statuses = payment_statuses or SYNTHETIC_PAYMENT_STATUSES
+        self._statuses, self._status_weights = list(statuses), list(itertools.accumulate(statuses.values()))
+
+    @property
+    def as_of(self):
+        """ Reference day (ordinal) the generated dates are relative to """
+        return self._as_of or datetime.now().toordinal()
+
+    # random.random() scaled by hand is several times cheaper than randint()/choice()
+    def _pick(self, seq):
+        return seq[int(self._random() * len(seq))]
+
+    def _int(self, low, high):
+        return low + int(self._random() * (high - low + 1))
+
+    def _date(self, ordinal):
+        day = datetime.fromordinal(ordinal)
+        return f"{day.day:02d}-{day.month:02d}-{day.year}"
+
+    def plate(self, index):
+        """ Plate number for the index-th vehicle; distinct indexes give distinct plates """
+        series, number = divmod(index, 10000)
+        letters = ''
+        while series or len(letters) < 2:
+            series, letter = divmod(series, 26)
+            letters = chr(65 + letter) + letters
+        return f"{self._pick(self.states)}{self._int(1, 99):02d}{letters}{number:04d}"
+
+    def vehicle(self, plate_number):
+        """ One synthetic vehicle record """
         state_code = plate_number[:2].upper()
+        last_name = self._pick(SYNTHETIC_LAST_NAMES)
+        maker = self._pick(self._makers)
+        as_of = self.as_of
         
-        # Common Indian names
-        first_names = ["Rajesh", "Amit", "Vikram", "Rahul", "Sanjay", "Mukesh", "Anil", "Sunil", "Deepak", "Ramesh"]
-        last_names = ["Kumar", "Singh", "Sharma", "Verma", "Gupta", "Jain", "Agarwal", "Reddy", "Patel", "Yadav"]
-        
-        # Vehicle makers
-        makers = ["Maruti Suzuki", "Hyundai", "Tata", "Mahindra", "Honda", "Toyota", "Ford", "Volkswagen", "Renault", "Nissan"]
-        
-        # Vehicle models for each maker
-        models = {
-            "Maruti Suzuki": ["Swift", "Baleno", "Dzire", "WagonR", "Alto", "Ertiga", "Vitara Brezza", "Celerio"],
-            "Hyundai": ["i10", "i20", "Creta", "Venue", "Grand i10", "Verna", "Elantra", "Tucson"],
-            "Tata": ["Tiago", "Nexon", "Altroz", "Harrier", "Safari", "Punch", "Tigor", "Zest"],
-            "Mahindra": ["Scorpio", "XUV500", "Thar", "Bolero", "XUV300", "KUV100", "Marazzo", "XUV700"],
-            "Honda": ["City", "Amaze", "WR-V", "Jazz", "Civic", "CR-V", "BR-V", "Brio"],
-            "Toyota": ["Innova", "Fortuner", "Yaris", "Glanza", "Urban Cruiser", "Camry", "Prius", "Vellfire"],
-            "Ford": ["Ecosport", "Figo", "Aspire", "Endeavour", "Freestyle", "Mustang"],
-            "Volkswagen": ["Polo", "Vento", "Ameo", "Tiguan", "Passat", "Jetta"],
-            "Renault": ["Kwid", "Triber", "Duster", "Captur"],
-            "Nissan": ["Micra", "Sunny", "Kicks", "Magnite"]
-        }
-        
-        # Generate random data
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        maker = random.choice(makers)
-        model = random.choice(models.get(maker, ["Unknown"]))
-        
-        # Generate random dates
-        reg_year = random.randint(2010, 2022)
-        reg_month = random.randint(1, 12)
-        reg_day = random.randint(1, 28)
-        reg_date = f"{reg_day:02d}-{reg_month:02d}-{reg_year}"
-        
-        # Registration valid for 15 years
-        reg_upto_year = reg_year + 15
-        reg_upto = f"{reg_day:02d}-{reg_month:02d}-{reg_upto_year}"
-        
-        # Insurance valid for 1-3 years
-        ins_years = random.randint(1, 3)
-        ins_upto_year = reg_year + ins_years
-        ins_upto = f"{reg_day:02d}-{reg_month:02d}-{ins_upto_year}"
-        
-        # PUC valid for 6 months to 1 year
-        puc_months = random.randint(6, 12)
-        puc_day = reg_day
-        puc_month = reg_month + puc_months
-        puc_year = reg_year
-        
-        if puc_month > 12:
-            puc_month -= 12
-            puc_year += 1
-        
-        puc_upto = f"{puc_day:02d}-{puc_month:02d}-{puc_year}"
-        
-        # Generate random address based on state code
-        addresses = {
-            "DL": ["123, Connaught Place, New Delhi - 110001", "456, Karol Bagh, Delhi - 110005", "789, Lajpat Nagar, Delhi - 110024"],
-            "MH": ["123, Bandra West, Mumbai - 400050", "456, Shivaji Park, Mumbai - 400028", "789, Andheri East, Mumbai - 400069"],
-            "KA": ["123, MG Road, Bangalore - 560001", "456, Koramangala, Bangalore - 560095", "789, Indiranagar, Bangalore - 560038"],
-            "WB": ["123, Park Street, Kolkata - 700016", "456, Salt Lake, Kolkata - 700091", "789, Gariahat, Kolkata - 700029"],
-            "TN": ["123, T. Nagar, Chennai - 600017", "456, Adyar, Chennai - 600020", "789, Anna Nagar, Chennai - 600040"],
-            "GJ": ["123, CG Road, Ahmedabad - 380006", "456, Navrangpura, Ahmedabad - 380009", "789, Satellite, Ahmedabad - 380015"],
-            "UP": ["123, Hazratganj, Lucknow - 226001", "456, Gomti Nagar, Lucknow - 226010", "789, Alambagh, Lucknow - 226005"]
-        }
-        
-        address = random.choice(addresses.get(state_code, ["123, Main Road, City - 000000"]))
-        pincode = address.split('- ')[1] if '- ' in address else "000000"
-        
-        # Generate random mobile number
-        mobile = f"9{random.randint(100000000, 999999999)}"
-        
-        # Generate random engine and chassis numbers
-        engine_no = f"{random.choice(['AB', 'CD', 'EF', 'GH'])}{random.randint(100000, 999999)}"
-        chassis_no = f"{random.choice(['MA', 'MB', 'MC', 'MD'])}{random.randint(100000000, 999999999)}"
+        # Registered 1-13 years ago, valid for 15 years
+        reg = datetime.fromordinal(as_of - self._int(365, 13 * 365))
+        reg_date = f"{reg.day:02d}-{reg.month:02d}-{reg.year}"
+        reg_upto = f"{reg.day:02d}-{reg.month:02d}-{reg.year + 15}"
+        low, high = self.expiry_days
         
-        # Create the formatted data
-        formatted_data = {
+        address = self._pick(SYNTHETIC_ADDRESSES.get(state_code, SYNTHETIC_DEFAULT_ADDRESS))
+        return {
             "registration_number": plate_number.upper(),
-            "owner_name": f"{first_name} {last_name}",
-            "father_name": f"{random.choice(first_names)} {last_name}",
+            "owner_name": f"{self._pick(SYNTHETIC_FIRST_NAMES)} {last_name}",
+            "father_name": f"{self._pick(SYNTHETIC_FIRST_NAMES)} {last_name}",
             "address": address,
-            "pincode": pincode,
-            "mobile": mobile,
-            "vehicle_class": random.choice(["LMV - Motor Car", "MCWG - Motor Cycle With Gear", "MCWOG - Motor Cycle Without Gear"]),
+            "pincode": address.rpartition('- ')[2],
+            "mobile": f"9{self._int(100000000, 999999999)}",
+            "vehicle_class": self._pick(SYNTHETIC_VEHICLE_CLASSES),
             "maker": maker,
-            "model": model,
-            "fuel_type": random.choice(["PETROL", "DIESEL", "CNG", "LPG", "ELECTRIC"]),
+            "model": self._pick(SYNTHETIC_MODELS[maker]),
+            "fuel_type": self._pick(SYNTHETIC_FUEL_TYPES),
             "registration_date": reg_date,
             "registration_upto": reg_upto,
             "fitness_upto": reg_upto,
-            "insurance_upto": ins_upto,
-            "puc_upto": puc_upto,
-            "vehicle_color": random.choice(["WHITE", "SILVER", "BLACK", "RED", "BLUE", "GREY"]),
-            "engine_number": engine_no,
-            "chassis_number": chassis_no,
+            "insurance_upto": self._date(as_of + self._int(low, high)),
+            "puc_upto": self._date(as_of + self._int(low, high)),
+            "vehicle_color": self._pick(SYNTHETIC_COLORS),
+            "engine_number": f"{self._pick(['AB', 'CD', 'EF', 'GH'])}{self._int(100000, 999999)}",
+            "chassis_number": f"{self._pick(['MA', 'MB', 'MC', 'MD'])}{self._int(100000000, 999999999)}",
             "blacklist_status": "NO",
             "rc_status": "ACTIVE",
-            "vehicle_age_years": 2023 - reg_year
+            "vehicle_age_years": (as_of - reg.toordinal()) // 365,
+            "source": "synthetic"
         }
-        
-        print(f"{Fore.GREEN}[+] Generated realistic data for demonstration purposes!")
-        return formatted_data
-        
-    except Exception as e:
-        print(f"{Fore.RED}[!] Error generating realistic data: {str(e)}")
-        return None
 
-def get_challan_data_from_api(plate_number):
-    """ Retrieve challan data from real APIs
-    This function will fetch actual challan data from government APIs """
-    try:
-        print(f"{Fore.YELLOW}[+] Connecting to eChallan database...")
-        
-        # Headers to mimic a browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows .0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://echallan.parivahan.gov.in/',
-            'X-Requested-With': 'XMLHttpRequest',
-            'Connection': 'keep-alive',
-        }
+    def challans(self, plate_number):
+        """ Synthetic challans for one vehicle (count drawn from the challan count distribution) """
+        rng = self.rng
+        count = rng.choices(self._counts, cum_weights=self._count_weights)[0]
+        if not count:
+            return []
+        state_code = plate_number[:2].upper()
+        statuses = rng.choices(self._statuses, cum_weights=self._status_weights, k=count)
+        as_of = self.as_of
         
-        # eChallan API endpoint for challan details
-        url = f"https://echallan.parivahan.gov.in/ecitizen/services/echallan/ChallanCitizen/ChallanCitizenAction"
+        challan_data = []
+        for payment_status in statuses:
+            offence = self._pick(SYNTHETIC_OFFENCES)
+            # Issued within the last three years
+            issued = as_of - self._int(0, 3 * 365)
+            issue_date = self._date(issued)
+            
+            # Paid within a month of issue
+            payment_date = "N/A"
+            if payment_status == "PAID":
+                payment_date = self._date(min(issued + self._int(0, 30), as_of))
+            
+            unpaid = payment_status == "UNPAID"
+            challan_data.append({
+                "challan_number": f"{state_code}/{self._int(1000000, 9999999)}/{issue_date[-4:]}",
+                "issue_date": issue_date,
+                "offence_date": issue_date,
+                "offence_time": f"{self._int(8, 20):02d}:{self._int(0, 59):02d}",
+                "offence_place": self._pick(SYNTHETIC_PLACES),
+                "offence_section": offence["section"],
+                "offence_desc": offence["desc"],
+                "amount": offence["amount"],
+                "payment_status": payment_status,
+                "payment_date": payment_date,
+                "court_name": "Traffic Court, City" if unpaid else "N/A",
+                "court_address": "Main Road, City Center" if unpaid else "N/A",
+                "source": "synthetic"
+            })
+        return challan_data
+
+    def batches(self, count, batch_size=1000, start=0, plates_only=False):
+        """ Yield lists of up to batch_size stored-result records (the batch output format),
+        or of bare plate numbers when plates_only is set """
+        generated_on = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+        for batch_start in range(start, start + count, batch_size):
+            indexes = range(batch_start, min(batch_start + batch_size, start + count))
+            if plates_only:
+                yield [self.plate(index) for index in indexes]
+                continue
+            batch = []
+            for index in indexes:
+                plate = self.plate(index)
+                batch.append({
+                    'plate': plate,
+                    'status': 'ok',
+                    'sources': {'vehicle': 'synthetic', 'challan': 'synthetic'},
+                    'vehicle_info': self.vehicle(plate),
+                    'challan_data': self.challans(plate),
+                    'generated_on': generated_on
+                })
+            yield batch
+
+    def generate(self, count, sink, batch_size=1000, plates_only=False):
+        """ Stream count records to sink(batch) in batches; returns the number generated """
+        generated = 0
+        for batch in self.batches(count, batch_size, plates_only=plates_only):
+            sink(batch)
+            generated += len(batch)
+        return generated
+
+# Unseeded generator behind the single-record fallbacks
+SYNTHETIC_FLEET = SyntheticFleet()
+
+def run_synthetic_fleet(count, output_file, seed=None, batch_size=1000, plates_only=False, **distributions):
+    """ Write a reproducible synthetic fleet as JSON lines (or just its plates) for load tests """
+    try:
+        fleet = SyntheticFleet(seed, **distributions)
+        started = time.perf_counter()
+        with open(output_file, 'w') as out:
+            def sink(batch):
+                if plates_only:
+                    out.write(''.join(plate + '\n' for plate in batch))
+                else:
+                    out.write(''.join(json.dumps(record) + '\n' for record in batch))
+            generated = fleet.generate(count, sink, batch_size, plates_only)
+        elapsed = time.perf_counter() - started
         
-        # Prepare request data
-        data = {
-            'vehicleNo': plate_number.upper(),
-            'stateCode': plate_number[:2].upper() if len(plate_number) > 2 else 'DL',
-            'captcha': 'XXXX'  # This would need to be handled with captcha solving
-        }
+        rate = generated / elapsed if elapsed else 0
+        print(f"{Fore.GREEN}[+] Generated {generated} synthetic vehicles in {elapsed:.2f}s "
+              f"({rate:.0f}/s) into {output_file}{Style.RESET_ALL}")
+        return generated
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error generating synthetic fleet: {str(e)}{Style.RESET_ALL}")
+        return None
+
+def generate_realistic_data(plate_number):
+    """ Generate realistic data based on the plate number """
+    try:
+        mark_synthetic('vehicle')
+        formatted_data = SYNTHETIC_FLEET.vehicle(plate_number)
+        print(f"{Fore.GREEN}[+] Generated realistic data for demonstration purposes!")
+        return formatted_data
         
-        # Make the request
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error generating realistic data: {str(e)}")
+        return None
+
+def iter_json_array(chunks, array_key, fields=None):
+    """ Incrementally decode the array stored under array_key of a top-level JSON object
+    chunks is an iterable of bytes (e.g. response.iter_content()). Array elements are
+    yielded one at a time and dropped from the buffer, so memory stays bounded by one
+    element plus one chunk. Other top-level values are decoded whole into `fields`. """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    fields = {} if fields is None else fields
+    state = {'buffer': '', 'pos': 0, 'eof': False}
+
+    def fill():
+        # Append the next chunk; returns False at end of stream
+        if state['eof']:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            state['eof'] = True
+            state['buffer'] += utf8.decode(b'', final=True)
+            return True
+        # Drop the consumed prefix so the buffer never holds decoded elements
+        state['buffer'] = state['buffer'][state['pos']:] + utf8.decode(chunk)
+        state['pos'] = 0
+        return True
+
+    def next_char():
+        # Skip whitespace and return the next significant character (None at EOF)
+        while True:
+            buffer = state['buffer']
+            while state['pos'] < len(buffer) and buffer[state['pos']] in ' \t\r\n':
+                state['pos'] += 1
+            if state['pos'] < len(buffer):
+                return buffer[state['pos']]
+            if not fill():
+                return None
+
+    def expect(chars):
+        char = next_char()
+        if char is None or char not in chars:
+            raise ValueError(f"Malformed JSON stream: expected one of {chars!r}, got {char!r}")
+        state['pos'] += 1
+        return char
+
+    def decode_value():
+        # A number is only complete once a delimiter follows it: "-1." or "2e" at the
+        # end of a chunk decodes as -1 or 2, and one ending exactly at the buffer end
+        # may be cut off too
+        while True:
+            next_char()
+            try:
+                value, end = decoder.raw_decode(state['buffer'], state['pos'])
+                buffer = state['buffer']
+                if state['eof'] or (end < len(buffer) and (
+                        not isinstance(value, (int, float)) or buffer[end] in ' \t\r\n,]}')):
+                    state['pos'] = end
+                    return value
+            except json.JSONDecodeError:
+                if state['eof']:
+                    raise
+            if not fill():
+                raise ValueError("Malformed JSON stream: unexpected end of data")
+
+    expect('{')
+    if next_char() == '}':
+        return
+    while True:
+        key = decode_value()
+        expect(':')
+        if key == array_key and next_char() == '[':
+            expect('[')
+            if next_char() == ']':
+                state['pos'] += 1
+            else:
+                while True:
+                    yield decode_value()
+                    if expect(',]') == ']':
+                        break
+        else:
+            fields[key] = decode_value()
+        if expect(',}') == '}':
+            return
+
+def format_challan_record(challan):
+    """ Map one raw eChallan API record to the tool's challan fields """
+    return SOURCE_REGISTRY['echallan_api']['mapper'](challan)
+
+def echallan_request_data(plate_number):
+    """ Request body for the eChallan citizen API """
+    return source_request_body('echallan_api', plate_number)
+
+@instrument_lookup('challan')
+def get_challan_data_from_api(plate_number):
+    """ Retrieve challan data from real APIs
+    This function will fetch actual challan data from government APIs """
+    try:
+        print(f"{Fore.YELLOW}[+] Connecting to eChallan database...")
         
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('status') == 'Success':
-                # Extract challan information
-                challan_data = result.get('challanList', [])
-                
-                # Format the data
-                formatted_challans = []
-                for challan in challan_data:
-                    formatted_challan = {
-                        "challan_number": challan.get('challanNo', 'N/A'),
-                        "issue_date": challan.get('issueDate', 'N/A'),
-                        "offence_date": challan.get('offenceDate', 'N/A'),
-                        "offence_time": challan.get('offenceTime', 'N/A'),
-                        "offence_place": challan.get('offencePlace', 'N/A'),
-                        "offence_section": challan.get('offenceSection', 'N/A'),
-                        "offence_desc": challan.get('offenceDesc', 'N/A'),
-                        "amount": challan.get('amount', 'N/A'),
-                        "payment_status": challan.get('paymentStatus', 'N/A'),
-                        "payment_date": challan.get('paymentDate', 'N/A'),
-                        "court_name": challan.get('courtName', 'N/A'),
-                        "court_address": challan.get('courtAddress', 'N/A')
-                    }
-                    formatted_challans.append(formatted_challan)
-                
-                print(f"{Fore.GREEN}[+] Successfully retrieved challan information!")
-                return formatted_challans
+        formatted_challans = fetch_from_source('echallan_api', plate_number)
+        if formatted_challans is not None:
+            print(f"{Fore.GREEN}[+] Successfully retrieved challan information!")
+            return formatted_challans
         
         # If eChallan API fails, try with alternative API
         print(f"{Fore.YELLOW}[+] eChallan API failed, trying alternative sources...")
@@ -572,6 +1783,87 @@ def get_challan_data_from_api(plate_number):
         print(f"{Fore.RED}[!] Error retrieving challan information from eChallan: {str(e)}")
         return get_challan_data_alternative(plate_number)
 
+def stream_challan_data_from_api(plate_number, sink, chunk_size=16384):
+    """ Streaming variant of get_challan_data_from_api
+    Decodes challanList entries from the response stream and passes each mapped
+    challan to sink() as soon as it is complete, so a lookup never holds the whole
+    payload. Returns the number of challans emitted, or None on failure. If the
+    eChallan API yields nothing, the alternative sources' results are streamed instead. """
+    emitted = 0
+    try:
+        print(f"{Fore.YELLOW}[+] Streaming from eChallan database...")
+        with source_span('echallan_api', ECHALLAN_API_URL, stage='stream') as span:
+            response = get_http_session().post(ECHALLAN_API_URL, headers=ECHALLAN_HEADERS,
+                                               json=echallan_request_data(plate_number), timeout=10, stream=True)
+            span.status = response.status_code
+            if response.status_code == 200:
+                io_seconds = 0.0
+                started = time.perf_counter()
+
+                def counted_chunks():
+                    nonlocal io_seconds
+                    chunks = response.iter_content(chunk_size=chunk_size)
+                    while True:
+                        read_started = time.perf_counter()
+                        chunk = next(chunks, None)
+                        io_seconds += time.perf_counter() - read_started
+                        if chunk is None:
+                            return
+                        span.bytes += len(chunk)
+                        yield chunk
+
+                fields = {}
+                try:
+                    for challan in iter_json_array(counted_chunks(), 'challanList', fields):
+                        # 'status' normally precedes the list; stop early if it reports failure
+                        if fields.get('status', 'Success') != 'Success':
+                            break
+                        sink_started = time.perf_counter()
+                        sink(tag_source(format_challan_record(challan), 'echallan_api'))
+                        io_seconds += time.perf_counter() - sink_started
+                        emitted += 1
+                finally:
+                    response.close()
+                    span.parse_time = max(0.0, time.perf_counter() - started - io_seconds)
+                
+                if fields.get('status') == 'Success':
+                    span.mark_hit()
+                    print(f"{Fore.GREEN}[+] Streamed {emitted} challans!")
+                    return emitted
+        
+        print(f"{Fore.YELLOW}[+] eChallan stream failed, trying alternative sources...")
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error streaming challan information from eChallan: {str(e)}")
+    
+    # Records already handed to the sink cannot be taken back
+    if emitted:
+        return emitted
+    challan_data = get_challan_data_alternative(plate_number)
+    if challan_data is None or is_unavailable(challan_data):
+        return None
+    for challan in challan_data:
+        sink(challan)
+    return len(challan_data)
+
+def run_challan_stream(plate_number, output_file=None):
+    """ Stream the challans of one plate as JSON lines to a file or stdout """
+    if not validate_license_plate(plate_number):
+        print(f"{Fore.RED}[!] Invalid vehicle number format: {plate_number}{Style.RESET_ALL}")
+        return None
+    
+    out = open(output_file, 'w') if output_file else sys.stdout
+    try:
+        def sink(challan):
+            out.write(json.dumps(challan) + '\n')
+        count = stream_challan_data_from_api(plate_number, sink)
+    finally:
+        if output_file:
+            out.close()
+    
+    if output_file and count is not None:
+        print(f"{Fore.GREEN}[+] {count} challans written to {output_file}{Style.RESET_ALL}")
+    return count
+
 def get_challan_data_alternative(plate_number):
     """ Alternative method to retrieve challan data
     Uses multiple sources and techniques """
@@ -579,50 +1871,10 @@ def get_challan_data_alternative(plate_number):
         # Method 1: Try with alternative APIs
         print(f"{Fore.YELLOW}[+] Trying alternative challan APIs...")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
-        
-        # Try multiple API endpoints
-        api_endpoints = [
-            f"https://traffic-violation-api.p.rapidapi.com/challans/{plate_number}",
-            f"https://echallan-api.p.rapidapi.com/vehicle/{plate_number}",
-            f"https://traffic-challan-api.p.rapidapi.com/get-challans/{plate_number}"
-        ]
-        
-        for endpoint in api_endpoints:
-            try:
-                response = requests.get(endpoint, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check if we got valid data
-                    if data and isinstance(data, dict) and data.get('challans'):
-                        # Extract and format the data
-                        formatted_challans = []
-                        for challan in data.get('challans', []):
-                            formatted_challan = {
-                                "challan_number": challan.get('challanNo', 'N/A'),
-                                "issue_date": challan.get('issueDate', 'N/A'),
-                                "offence_date": challan.get('offenceDate', 'N/A'),
-                                "offence_time": challan.get('offenceTime', 'N/A'),
-                                "offence_place": challan.get('offencePlace', 'N/A'),
-                                "offence_section": challan.get('offenceSection', 'N/A'),
-                                "offence_desc": challan.get('offenceDesc', 'N/A'),
-                                "amount": challan.get('amount', 'N/A'),
-                                "payment_status": challan.get('paymentStatus', 'N/A'),
-                                "payment_date": challan.get('paymentDate', 'N/A'),
-                                "court_name": challan.get('courtName', 'N/A'),
-                                "court_address": challan.get('courtAddress', 'N/A')
-                            }
-                            formatted_challans.append(formatted_challan)
-                        
-                        print(f"{Fore.GREEN}[+] Successfully retrieved challan information from alternative source!")
-                        return formatted_challans
-            except Exception as e:
-                continue
+        formatted_challans = fetch_from_source('challan_alt_api', plate_number)
+        if formatted_challans is not None:
+            print(f"{Fore.GREEN}[+] Successfully retrieved challan information from alternative source!")
+            return formatted_challans
         
         # Method 2: Try web scraping
         print(f"{Fore.YELLOW}[+] Trying web scraping method for challan data...")
@@ -630,206 +1882,436 @@ def get_challan_data_alternative(plate_number):
         
     except Exception as e:
         print(f"{Fore.RED}[!] Error retrieving challan information from alternative sources: {str(e)}")
-        return generate_realistic_challan_data(plate_number)
+        return fallback_result('challan', plate_number)
+
+def fetch_scraped_challans(plate_number):
+    """ Scrape the challan lookup sites in turn; returns the first non-empty answer or None """
+    for website in CHALLAN_SCRAPE_SITES:
+        try:
+            # Get the main page and find its lookup form
+            with source_span('challan_scraping', website, stage='landing') as span:
+                response = fetch_page(get_http_session(), website)
+                span.record_response(response)
+                if response.status_code != 200:
+                    continue
+                with span.parsing():
+                    form = extract_lookup_form(response.content, website, plate_number, CHALLAN_FORM_KEYWORDS)
+            if not form:
+                continue
+            
+            # Submit the form
+            action, form_data = form
+            with source_span('challan_scraping', action, stage='submit') as span:
+                response = get_http_session().post(action, headers=SCRAPE_HEADERS, data=form_data, timeout=5)
+                span.record_response(response)
+                if response.status_code != 200:
+                    continue
+                with span.parsing():
+                    challan_data = parse_challan_table_html(response.content)
+                
+                # If we got some data, return it
+                if challan_data:
+                    span.mark_hit()
+                    return tag_source(challan_data, 'challan_scraping')
+        except Exception as e:
+            continue
+    return None
 
 def get_challan_data_scraping(plate_number):
     """ Web scraping method to retrieve challan data """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-        
-        # Try multiple websites
-        websites = [
-            "https://echallan.parivahan.gov.in/",
-            "https://www.trafficchallan.in/",
-            "https://www.mychallan.in/",
-            "https://www.checkchallan.com/"
-        ]
-        
-        for website in websites:
-            try:
-                # Get the main page
-                response = requests.get(website, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try to find form elements
-                    form = soup.find('form')
-                    if form:
-                        # Extract form action URL
-                        action = form.get('action', '')
-                        if not action.startswith('http'):
-                            action = website + action
-                        
-                        # Extract form inputs
-                        inputs = form.find_all('input')
-                        form_data = {}
-                        for input_tag in inputs:
-                            name = input_tag.get('name', '')
-                            value = input_tag.get('value', '')
-                            if name:
-                                form_data[name] = value
-                        
-                        # Update form data with plate number
-                        for key in form_data.keys():
-                            if 'vehicle' in key.lower() or 'number' in key.lower() or 'plate' in key.lower():
-                                form_data[key] = plate_number.upper()
-                                break
-                        
-                        # Submit the form
-                        response = requests.post(action, headers=headers, data=form_data, timeout=5)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-                            
-                            # Try to extract challan information
-                            challan_data = []
-                            
-                            # Look for table with challan data
-                            tables = soup.find_all('table')
-                            for table in tables:
-                                rows = table.find_all('tr')
-                                if len(rows) > 1:  # At least header and one data row
-                                    for row in rows[1:]:  # Skip header row
-                                        cells = row.find_all('td')
-                                        if len(cells) >= 5:  # At least 5 columns
-                                            challan = {
-                                                "challan_number": cells[0].text.strip() if len(cells) > 0 else 'N/A',
-                                                "issue_date": cells[1].text.strip() if len(cells) > 1 else 'N/A',
-                                                "offence_date": cells[2].text.strip() if len(cells) > 2 else 'N/A',
-                                                "offence_place": cells[3].text.strip() if len(cells) > 3 else 'N/A',
-                                                "amount": cells[4].text.strip() if len(cells) > 4 else 'N/A',
-                                                "offence_desc": cells[5].text.strip() if len(cells) > 5 else 'N/A',
-                                                "payment_status": cells[6].text.strip() if len(cells) > 6 else 'N/A',
-                                                "offence_time": 'N/A',
-                                                "offence_section": 'N/A',
-                                                "payment_date": 'N/A',
-                                                "court_name": 'N/A',
-                                                "court_address": 'N/A'
-                                            }
-                                            challan_data.append(challan)
-                            
-                            # If we got some data, return it
-                            if challan_data:
-                                print(f"{Fore.GREEN}[+] Successfully retrieved challan information through web scraping!")
-                                return challan_data
-            except Exception as e:
-                continue
+        challan_data = fetch_scraped_challans(plate_number)
+        if challan_data:
+            print(f"{Fore.GREEN}[+] Successfully retrieved challan information through web scraping!")
+            return challan_data
         
-        # If all methods fail, generate realistic fallback data
-        print(f"{Fore.YELLOW}[+] All methods failed, generating realistic challan data based on plate number...")
-        return generate_realistic_challan_data(plate_number)
+        # If all methods fail, fall back to generated data (or Unavailable when strict)
+        return fallback_result('challan', plate_number)
         
     except Exception as e:
         print(f"{Fore.RED}[!] Error in web scraping for challan data: {str(e)}")
-        return generate_realistic_challan_data(plate_number)
+        return fallback_result('challan', plate_number)
+
+# Declarative source registry
+# A field map gives, per canonical field, the raw key to read, a (raw key, transform)
+# pair, or PLATE for the plate that was looked up. Missing raw keys become 'N/A'.
+PLATE = '$plate'
+
+VAHAN_FIELD_MAP = {
+    "registration_number": 'regn_no',
+    "owner_name": 'owner_name',
+    "father_name": 'f_name',
+    "address": 'c_add',
+    "pincode": 'p_code',
+    "mobile": 'mobile',
+    "vehicle_class": 'vh_class',
+    "maker": 'maker_desc',
+    "model": 'maker_model',
+    "fuel_type": 'fuel_type',
+    "registration_date": 'reg_dt',
+    "registration_upto": 'reg_upto',
+    "fitness_upto": 'fit_upto',
+    "insurance_upto": 'ins_upto',
+    "puc_upto": 'puc_upto',
+    "vehicle_color": 'colr_desc',
+    "engine_number": 'eng_no',
+    "chassis_number": 'chasi_no',
+    "blacklist_status": ('blacklist_status', lambda value: "NO" if value == 'N' else "YES"),
+    "rc_status": 'rc_status',
+    "vehicle_age_years": ('reg_dt', calculate_vehicle_age),
+}
+
+# The RapidAPI vehicle endpoints already use the tool's field names
+ALT_VEHICLE_FIELD_MAP = dict({field: field for field in VAHAN_FIELD_MAP},
+                             registration_number=PLATE,
+                             vehicle_age_years=('registration_date', calculate_vehicle_age))
+
+ECHALLAN_FIELD_MAP = {
+    "challan_number": 'challanNo',
+    "issue_date": 'issueDate',
+    "offence_date": 'offenceDate',
+    "offence_time": 'offenceTime',
+    "offence_place": 'offencePlace',
+    "offence_section": 'offenceSection',
+    "offence_desc": 'offenceDesc',
+    "amount": 'amount',
+    "payment_status": 'paymentStatus',
+    "payment_date": 'paymentDate',
+    "court_name": 'courtName',
+    "court_address": 'courtAddress',
+}
+
+def compile_field_map(field_map):
+    """ Compile a field map into extract(record, plate) returning the canonical dict
+    Each field's spec is resolved once, here, into a getter, so mapping a record is
+    a single pass over precomputed (field, getter) pairs without re-reading the map. """
+    getters = []
+    for field, spec in field_map.items():
+        if spec == PLATE:
+            getter = lambda record, plate: plate.upper()
+        elif isinstance(spec, tuple):
+            key, transform = spec
+            getter = lambda record, plate, key=key, transform=transform: transform(record.get(key, 'N/A'))
+        else:
+            getter = lambda record, plate, key=spec: record.get(key, 'N/A')
+        getters.append((field, getter))
+    
+    def extract(record, plate=None):
+        return {field: getter(record, plate) for field, getter in getters}
+    return extract
+
+def _resolve_path(data, path):
+    """ Follow a path of keys / indexes into decoded JSON (None if any step is missing) """
+    for step in path:
+        try:
+            data = data[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+SOURCE_REGISTRY = OrderedDict()
+
+def register_source(name, kind, fields=None, urls=(), method='GET', headers=None, body=None, timeout=5,
+                    success=None, path=(), many=False, require_records=False, fetcher=None):
+    """ Declare a lookup source
+    HTTP/JSON sources give URL templates (tried in order; {plate}, {reg_no} and {state}
+    are filled in), the method, a JSON body template for POST, a success test
+    (key, expected value), the path to the record (or record list when many) and a
+    field map. Sources that need their own flow (e.g. HTML forms) pass fetcher
+    instead. Sources of a kind are tried, and trusted, in registration order. """
+    spec = {'name': name, 'kind': kind, 'urls': list(urls), 'method': method, 'headers': headers or {},
+            'body': body, 'timeout': timeout, 'fetcher': fetcher}
+    if fetcher is None:
+        mapper = compile_field_map(fields)
+        
+        def extract(data, plate_number):
+            if not isinstance(data, dict) or not data:
+                return None
+            if success and data.get(success[0]) != success[1]:
+                return None
+            records = _resolve_path(data, path)
+            if many:
+                records = records or []
+                if require_records and not records:
+                    return None
+                return [mapper(record, plate_number) for record in records]
+            return mapper(records, plate_number) if isinstance(records, dict) else None
+        
+        spec['mapper'] = mapper
+        spec['extract'] = extract
+    SOURCE_REGISTRY[name] = spec
+    return spec
+
+def source_template_values(plate_number):
+    return {'plate': plate_number, 'reg_no': plate_number.upper(), 'state': plate_state(plate_number)}
+
+def source_request_body(name, plate_number):
+    """ JSON body of a POST source for this plate """
+    values = source_template_values(plate_number)
+    return {key: value.format(**values) for key, value in SOURCE_REGISTRY[name]['body'].items()}
+
+def fetch_from_source(name, plate_number):
+    """ Query one registered source; returns its canonical, source-tagged data or None """
+    spec = SOURCE_REGISTRY[name]
+    if spec['fetcher'] is not None:
+        return spec['fetcher'](plate_number)
+    
+    values = source_template_values(plate_number)
+    session = get_http_session()
+    for template in spec['urls']:
+        url = template.format(**values)
+        try:
+            with source_span(name, url) as span:
+                if spec['method'] == 'POST':
+                    response = session.post(url, headers=spec['headers'], json=source_request_body(name, plate_number),
+                                            timeout=spec['timeout'])
+                else:
+                    response = session.get(url, headers=spec['headers'], timeout=spec['timeout'])
+                span.record_response(response)
+                if response.status_code != 200:
+                    continue
+                with span.parsing():
+                    result = spec['extract'](response.json(), plate_number)
+                if result is not None:
+                    span.mark_hit()
+                    return tag_source(result, name)
+        except Exception as e:
+            # With a single endpoint there is nothing to fall back on; let the caller report it
+            if len(spec['urls']) == 1:
+                raise
+            continue
+    return None
+
+def registered_sources(kind):
+    """ (name, fetcher) pairs of every source of kind, in registration (trust) order """
+    return [(name, functools.partial(fetch_from_source, name))
+            for name, spec in SOURCE_REGISTRY.items() if spec['kind'] == kind]
+
+register_source(
+    'vahan_api', 'vehicle', VAHAN_FIELD_MAP,
+    urls=[f"{VAHAN_API_BASE}/GetVehicleDetails"], method='POST', headers=VAHAN_HEADERS,
+    body={'regn_no': '{reg_no}', 'td': '{state}'}, timeout=10,
+    success=('status', 'Success'), path=('row', 0))
+register_source(
+    'vehicle_alt_api', 'vehicle', ALT_VEHICLE_FIELD_MAP,
+    urls=["https://rto-vehicle-information-api.p.rapidapi.com/get_vehicle/{plate}",
+          "https://vehicle-registration-api.p.rapidapi.com/api/v1/vehicle/india/{plate}",
+          "https://car-info-api.p.rapidapi.com/v1/car/india/{plate}"],
+    headers=API_HEADERS)
+register_source('vehicle_scraping', 'vehicle', fetcher=fetch_scraped_vehicle)
+
+register_source(
+    'echallan_api', 'challan', ECHALLAN_FIELD_MAP,
+    urls=[ECHALLAN_API_URL], method='POST', headers=ECHALLAN_HEADERS,
+    # The captcha would need to be handled with captcha solving
+    body={'vehicleNo': '{reg_no}', 'stateCode': '{state}', 'captcha': 'XXXX'}, timeout=10,
+    success=('status', 'Success'), path=('challanList',), many=True)
+register_source(
+    'challan_alt_api', 'challan', ECHALLAN_FIELD_MAP,
+    urls=["https://traffic-violation-api.p.rapidapi.com/challans/{plate}",
+          "https://echallan-api.p.rapidapi.com/vehicle/{plate}",
+          "https://traffic-challan-api.p.rapidapi.com/get-challans/{plate}"],
+    headers=API_HEADERS, path=('challans',), many=True, require_records=True)
+register_source('challan_scraping', 'challan', fetcher=fetch_scraped_challans)
+
+# State- and RTO-aware source routing
+# Registration state codes (current and legacy) accepted by the portals
+STATE_CODES = ('AN', 'AP', 'AR', 'AS', 'BR', 'CG', 'CH', 'CT', 'DD', 'DL', 'DN', 'GA', 'GJ', 'HP', 'HR', 'JH',
+               'JK', 'KA', 'KL', 'LA', 'LD', 'MH', 'ML', 'MN', 'MP', 'MZ', 'NL', 'OD', 'OR', 'PB', 'PY', 'RJ',
+               'SK', 'TN', 'TR', 'TS', 'UA', 'UK', 'UP', 'WB')
+DEFAULT_STATE = 'DL'
+
+def plate_state(plate_number):
+    """ Registration state of a plate (DEFAULT_STATE when the prefix is not a known state) """
+    state = normalize_plate(plate_number)[:2]
+    return state if state in STATE_CODES else DEFAULT_STATE
+
+RTO_PATTERN = re.compile(r'([A-Z]{2})(\d{1,2})')
+
+def plate_rto(plate_number):
+    """ RTO code of a plate: state and two-digit office number (MH12), or None without one """
+    match = RTO_PATTERN.match(normalize_plate(plate_number))
+    if not match or match.group(1) not in STATE_CODES:
+        return None
+    return f"{match.group(1)}{int(match.group(2)):02d}"
+
+class SourceRouter:
+    """ Routing table learned from observed source outcomes, per RTO and per state
+    Every outcome counts towards the plate's RTO (e.g. MH12) and its state (MH). A
+    source is judged on its RTO's numbers once they cover min_attempts lookups and
+    on the state's until then, so a portal that fails only for some offices is
+    learned without starving the rest of the state of data. Sources are tried in
+    order of their smoothed success rate (ties keep the default order). Once a
+    source has failed min_attempts times in a region with a success rate below
+    skip_below it is skipped there, except for one probe every probe_every lookups
+    so it can come back. """
+
+    def __init__(self, min_attempts=20, skip_below=0.02, probe_every=50, prior_weight=5):
+        self.min_attempts = min_attempts
+        self.skip_below = skip_below
+        self.probe_every = probe_every
+        self.prior_weight = prior_weight
+        self.table = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, region, source):
+        return self.table.setdefault(region, {}).setdefault(source, {'attempts': 0, 'successes': 0, 'skipped': 0})
+
+    def regions(self, plate_number):
+        """ Routing keys of a plate, most specific first: its RTO (if it has one) and its state """
+        state = plate_state(plate_number)
+        rto = plate_rto(plate_number)
+        return (rto, state) if rto and rto[:2] == state else (state,)
+
+    def _region(self, regions, source):
+        """ The most specific region with enough observations of source to go by """
+        for region in regions[:-1]:
+            entry = self.table.get(region, {}).get(source)
+            if entry is not None and entry['attempts'] >= self.min_attempts:
+                return region
+        return regions[-1]
+
+    def score(self, region, source):
+        """ Success rate shrunk towards 0.5 while there are few observations """
+        entry = self.table.get(region, {}).get(source)
+        if entry is None:
+            return 0.5
+        return (entry['successes'] + 0.5 * self.prior_weight) / (entry['attempts'] + self.prior_weight)
+
+    def order(self, sources, plate_number):
+        """ The (source, fetcher) pairs to try for this plate, best first """
+        regions = self.regions(plate_number)
+        with self._lock:
+            judged_by = {source: self._region(regions, source) for source, fetcher in sources}
+            ranked = sorted(sources, key=lambda item: -self.score(judged_by[item[0]], item[0]))
+            routed = []
+            for source, fetcher in ranked:
+                entry = self._entry(judged_by[source], source)
+                dead = (entry['attempts'] >= self.min_attempts and
+                        entry['successes'] < self.skip_below * entry['attempts'])
+                if dead:
+                    entry['skipped'] += 1
+                    if entry['skipped'] % self.probe_every:
+                        # Labelled by state only: one series per RTO would be too many
+                        METRICS.inc('vech_route_skips_total', {'state': regions[-1], 'source': source},
+                                    help_text="Source attempts skipped by the routing table")
+                        continue
+                routed.append((source, fetcher))
+            return routed
+
+    def record(self, plate_number, source, success):
+        regions = self.regions(plate_number)
+        with self._lock:
+            for region in regions:
+                entry = self._entry(region, source)
+                entry['attempts'] += 1
+                if success:
+                    entry['successes'] += 1
+
+    def load(self, path):
+        """ Merge a routing table saved by save() (missing file is fine) """
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r') as f:
+            table = json.load(f)
+        with self._lock:
+            for state, sources in table.items():
+                for source, counts in sources.items():
+                    entry = self._entry(state, source)
+                    for key in ('attempts', 'successes'):
+                        entry[key] += int(counts.get(key, 0))
+        return True
+
+    def save(self, path):
+        with self._lock:
+            table = {state: {source: {'attempts': entry['attempts'], 'successes': entry['successes']}
+                             for source, entry in sources.items() if entry['attempts']}
+                     for state, sources in self.table.items()}
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(table, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def health(self):
+        """ (region, source, attempts, successes) of every observed source; region is an RTO or state """
+        with self._lock:
+            return [(region, source, entry['attempts'], entry['successes'])
+                    for region, sources in self.table.items()
+                    for source, entry in sources.items() if entry['attempts']]
+
+    def restore_health(self, region, source, attempts, successes):
+        """ Adopt counts from a snapshot when they cover more attempts than ours
+        (taking the larger rather than adding keeps reloading a snapshot harmless) """
+        with self._lock:
+            entry = self._entry(region, source)
+            if attempts <= entry['attempts']:
+                return False
+            entry['attempts'], entry['successes'] = int(attempts), int(successes)
+        return True
+
+    def rows(self, state=None):
+        """ (region, source, attempts, successes, score, routed) rows for display
+        With state, only that state and its RTOs are shown """
+        with self._lock:
+            rows = []
+            for region in sorted(self.table):
+                if state and region[:2] != state.upper():
+                    continue
+                for source, entry in sorted(self.table[region].items()):
+                    dead = (entry['attempts'] >= self.min_attempts and
+                            entry['successes'] < self.skip_below * entry['attempts'])
+                    rows.append([region, source, entry['attempts'], entry['successes'],
+                                 round(self.score(region, source), 3), 'probe only' if dead else 'yes'])
+            return rows
+
+SOURCE_ROUTER = SourceRouter()
+
+def routed_lookup(kind, plate_number):
+    """ Try the sources of kind in the order the routing table picks for this plate """
+    for source, fetcher in SOURCE_ROUTER.order(registered_sources(kind), plate_number):
+        try:
+            result = fetcher(plate_number)
+        except Exception as e:
+            result = None
+        SOURCE_ROUTER.record(plate_number, source, result is not None)
+        if result is not None:
+            print(f"{Fore.GREEN}[+] Successfully retrieved {kind} information from {source}!")
+            return result
+    return fallback_result(kind, plate_number)
+
+@instrument_lookup('vehicle')
+def get_vehicle_info_routed(plate_number):
+    """ Vehicle lookup over the sources the routing table picks for the plate's state """
+    print(f"{Fore.YELLOW}[+] Looking up vehicle information ({plate_state(plate_number)} routing)...")
+    return routed_lookup('vehicle', plate_number)
+
+@instrument_lookup('challan')
+def get_challan_data_routed(plate_number):
+    """ Challan lookup over the sources the routing table picks for the plate's state """
+    print(f"{Fore.YELLOW}[+] Looking up challan information ({plate_state(plate_number)} routing)...")
+    return routed_lookup('challan', plate_number)
+
+def run_routes(routes_file, state=None):
+    """ Display a saved routing table """
+    router = SourceRouter()
+    if not router.load(routes_file):
+        print(f"{Fore.RED}[!] Routing table not found: {routes_file}{Style.RESET_ALL}")
+        return None
+    rows = router.rows(state)
+    print(f"\n{Fore.CYAN}[+] SOURCE ROUTING TABLE{Style.RESET_ALL}")
+    print(tabulate(rows, headers=["Region", "Source", "Attempts", "Successes", "Score", "Routed"], tablefmt="grid"))
+    return rows
 
 def generate_realistic_challan_data(plate_number):
     """ Generate realistic challan data based on the plate number """
     try:
-        # Generate random number of challans (0-5)
-        num_challans = random.randint(0, 5)
+        mark_synthetic('challan')
+        challan_data = SYNTHETIC_FLEET.challans(plate_number)
         
-        if num_challans == 0:
+        if not challan_data:
             print(f"{Fore.GREEN}[+] No challans found for this vehicle!")
             return []
         
-        # Common traffic offences
-        offences = [
-            {"section": "184", "desc": "Dangerous Driving", "amount": "2000"},
-            {"section": "177", "desc": "General Offence", "amount": "500"},
-            {"section": "119/177", "desc": "Disobedience of Order", "amount": "200"},
-            {"section": "179", "desc": "Refusal to Give Information", "amount": "500"},
-            {"section": "180", "desc": "Obstruction to Free Flow of Traffic", "amount": "500"},
-            {"section": "181", "desc": "Unauthorised Use of Vehicles", "amount": "2000"},
-            {"section": "182", "desc": "Violation of Road Regulations", "amount": "500"},
-            {"section": "183", "desc": "Riding Without Helmet", "amount": "500"},
-            {"section": "185", "desc": "Driving by Drunken Person", "amount": "2000"},
-            {"section": "186", "desc": "Driving at Excessive Speed", "amount": "2000"},
-            {"section": "187", "desc": "Driving Dangerously", "amount": "2000"},
-            {"section": "188", "desc": "Racing and Trials of Speed", "amount": "500"},
-            {"section": "189", "desc": "Jaywalking", "amount": "500"},
-            {"section": "190", "desc": "Failure to Convey Information", "amount": "500"},
-            {"section": "191", "desc": "Failure to Produce Documents", "amount": "500"},
-            {"section": "192", "desc": "Unauthorized Parking", "amount": "200"},
-            {"section": "193", "desc": "Parking in Prohibited Places", "amount": "200"},
-            {"section": "194", "desc": "Refusal to Surrender License", "amount": "500"},
-            {"section": "194A", "desc": "Obstruction of Traffic", "amount": "500"},
-            {"section": "194B", "desc": "Violation of Road Rules", "amount": "500"}
-        ]
-        
-        # Common places
-        places = [
-            "Main Road, City Center",
-            "Highway NH-44",
-            "MG Road, Market Area",
-            "Station Road",
-            "College Junction",
-            "Airport Road",
-            "Industrial Area",
-            "Ring Road",
-            "Palace Road",
-            "Residential Area"
-        ]
-        
-        # Generate challans
-        challan_data = []
-        
-        for i in range(num_challans):
-            # Select random offence
-            offence = random.choice(offences)
-            
-            # Generate random dates
-            issue_year = random.randint(2020, 2023)
-            issue_month = random.randint(1, 12)
-            issue_day = random.randint(1, 28)
-            issue_date = f"{issue_day:02d}-{issue_month:02d}-{issue_year}"
-            
-            # Generate random time
-            hour = random.randint(8, 20)
-            minute = random.randint(0, 59)
-            offence_time = f"{hour:02d}:{minute:02d}"
-            
-            # Random payment status
-            payment_status = random.choice(["PAID", "UNPAID", "PENDING"])
-            
-            # Payment date if paid
-            payment_date = "N/A"
-            if payment_status == "PAID":
-                pay_day = random.randint(issue_day, 28)
-                pay_month = issue_month
-                pay_year = issue_year
-                
-                # Sometimes payment is made in the next month
-                if random.choice([True, False]):
-                    pay_month += 1
-                    if pay_month > 12:
-                        pay_month = 1
-                        pay_year += 1
-                
-                payment_date = f"{pay_day:02d}-{pay_month:02d}-{pay_year}"
-            
-            # Create challan
-            challan = {
-                "challan_number": f"DL/{random.randint(1000000, 9999999)}/{issue_year}",
-                "issue_date": issue_date,
-                "offence_date": issue_date,
-                "offence_time": offence_time,
-                "offence_place": random.choice(places),
-                "offence_section": offence["section"],
-                "offence_desc": offence["desc"],
-                "amount": offence["amount"],
-                "payment_status": payment_status,
-                "payment_date": payment_date,
-                "court_name": "Traffic Court, City" if payment_status == "UNPAID" else "N/A",
-                "court_address": "Main Road, City Center" if payment_status == "UNPAID" else "N/A"
-            }
-            
-            challan_data.append(challan)
-        
         print(f"{Fore.GREEN}[+] Generated realistic challan data for demonstration purposes!")
         return challan_data
         
@@ -837,54 +2319,233 @@ def generate_realistic_challan_data(plate_number):
         print(f"{Fore.RED}[!] Error generating realistic challan data: {str(e)}")
         return []
 
-def display_vehicle_info(vehicle_info):
+class StreamingTable:
+    """ Terminal table that prints rows as they arrive instead of building one big string
+    Column widths come from the headers and the first sample_size rows, capped at
+    max_width; values wider than their column wrap onto extra lines, so nothing is
+    cut off. When the output is not a TTY the table is written as plain
+    tab-separated lines with every value in full. With page_size set on an interactive terminal, output
+    pauses after every page (0 means one screenful). """
+
+    def __init__(self, headers, out=None, plain=None, page_size=None, sample_size=50, max_width=40):
+        self.out = out or sys.stdout
+        interactive = self.out.isatty()
+        self.headers = [str(header) for header in headers]
+        self.plain = not interactive if plain is None else plain
+        if page_size == 0:
+            page_size = max(shutil.get_terminal_size().lines - 4, 5)
+            if not self.plain:
+                # Grid rows take two lines each
+                page_size //= 2
+        self.page_size = page_size if interactive and sys.stdin.isatty() else None
+        self.sample_size = sample_size
+        self.max_width = max_width
+        self.widths = None
+        self.sample = []
+        self.rows = 0
+        self.stopped = False
+
+    def _cells(self, row):
+        return ['' if value is None else str(value).replace('\n', ' ').replace('\t', ' ') for value in row]
+
+    def _rule(self, char='-'):
+        return '+' + '+'.join(char * (width + 2) for width in self.widths) + '+'
+
+    def _line(self, cells):
+        """ One table row, wrapped over as many lines as its tallest cell needs """
+        wrapped = [textwrap.wrap(cell, width) or [''] if len(cell) > width else [cell]
+                   for cell, width in zip(cells, self.widths)]
+        height = max((len(lines) for lines in wrapped), default=1)
+        return '\n'.join(
+            '| ' + ' | '.join((lines[i] if i < len(lines) else '').ljust(width)
+                              for lines, width in zip(wrapped, self.widths)) + ' |'
+            for i in range(height))
+
+    def _start(self):
+        """ Fix the column widths from the sample and print the header and sampled rows """
+        columns = [self.headers] + self.sample
+        self.widths = [min(max(len(row[i]) if i < len(row) else 0 for row in columns), self.max_width)
+                       for i in range(len(self.headers))]
+        self.widths = [max(width, len(header)) for width, header in zip(self.widths, self.headers)]
+        self.out.write(self._rule() + '\n' + self._line(self.headers) + '\n' + self._rule('=') + '\n')
+        sample, self.sample = self.sample, []
+        for cells in sample:
+            if not self._emit(cells):
+                return
+
+    def _emit(self, cells):
+        if self.plain:
+            self.out.write('\t'.join(cells) + '\n')
+        else:
+            self.out.write(self._line(cells) + '\n' + self._rule() + '\n')
+        self.rows += 1
+        if self.page_size and self.rows % self.page_size == 0:
+            self.out.flush()
+            answer = input(f"-- {self.rows} rows shown; Enter for more, q to stop -- ")
+            if answer.strip().lower().startswith('q'):
+                self.stopped = True
+        return not self.stopped
+
+    def add(self, row):
+        """ Add one row; returns False once the reader has asked to stop """
+        if self.stopped:
+            return False
+        cells = self._cells(row)
+        if self.plain:
+            if self.rows == 0:
+                self.out.write('\t'.join(self.headers) + '\n')
+            return self._emit(cells)
+        if self.widths is None:
+            self.sample.append(cells)
+            if len(self.sample) >= self.sample_size:
+                self._start()
+            return not self.stopped
+        return self._emit(cells)
+
+    def close(self):
+        """ Print anything still held back for width sampling """
+        if self.plain:
+            if self.rows == 0:
+                self.out.write('\t'.join(self.headers) + '\n')
+        elif self.widths is None:
+            self._start()
+        self.out.flush()
+        return self.rows
+
+def render_table(headers, rows, **options):
+    """ Stream rows (any iterable) through a StreamingTable; returns the number shown """
+    table = StreamingTable(headers, **options)
+    for row in rows:
+        if not table.add(row):
+            break
+    return table.close()
+
+def display_vehicle_info(vehicle_info, plain=None):
     """ Display vehicle information in a formatted table """
+    if is_unavailable(vehicle_info):
+        print(f"{Fore.RED}[!] Vehicle information unavailable: no source could answer for this vehicle{Style.RESET_ALL}")
+        return
     if not vehicle_info:
         print(f"{Fore.RED}[!] No vehicle information to display!")
         return
     
-    # Prepare data for tabulate
-    data = []
-    for key, value in vehicle_info.items():
-        # Format key for display
-        formatted_key = key.replace('_', ' ').title()
-        data.append([formatted_key, value])
+    # Merged records also show where each field came from
+    field_sources = vehicle_info.get('field_sources')
+    headers = ["Field", "Value", "Source"] if field_sources is not None else ["Field", "Value"]
+    
+    def rows():
+        for key, value in vehicle_fields(vehicle_info):
+            # Format key for display
+            formatted_key = key.replace('_', ' ').title()
+            if field_sources is not None:
+                yield [formatted_key, value, field_sources.get(key, '-')]
+            else:
+                yield [formatted_key, value]
     
     # Display the table
     print(f"\n{Fore.CYAN}[+] VEHICLE INFORMATION{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{'='*50}{Style.RESET_ALL}")
-    print(tabulate(data, headers=["Field", "Value"], tablefmt="grid"))
+    render_table(headers, rows(), plain=plain, max_width=80)
     print(f"{Fore.CYAN}{'='*50}{Style.RESET_ALL}\n")
 
-def display_challan_info(challan_data):
-    """ Display challan information in a formatted table """
+def display_challan_info(challan_data, page_size=None, plain=None):
+    """ Display challan information in a formatted table
+    Rows are streamed, so long challan lists start printing at once; page_size
+    pauses after every page on a terminal (0 for one screenful) """
+    # Checked first: Unavailable is falsy but must not read as a clean record
+    if is_unavailable(challan_data):
+        print(f"{Fore.RED}[!] Challan data unavailable: no source could answer for this vehicle{Style.RESET_ALL}")
+        return
     if not challan_data:
         print(f"{Fore.GREEN}[+] No challans found for this vehicle!")
         return
     
-    # Prepare data for tabulate
     headers = ["Challan No", "Issue Date", "Offence Date", "Place", "Section", "Description", "Amount", "Status"]
-    data = []
     
-    for challan in challan_data:
-        row = [
-            challan.get('challan_number', 'N/A'),
-            challan.get('issue_date', 'N/A'),
-            challan.get('offence_date', 'N/A'),
-            challan.get('offence_place', 'N/A'),
-            challan.get('offence_section', 'N/A'),
-            challan.get('offence_desc', 'N/A'),
-            f"₹{challan.get('amount', '0')}",
-            challan.get('payment_status', 'N/A')
-        ]
-        data.append(row)
+    def rows():
+        for challan in challan_data:
+            yield [
+                challan.get('challan_number', 'N/A'),
+                challan.get('issue_date', 'N/A'),
+                challan.get('offence_date', 'N/A'),
+                challan.get('offence_place', 'N/A'),
+                challan.get('offence_section', 'N/A'),
+                challan.get('offence_desc', 'N/A'),
+                f"₹{challan.get('amount', '0')}",
+                challan.get('payment_status', 'N/A')
+            ]
     
     # Display the table
     print(f"\n{Fore.CYAN}[+] CHALLAN INFORMATION{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{'='*120}{Style.RESET_ALL}")
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+    render_table(headers, rows(), page_size=page_size, plain=plain)
     print(f"{Fore.CYAN}{'='*120}{Style.RESET_ALL}\n")
 
+# Challan fields of a text report: (label, key, default)
+REPORT_CHALLAN_FIELDS = [
+    ("Challan Number", 'challan_number', 'N/A'),
+    ("Issue Date", 'issue_date', 'N/A'),
+    ("Offence Date", 'offence_date', 'N/A'),
+    ("Offence Time", 'offence_time', 'N/A'),
+    ("Offence Place", 'offence_place', 'N/A'),
+    ("Offence Section", 'offence_section', 'N/A'),
+    ("Offence Description", 'offence_desc', 'N/A'),
+    ("Amount", 'amount', '0'),
+    ("Payment Status", 'payment_status', 'N/A'),
+    ("Payment Date", 'payment_date', 'N/A'),
+    ("Court Name", 'court_name', 'N/A'),
+    ("Court Address", 'court_address', 'N/A'),
+]
+
+class ReportTemplate:
+    """ Text report layout compiled into format strings once
+    The vehicle section is compiled per distinct field list (records from one source
+    share it), so rendering a report is a handful of str.format calls. """
+
+    def __init__(self):
+        rule = "=" * 80
+        self.header = '\n'.join([rule, "VEHICLE INFORMATION REPORT", rule,
+                                 "Generated on: {0}", "Vehicle Registration: {1}", "\n",
+                                 "VEHICLE DETAILS:", "-" * 40, ""])
+        self.challan_header = '\n'.join(["", "\n", "CHALLAN DETAILS:", "-" * 40, ""])
+        self.no_challans = "No challans found for this vehicle."
+        self.challans_unavailable = "Challan data unavailable: no source could answer for this vehicle."
+        self.challan = '\n'.join(["\nChallan #{0}:"] + [
+            f"  {label}: {prefix}{{{i}}}"
+            for i, (label, key, default) in enumerate(REPORT_CHALLAN_FIELDS, 1)
+            for prefix in ['₹' if key == 'amount' else '']])
+        self.challan_defaults = [(key, default) for label, key, default in REPORT_CHALLAN_FIELDS]
+        self.footer = '\n'.join(["", "\n", rule, "END OF REPORT", rule])
+        self._vehicle_sections = {}
+
+    def _vehicle_section(self, keys):
+        section = self._vehicle_sections.get(keys)
+        if section is None:
+            section = '\n'.join(f"{key.replace('_', ' ').title().replace('{', '{{').replace('}', '}}')}: {{{i}}}"
+                                for i, key in enumerate(keys))
+            self._vehicle_sections[keys] = section
+        return section
+
+    def render(self, vehicle_info, challan_data, generated_on=None):
+        """ Render one report (same text as save_to_file writes) """
+        generated_on = generated_on or datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+        fields = vehicle_fields(vehicle_info)
+        parts = [self.header.format(generated_on, vehicle_info.get('registration_number', 'N/A')),
+                 self._vehicle_section(tuple(key for key, value in fields)).format(*[value for key, value in fields]),
+                 self.challan_header]
+        if is_unavailable(challan_data):
+            parts.append(self.challans_unavailable)
+        elif not challan_data:
+            parts.append(self.no_challans)
+        else:
+            defaults = self.challan_defaults
+            parts.append('\n'.join(self.challan.format(i, *[challan.get(key, default) for key, default in defaults])
+                                   for i, challan in enumerate(challan_data, 1)))
+        parts.append(self.footer)
+        return ''.join(parts)
+
+REPORT_TEMPLATE = ReportTemplate()
+
 def save_to_file(vehicle_info, challan_data, filename=None):
     """ Save vehicle and challan information to a file """
     try:
@@ -895,53 +2556,11 @@ def save_to_file(vehicle_info, challan_data, filename=None):
             filename = f"{reg_no}_{timestamp}.txt"
         
         # Create the report
-        report = []
-        report.append("=" * 80)
-        report.append("VEHICLE INFORMATION REPORT")
-        report.append("=" * 80)
-        report.append(f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M:%S')}")
-        report.append(f"Vehicle Registration: {vehicle_info.get('registration_number', 'N/A')}")
-        report.append("\n")
-        
-        # Add vehicle information
-        report.append("VEHICLE DETAILS:")
-        report.append("-" * 40)
-        for key, value in vehicle_info.items():
-            formatted_key = key.replace('_', ' ').title()
-            report.append(f"{formatted_key}: {value}")
-        
-        report.append("\n")
-        
-        # Add challan information
-        report.append("CHALLAN DETAILS:")
-        report.append("-" * 40)
-        
-        if not challan_data:
-            report.append("No challans found for this vehicle.")
-        else:
-            for i, challan in enumerate(challan_data, 1):
-                report.append(f"\nChallan #{i}:")
-                report.append(f"  Challan Number: {challan.get('challan_number', 'N/A')}")
-                report.append(f"  Issue Date: {challan.get('issue_date', 'N/A')}")
-                report.append(f"  Offence Date: {challan.get('offence_date', 'N/A')}")
-                report.append(f"  Offence Time: {challan.get('offence_time', 'N/A')}")
-                report.append(f"  Offence Place: {challan.get('offence_place', 'N/A')}")
-                report.append(f"  Offence Section: {challan.get('offence_section', 'N/A')}")
-                report.append(f"  Offence Description: {challan.get('offence_desc', 'N/A')}")
-                report.append(f"  Amount: ₹{challan.get('amount', '0')}")
-                report.append(f"  Payment Status: {challan.get('payment_status', 'N/A')}")
-                report.append(f"  Payment Date: {challan.get('payment_date', 'N/A')}")
-                report.append(f"  Court Name: {challan.get('court_name', 'N/A')}")
-                report.append(f"  Court Address: {challan.get('court_address', 'N/A')}")
-        
-        report.append("\n")
-        report.append("=" * 80)
-        report.append("END OF REPORT")
-        report.append("=" * 80)
+        report = REPORT_TEMPLATE.render(vehicle_info, challan_data)
         
         # Write to file
         with open(filename, 'w') as f:
-            f.write('\n'.join(report))
+            f.write(report)
         
         print(f"{Fore.GREEN}[+] Report saved to {filename}")
         return filename
@@ -965,7 +2584,7 @@ def export_to_csv(vehicle_info, challan_data, filename=None):
             # Write vehicle information
             writer.writerow(['VEHICLE INFORMATION'])
             writer.writerow(['Field', 'Value'])
-            for key, value in vehicle_info.items():
+            for key, value in vehicle_fields(vehicle_info):
                 formatted_key = key.replace('_', ' ').title()
                 writer.writerow([formatted_key, value])
             
@@ -973,7 +2592,9 @@ def export_to_csv(vehicle_info, challan_data, filename=None):
             writer.writerow([])
             writer.writerow(['CHALLAN INFORMATION'])
             
-            if not challan_data:
+            if is_unavailable(challan_data):
+                writer.writerow(['Challan data unavailable: no source could answer for this vehicle'])
+            elif not challan_data:
                 writer.writerow(['No challans found for this vehicle'])
             else:
                 # Write headers
@@ -1032,48 +2653,2248 @@ def export_to_json(vehicle_info, challan_data, filename=None):
         print(f"{Fore.RED}[!] Error exporting to JSON: {str(e)}")
         return None
 
-def print_banner():
-    """ Print the application banner """
-    banner = f"""
-{Fore.CYAN}
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║            INDIAN VEHICLE INFORMATION & CHALLAN             ║
-║                        VERIFICATION TOOL                     ║
-║                                                              ║
-║                   Version 2.0 | Enhanced Edition             ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-{Style.RESET_ALL}
-    """
-    print(banner)
+# Export helpers keyed by the names accepted on the command line
+SAVE_FORMATS = {
+    'txt': save_to_file,
+    'csv': export_to_csv,
+    'json': export_to_json,
+}
 
-def main():
-    """ Main function to run the application """
-    print_banner()
+def run_lookup(plate_number, save_format=None, page_size=None, plain=None):
+    """ Look up vehicle and challan information for a single plate (non-interactive) """
+    if not validate_license_plate(plate_number):
+        print(f"{Fore.RED}[!] Invalid vehicle number format: {plate_number}{Style.RESET_ALL}")
+        return None
     
-    try:
-        while True:
-            print(f"\n{Fore.CYAN}[+] Main Menu{Style.RESET_ALL}")
-            print("1. Check Vehicle Information")
-            print("2. Check Challan Information")
-            print("3. Check Both Vehicle & Challan Information")
-            print("4. Exit")
-            
-            choice = input(f"\n{Fore.YELLOW}[+] Enter your choice (1-4): {Style.RESET_ALL}")
-            
-            if choice == '1':
-                # Vehicle Information Only
-                plate_number = input(f"{Fore.YELLOW}[+] Enter Vehicle Registration Number: {Style.RESET_ALL}")
-                if not validate_license_plate(plate_number):
-                    print(f"{Fore.RED}[!] Invalid vehicle number format! Please try again.{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}[+] Fetching vehicle and challan information...{Style.RESET_ALL}")
+    result = fetch_vehicle_and_challan(plate_number)
+    vehicle_info = result['vehicle_info']
+    challan_data = result['challan_data']
+    
+    display_vehicle_info(vehicle_info, plain)
+    display_challan_info(challan_data, page_size, plain)
+    
+    if save_format:
+        if is_unavailable(vehicle_info) and is_unavailable(challan_data):
+            print(f"{Fore.RED}[!] Nothing to save: no source could answer for {plate_number.upper()}{Style.RESET_ALL}")
+        else:
+            SAVE_FORMATS[save_format](vehicle_info or {'registration_number': plate_number.upper()},
+                                      challan_data if challan_data is not None else [], None)
+    
+    return vehicle_info, challan_data
+
+def read_plate_file(filename):
+    """ Yield plate numbers from a text file (one per line, '#' starts a comment) """
+    with open(filename, 'r') as f:
+        for line in f:
+            plate = line.split('#', 1)[0].strip()
+            if plate:
+                yield plate
+
+class BloomFilter:
+    """ Fixed-size approximate set: no false negatives, false positives at about error_rate
+    once capacity items have been added
+    Blocked layout: all of a key's bits fall in one 64-bit word, so an add is one
+    hash, one word read and at most one word write. Blocking costs some accuracy,
+    so the filter is sized for half the requested error rate. """
+
+    def __init__(self, capacity, error_rate=0.001):
+        size = max(64, int(-capacity * math.log(error_rate / 2) / math.log(2) ** 2))
+        # Each bit position takes 6 bits of the 64-bit half of the digest
+        self.hashes = min(10, max(1, round(size / capacity * math.log(2))))
+        self.blocks = (size + 63) // 64
+        self.words = memoryview(bytearray(self.blocks * 8)).cast('Q')
+
+    def add(self, key):
+        """ Add key (bytes); returns True if it was (probably) already present """
+        digest = int.from_bytes(hashlib.blake2b(key, digest_size=16).digest(), 'little')
+        block = (digest >> 64) % self.blocks
+        mask = 0
+        for _ in range(self.hashes):
+            mask |= 1 << (digest & 63)
+            digest >>= 6
+        word = self.words[block]
+        if word & mask == mask:
+            return True
+        self.words[block] = word | mask
+        return False
+
+class PlateReader:
+    """ Stream the plates of a (possibly huge) input file once each
+    The file is memory-mapped and scanned line by line without loading it, each
+    plate is normalized as it is read and repeats of a plate already seen are
+    dropped here, before they can reach the lookup stages. Exact deduplication
+    keeps each normalized plate packed into a single int; with capacity set a
+    BloomFilter bounds memory instead, at the cost of dropping about error_rate
+    of the unique plates as false duplicates. Yields plates in their original
+    spelling; counts are in read / unique / duplicates. """
+
+    def __init__(self, filename, dedup=True, capacity=None, error_rate=0.001):
+        self.filename = filename
+        self.dedup = dedup
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.read = 0
+        self.unique = 0
+        self.duplicates = 0
+
+    def _lines(self):
+        with open(self.filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from iter(mapped.readline, b'')
+
+    def __iter__(self):
+        bloom = BloomFilter(self.capacity, self.error_rate) if self.dedup and self.capacity else None
+        seen = set()
+        # Plates are normalized as bytes (cf. normalize_plate) and only kept ones are decoded
+        for line in self._lines():
+            if b'#' in line:
+                line = line.split(b'#', 1)[0]
+            plate = line.strip()
+            if not plate:
+                continue
+            self.read += 1
+            if self.dedup:
+                key = plate.upper().translate(None, b' -')
+                if bloom is not None:
+                    repeat = bloom.add(key)
+                else:
+                    # Base 36 packs an alphanumeric plate of up to 12 characters into
+                    # 63 bits; the length (4 bits) keeps e.g. "0A" and "A" apart. Longer
+                    # keys would overflow the length bits, so they stay bytes
+                    size = len(seen)
+                    seen.add(int(key, 36) << 4 | len(key) if len(key) <= 12 and key.isalnum() else key)
+                    repeat = len(seen) == size
+                if repeat:
+                    self.duplicates += 1
                     continue
-                
-                print(f"{Fore.YELLOW}[+] Fetching vehicle information...{Style.RESET_ALL}")
-                vehicle_info = get_vehicle_info_from_vahan(plate_number)
-                
-                if vehicle_info:
-                    display_vehicle_info(vehicle_info)
+            self.unique += 1
+            yield plate.decode('utf-8', 'replace')
+
+    def duplicate_rate(self):
+        return self.duplicates / self.read if self.read else 0.0
+
+    def report(self):
+        """ Print how many input lines were repeats """
+        print(f"{Fore.CYAN}[+] Read {self.read} plates: {self.unique} unique, {self.duplicates} duplicates "
+              f"({self.duplicate_rate() * 100:.1f}%){Style.RESET_ALL}")
+
+def lookup_record(plate_number):
+    """ Look up one plate and build the stored result record for it """
+    result = fetch_vehicle_and_challan(plate_number, use_cache=LOOKUP_OPTIONS['cache'])
+    return {
+        'plate': plate_number.upper(),
+        'status': result['status'],
+        'sources': {kind: part['source'] for kind, part in result['parts'].items()},
+        'vehicle_info': result['vehicle_info'],
+        'challan_data': result['challan_data'],
+        'generated_on': datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+    }
+
+class CheckpointJournal:
+    """ Append-only progress journal of a batch run
+    One short line per finished plate: plate, status and the byte range of its
+    result in the output file. Lines are flushed as written and fsynced every
+    sync_every plates, so a crash loses at most the plates not yet synced. """
+
+    def __init__(self, path, sync_every=100):
+        self.path = path
+        self.sync_every = sync_every
+        # Only the status is kept per plate (interned), so a million-plate run stays small
+        self.entries = {}
+        self._end = 0
+        self._pending = 0
+        self._file = None
+
+    def load(self):
+        """ Read an existing journal; returns {plate: status} """
+        self.entries = {}
+        self._end = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('\t')
+                    if len(parts) != 4 or not line.endswith('\n'):
+                        continue  # torn last line
+                    plate, status, offset, length = parts
+                    self.entries[plate] = sys.intern(status)
+                    self._end = max(self._end, int(offset) + int(length))
+        return self.entries
+
+    def open(self, fresh=False):
+        self._file = open(self.path, 'w' if fresh else 'a')
+        if fresh:
+            self.entries = {}
+            self._end = 0
+
+    def record(self, plate, status, offset=0, length=0):
+        self.entries[plate] = sys.intern(status)
+        self._end = max(self._end, offset + length)
+        self._file.write(f"{plate}\t{status}\t{offset}\t{length}\n")
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        if self._file and self._pending:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def is_done(self, plate):
+        """ Finished plates are skipped on resume; failed and partial ones are retried """
+        return self.entries.get(plate) in ('ok', 'invalid')
+
+    def result_end(self):
+        """ End of the last journaled result in the output file """
+        return self._end
+
+    def close(self):
+        if self._file:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+def run_batch(input_file, output_file, report_dir=None, fresh=False, workers=1, queue_size=64, dedup_capacity=None):
+    """ Look up every plate in input_file and write one JSON result per line to output_file
+    Repeated plates are dropped as the file is read (approximately, in bounded memory,
+    with dedup_capacity). Progress is journaled to output_file + '.journal'; rerunning
+    the same command skips finished plates and retries only failed or unfinished ones.
+    With more than one worker the plates go through the bounded LookupPipeline. """
+    stats = {'total': 0, 'ok': 0, 'failed': 0, 'invalid': 0, 'skipped': 0, 'duplicates': 0}
+    started = time.time()
+    journal = CheckpointJournal(output_file + '.journal')
+    reader = PlateReader(input_file, capacity=dedup_capacity)
+    
+    try:
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+        
+        resume = not fresh and os.path.exists(output_file) and journal.load()
+        if resume:
+            done = sum(1 for plate in journal.entries if journal.is_done(plate))
+            print(f"{Fore.YELLOW}[+] Resuming batch: {done} plates already finished{Style.RESET_ALL}")
+            # Drop any result written after the last journaled one (torn or unjournaled)
+            with open(output_file, 'ab') as out:
+                out.truncate(journal.result_end())
+        journal.open(fresh=not resume)
+        
+        with open(output_file, 'ab' if resume else 'wb') as out:
+            def write_result(plate_key, plate_number, record, line):
+                offset = out.tell()
+                out.write(line)
+                out.flush()
+                journal.record(plate_key, record['status'], offset, len(line))
+                
+                if record['status'] == 'ok':
+                    stats['ok'] += 1
+                else:
+                    stats['failed'] += 1
+                
+                if report_dir and record['vehicle_info']:
+                    reg_no = plate_number.upper().replace(' ', '_')
+                    challan_data = record['challan_data']
+                    save_to_file(record['vehicle_info'], challan_data if challan_data is not None else [],
+                                 os.path.join(report_dir, f"{reg_no}.txt"))
+            
+            def write_invalid(plate_key, plate_number):
+                print(f"{Fore.RED}[!] Skipping invalid vehicle number: {plate_number}{Style.RESET_ALL}")
+                stats['invalid'] += 1
+                journal.record(plate_key, 'invalid')
+            
+            if workers > 1:
+                def sink(kind, plate_key, plate_number, record, line):
+                    if kind == 'invalid':
+                        write_invalid(plate_key, plate_number)
+                    else:
+                        write_result(plate_key, plate_number, record, line)
+                
+                pipeline = LookupPipeline(workers, queue_size=queue_size, skip=journal.is_done)
+                try:
+                    report = pipeline.run(reader, sink)
+                finally:
+                    stats['total'] = pipeline.counts['read']
+                    stats['skipped'] = pipeline.counts['skipped']
+                display_pipeline_report(report)
+            else:
+                for plate_number in reader:
+                    stats['total'] += 1
+                    plate_key = normalize_plate(plate_number)
+                    if journal.is_done(plate_key):
+                        stats['skipped'] += 1
+                        continue
+                    
+                    if not validate_license_plate(plate_number):
+                        write_invalid(plate_key, plate_number)
+                        continue
+                    
+                    print(f"{Fore.CYAN}[+] ({stats['total']}) {plate_number.upper()}{Style.RESET_ALL}")
+                    record = lookup_record(plate_number)
+                    write_result(plate_key, plate_number, record, (json.dumps(record) + '\n').encode('utf-8'))
+    
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}[+] Batch interrupted; run the same command again to resume{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error during batch run: {str(e)}{Style.RESET_ALL}")
+    finally:
+        journal.close()
+    
+    stats['duplicates'] = reader.duplicates
+    elapsed = time.time() - started
+    reader.report()
+    print(f"\n{Fore.GREEN}[+] Batch finished: {stats['ok']} ok, {stats['failed']} failed, "
+          f"{stats['invalid']} invalid, {stats['skipped']} already done of {stats['total']} plates "
+          f"in {elapsed:.1f}s{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}[+] Results written to {output_file}{Style.RESET_ALL}")
+    return stats
+
+# Bulk report rendering: result lines -> worker processes -> report files or one archive
+REPORT_CHUNK_SIZE = 500
+
+def report_name(record):
+    """ File name of a record's text report """
+    vehicle_info = record.get('vehicle_info') or {}
+    reg_no = record.get('plate') or vehicle_info.get('registration_number') or 'UNKNOWN'
+    return reg_no.upper().replace(' ', '_') + '.txt'
+
+def render_report_chunk(lines, report_dir=None, chunk_index=0):
+    """ Render the reports of a chunk of result lines (runs in a worker process)
+    With report_dir each report is written there with a single write under a
+    temporary name and (name, temporary path) pairs come back, so the caller can
+    give duplicate plates distinct final names in input order; otherwise (name,
+    bytes) pairs are returned for the archive.
+    Returns (reports, render_seconds, write_seconds) """
+    started = time.perf_counter()
+    rendered = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        vehicle_info = record.get('vehicle_info')
+        if not vehicle_info or is_unavailable(vehicle_info):
+            continue
+        challan_data = record.get('challan_data')
+        if not (isinstance(challan_data, list) or is_unavailable(challan_data)):
+            challan_data = []
+        text = REPORT_TEMPLATE.render(vehicle_info, challan_data, record.get('generated_on'))
+        rendered.append((report_name(record), text.encode('utf-8')))
+    render_seconds = time.perf_counter() - started
+    if report_dir is None:
+        return rendered, render_seconds, 0.0
+    
+    started = time.perf_counter()
+    written = []
+    try:
+        for position, (name, data) in enumerate(rendered):
+            path = os.path.join(report_dir, f".{chunk_index}-{position}.report.part")
+            written.append((name, path))
+            with open(path, 'wb') as f:
+                f.write(data)
+    except BaseException:
+        # A half-written chunk is never handed back, so nothing else would remove its files
+        for name, path in written:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+    return written, render_seconds, time.perf_counter() - started
+
+def remove_report_parts(report_dir):
+    """ Delete the temporary files of reports that were rendered but never renamed """
+    if not os.path.isdir(report_dir):
+        return
+    with os.scandir(report_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') and entry.name.endswith('.report.part'):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+def iter_result_chunks(result_files, chunk_size):
+    """ Raw result lines of the given files in lists of up to chunk_size """
+    for filename in result_files:
+        with open(filename, 'r') as f:
+            while True:
+                chunk = list(itertools.islice(f, chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+
+def run_bulk_reports(result_files, report_dir=None, archive=None, workers=None,
+                     chunk_size=REPORT_CHUNK_SIZE, compress=False):
+    """ Render a text report for every stored result
+    Reports go to report_dir as one file per vehicle (written by the workers) or into
+    a single zip archive whose central directory indexes them by name. Both name a
+    plate that appears more than once the same way: PLATE.txt, PLATE_2.txt, ... in
+    input order. workers=1 renders in this process, which gives the serial baseline
+    for the benchmark. """
+    workers = workers or os.cpu_count() or 2
+    stats = {'reports': 0, 'chunks': 0, 'render_seconds': 0.0, 'write_seconds': 0.0}
+    names = {}
+    zf = None
+    target = None
+    finished = False
+    started = time.perf_counter()
+    
+    def unique_name(name):
+        # A plate looked up twice keeps both reports
+        seen = names.get(name, 0)
+        names[name] = seen + 1
+        if not seen:
+            return name
+        base, ext = os.path.splitext(name)
+        return f"{base}_{seen + 1}{ext}"
+    
+    def handle(result):
+        reports, render_seconds, write_seconds = result
+        stats['chunks'] += 1
+        stats['reports'] += len(reports)
+        stats['render_seconds'] += render_seconds
+        stats['write_seconds'] += write_seconds
+        write_started = time.perf_counter()
+        for name, payload in reports:
+            if zf is None:
+                # payload is the worker's temporary file; renaming it is metadata only
+                os.replace(payload, os.path.join(target, unique_name(name)))
+            else:
+                zf.writestr(unique_name(name), payload)
+        stats['write_seconds'] += time.perf_counter() - write_started
+    
+    try:
+        if archive:
+            zf = zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+            target = None
+        else:
+            target = report_dir or 'reports'
+            os.makedirs(target, exist_ok=True)
+        
+        chunks = iter_result_chunks(result_files, chunk_size)
+        if workers == 1:
+            for index, chunk in enumerate(chunks):
+                handle(render_report_chunk(chunk, target, index))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Keep a bounded number of chunks in flight, in input order
+                pending = deque()
+                for index, chunk in enumerate(chunks):
+                    pending.append(pool.submit(render_report_chunk, chunk, target, index))
+                    if len(pending) >= workers * 2:
+                        handle(pending.popleft().result())
+                while pending:
+                    handle(pending.popleft().result())
+        finished = True
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error rendering reports: {str(e)}{Style.RESET_ALL}")
+        return None
+    finally:
+        if zf is not None:
+            zf.close()
+        # After a failure, chunks that finished but were never handled leave their files behind
+        if target is not None and not finished:
+            remove_report_parts(target)
+    
+    stats['wall_seconds'] = round(time.perf_counter() - started, 3)
+    stats['reports_per_second'] = round(stats['reports'] / stats['wall_seconds'], 1) if stats['wall_seconds'] else 0.0
+    stats['workers'] = workers
+    display_report_benchmark(stats)
+    print(f"{Fore.GREEN}[+] Reports written to {archive or target}{Style.RESET_ALL}")
+    return stats
+
+def display_report_benchmark(stats):
+    """ Display throughput of a bulk report run """
+    headers = ["Workers", "Reports", "Wall (s)", "Reports/s", "Render CPU (s)", "Write (s)"]
+    row = [stats['workers'], stats['reports'], stats['wall_seconds'], stats['reports_per_second'],
+           round(stats['render_seconds'], 3), round(stats['write_seconds'], 3)]
+    print(f"\n{Fore.CYAN}[+] BULK REPORT BENCHMARK{Style.RESET_ALL}")
+    print(tabulate([row], headers=headers, tablefmt="grid"))
+
+# Distributed work queue (SQLite stand-in for a shared queue)
+WORK_QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    plates TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    plate TEXT PRIMARY KEY,
+    batch_id INTEGER,
+    status TEXT,
+    record TEXT,
+    worker TEXT,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_state ON batches (state, lease_expires);
+"""
+
+class WorkQueue:
+    """ Shared queue of plate batches leased by workers on any node
+    A lease must be renewed by heartbeats; once it expires the batch can be leased
+    again by another worker. Results are stored per plate, so a reassigned batch
+    only redoes the plates the previous holder had not finished. """
+
+    def __init__(self, db_path='work_queue.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(WORK_QUEUE_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params)
+
+    def enqueue(self, plates, batch_size=50):
+        """ Split plates into batches and add them to the queue; returns batches added """
+        batches = [plates[i:i + batch_size] for i in range(0, len(plates), batch_size)]
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany("INSERT INTO batches (plates, updated) VALUES (?, ?)",
+                                      [(json.dumps(batch), now) for batch in batches])
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return len(batches)
+
+    def lease(self, worker_id, lease_seconds=120):
+        """ Lease the next pending (or expired) batch; returns (batch_id, plates) or None """
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT id, plates FROM batches WHERE state = 'pending' "
+                    "OR (state = 'leased' AND lease_expires < ?) ORDER BY id LIMIT 1", (now,)).fetchone()
+                if row:
+                    self.conn.execute(
+                        "UPDATE batches SET state = 'leased', worker = ?, lease_expires = ?, "
+                        "attempts = attempts + 1, updated = ? WHERE id = ?",
+                        (worker_id, now + lease_seconds, now, row[0]))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return (row[0], json.loads(row[1])) if row else None
+
+    def heartbeat(self, batch_id, worker_id, lease_seconds=120):
+        """ Renew a lease; False means the lease was lost to another worker """
+        now = time.time()
+        cursor = self._execute(
+            "UPDATE batches SET lease_expires = ?, updated = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+            (now + lease_seconds, now, batch_id, worker_id))
+        return cursor.rowcount == 1
+
+    def finished_plates(self, plates):
+        placeholders = ','.join('?' * len(plates))
+        rows = self._execute(f"SELECT plate FROM results WHERE status = 'ok' AND plate IN ({placeholders})",
+                             [normalize_plate(plate) for plate in plates]).fetchall()
+        return {row[0] for row in rows}
+
+    def store_result(self, batch_id, worker_id, record):
+        self._execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                      (normalize_plate(record['plate']), batch_id, record['status'],
+                       json.dumps(record), worker_id, time.time()))
+
+    def complete(self, batch_id, worker_id):
+        cursor = self._execute("UPDATE batches SET state = 'done', lease_expires = NULL, updated = ? "
+                               "WHERE id = ? AND worker = ?", (time.time(), batch_id, worker_id))
+        return cursor.rowcount == 1
+
+    def progress(self):
+        """ Batch counts by state (expired leases are reported separately) plus stored results """
+        now = time.time()
+        counts = {'pending': 0, 'leased': 0, 'expired': 0, 'done': 0}
+        rows = self._execute(
+            "SELECT CASE WHEN state = 'leased' AND lease_expires < ? THEN 'expired' ELSE state END, COUNT(*) "
+            "FROM batches GROUP BY 1", (now,)).fetchall()
+        counts.update(dict(rows))
+        counts['results'] = self._execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        counts['workers'] = self._execute(
+            "SELECT COUNT(DISTINCT worker) FROM batches WHERE state = 'leased' AND lease_expires >= ?",
+            (now,)).fetchone()[0]
+        return counts
+
+    def merge(self, output_file):
+        """ Write every worker's results into one JSON-lines file """
+        count = 0
+        with open(output_file, 'w') as out:
+            for (record,) in self._execute("SELECT record FROM results ORDER BY batch_id, plate"):
+                out.write(record + '\n')
+                count += 1
+        return count
+
+class LeaseHeartbeat:
+    """ Background thread renewing a batch lease until stopped """
+
+    def __init__(self, work_queue, batch_id, worker_id, lease_seconds):
+        self.work_queue = work_queue
+        self.batch_id = batch_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='vech-heartbeat', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.lease_seconds / 3.0):
+            try:
+                if not self.work_queue.heartbeat(self.batch_id, self.worker_id, self.lease_seconds):
+                    self.lost.set()
+                    return
+            except sqlite3.Error:
+                continue  # transient lock contention; the next beat retries
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+def run_worker(queue_path, worker_id=None, lease_seconds=120, poll_interval=5.0):
+    """ Lease plate batches from the shared queue and look them up until the queue is drained """
+    worker_id = worker_id or f"{os.uname().nodename if hasattr(os, 'uname') else 'node'}-{os.getpid()}"
+    work_queue = WorkQueue(queue_path)
+    done_batches = 0
+    print(f"{Fore.GREEN}[+] Worker {worker_id} started on {queue_path}{Style.RESET_ALL}")
+    
+    try:
+        while True:
+            lease = work_queue.lease(worker_id, lease_seconds)
+            if lease is None:
+                progress = work_queue.progress()
+                if progress['pending'] == 0 and progress['leased'] == 0 and progress['expired'] == 0:
+                    break
+                # Other workers hold the remaining batches; wait in case a lease expires
+                time.sleep(poll_interval)
+                continue
+            
+            batch_id, plates = lease
+            finished = work_queue.finished_plates(plates)
+            print(f"{Fore.CYAN}[+] Leased batch {batch_id}: {len(plates) - len(finished)} plates to do{Style.RESET_ALL}")
+            
+            with LeaseHeartbeat(work_queue, batch_id, worker_id, lease_seconds) as heartbeat:
+                for plate_number in plates:
+                    if heartbeat.lost.is_set():
+                        break
+                    if normalize_plate(plate_number) in finished:
+                        continue
+                    work_queue.store_result(batch_id, worker_id, lookup_record(plate_number))
+            
+            if heartbeat.lost.is_set():
+                print(f"{Fore.YELLOW}[+] Lease on batch {batch_id} expired; it will be reassigned{Style.RESET_ALL}")
+            elif work_queue.complete(batch_id, worker_id):
+                done_batches += 1
+    
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}[+] Worker stopped; its lease will expire and be reassigned{Style.RESET_ALL}")
+    finally:
+        work_queue.close()
+    
+    print(f"{Fore.GREEN}[+] Worker {worker_id} finished {done_batches} batches{Style.RESET_ALL}")
+    return done_batches
+
+def run_coordinator(queue_path, input_file=None, batch_size=50, wait=False, output_file=None, poll_interval=5.0):
+    """ Enqueue plates, report progress and merge worker results """
+    try:
+        work_queue = WorkQueue(queue_path)
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error opening work queue: {str(e)}{Style.RESET_ALL}")
+        return None
+    
+    try:
+        if input_file:
+            reader = PlateReader(input_file)
+            plates = [plate_number.upper() for plate_number in reader if validate_license_plate(plate_number)]
+            reader.report()
+            added = work_queue.enqueue(plates, batch_size)
+            print(f"{Fore.GREEN}[+] Enqueued {len(plates)} plates in {added} batches{Style.RESET_ALL}")
+        
+        progress = work_queue.progress()
+        while wait and (progress['pending'] or progress['leased'] or progress['expired']):
+            print(f"{Fore.YELLOW}[+] {progress['done']} done, {progress['leased']} leased by "
+                  f"{progress['workers']} workers, {progress['pending']} pending, "
+                  f"{progress['expired']} expired; {progress['results']} results{Style.RESET_ALL}")
+            time.sleep(poll_interval)
+            progress = work_queue.progress()
+        
+        print(f"{Fore.CYAN}[+] Queue status: {json.dumps(progress)}{Style.RESET_ALL}")
+        if output_file:
+            count = work_queue.merge(output_file)
+            print(f"{Fore.GREEN}[+] Merged {count} results into {output_file}{Style.RESET_ALL}")
+        return progress
+    except Exception as e:
+        print(f"{Fore.RED}[!] Coordinator error: {str(e)}{Style.RESET_ALL}")
+        return None
+    finally:
+        work_queue.close()
+
+# Fleet result index
+# Expiry fields that get a date index (stored as ISO dates so they sort)
+EXPIRY_FIELDS = ('insurance_upto', 'puc_upto', 'fitness_upto', 'registration_upto')
+# Payment statuses that count as outstanding
+OUTSTANDING_STATUSES = ('UNPAID', 'PENDING')
+
+FLEET_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vehicles (
+    plate TEXT PRIMARY KEY,
+    state_code TEXT,
+    owner_name TEXT,
+    maker TEXT,
+    model TEXT,
+    blacklist_status TEXT,
+    rc_status TEXT,
+    rc_active INTEGER,
+    insurance_upto TEXT,
+    puc_upto TEXT,
+    fitness_upto TEXT,
+    registration_upto TEXT
+);
+CREATE TABLE IF NOT EXISTS challans (
+    plate TEXT,
+    state_code TEXT,
+    challan_number TEXT,
+    issue_date TEXT,
+    offence_section TEXT,
+    offence_desc TEXT,
+    amount REAL,
+    payment_status TEXT
+);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    head TEXT,
+    offset INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_vehicles_state ON vehicles (state_code);
+CREATE INDEX IF NOT EXISTS idx_vehicles_blacklist ON vehicles (blacklist_status);
+CREATE INDEX IF NOT EXISTS idx_vehicles_rc_active ON vehicles (rc_active);
+CREATE INDEX IF NOT EXISTS idx_vehicles_insurance ON vehicles (insurance_upto);
+CREATE INDEX IF NOT EXISTS idx_vehicles_puc ON vehicles (puc_upto);
+CREATE INDEX IF NOT EXISTS idx_vehicles_fitness ON vehicles (fitness_upto);
+CREATE INDEX IF NOT EXISTS idx_vehicles_registration ON vehicles (registration_upto);
+CREATE INDEX IF NOT EXISTS idx_challans_plate ON challans (plate);
+CREATE INDEX IF NOT EXISTS idx_challans_state_status ON challans (state_code, payment_status);
+CREATE INDEX IF NOT EXISTS idx_challans_status ON challans (payment_status);
+CREATE INDEX IF NOT EXISTS idx_challans_section ON challans (offence_section);
+"""
+
+def parse_amount(value):
+    """ Parse a fine amount such as 500, '500', '₹1,000' or 'Rs. 200' (0.0 if unknown) """
+    if isinstance(value, (int, float)):
+        return float(value)
+    digits = re.sub(r'[^0-9.]', '', str(value or '')).strip('.')
+    try:
+        return float(digits) if digits else 0.0
+    except ValueError:
+        return 0.0
+
+def iso_date(value):
+    """ Record date as YYYY-MM-DD, or None """
+    parsed = parse_record_date(value)
+    return parsed.strftime('%Y-%m-%d') if parsed else None
+
+class FleetIndex:
+    """ SQLite store of batch results with secondary indexes for fleet queries
+    Result files are ingested incrementally: only lines appended since the last
+    ingest are read, and the newest result for a plate replaces older ones. """
+
+    def __init__(self, db_path='fleet_index.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(FLEET_INDEX_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _vehicle_row(self, plate, vehicle_info):
+        rc_status = str(vehicle_info.get('rc_status', 'N/A')).upper()
+        return (plate, plate[:2], vehicle_info.get('owner_name'), vehicle_info.get('maker'),
+                vehicle_info.get('model'), str(vehicle_info.get('blacklist_status', 'N/A')).upper(),
+                rc_status, None if rc_status in ('N/A', '') else int(rc_status == 'ACTIVE'),
+                *(iso_date(vehicle_info.get(field)) for field in EXPIRY_FIELDS))
+
+    def add_result(self, record):
+        """ Index one stored result (a line of a batch/scrape result file) """
+        plate = normalize_plate(record.get('plate') or (record.get('vehicle_info') or {}).get('registration_number', ''))
+        if not plate:
+            return False
+        vehicle_info = record.get('vehicle_info')
+        if vehicle_info and not is_unavailable(vehicle_info):
+            self.conn.execute("INSERT OR REPLACE INTO vehicles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                              self._vehicle_row(plate, vehicle_info))
+        challan_data = record.get('challan_data')
+        if isinstance(challan_data, list):
+            self.conn.execute("DELETE FROM challans WHERE plate = ?", (plate,))
+            self.conn.executemany("INSERT INTO challans VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [
+                (plate, plate[:2], challan.get('challan_number'), iso_date(challan.get('issue_date')),
+                 challan.get('offence_section'), challan.get('offence_desc'),
+                 parse_amount(challan.get('amount')), str(challan.get('payment_status', 'N/A')).upper())
+                for challan in challan_data])
+        return True
+
+    def ingest(self, filename):
+        """ Index the lines of a JSON-lines result file added since the last ingest """
+        path = os.path.abspath(filename)
+        with open(filename, 'rb') as f:
+            head = f.read(256).hex()
+            row = self.conn.execute("SELECT head, offset FROM ingested_files WHERE path = ?", (path,)).fetchone()
+            # A rewritten file starts over; an appended one resumes where we stopped
+            offset = row[1] if row and row[0] == head and row[1] <= os.path.getsize(filename) else 0
+            f.seek(offset)
+            count = 0
+            with self.conn:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # partially written line; pick it up next time
+                    offset += len(line)
+                    try:
+                        if self.add_result(json.loads(line)):
+                            count += 1
+                    except ValueError:
+                        continue
+                self.conn.execute("INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?)", (path, head, offset))
+        return count
+
+    def _state_filter(self, state, column='state_code'):
+        return (f" AND {column} = ?", [state.upper()]) if state else ("", [])
+
+    def outstanding_by_state(self, state=None):
+        where, params = self._state_filter(state)
+        placeholders = ','.join('?' * len(OUTSTANDING_STATUSES))
+        return self.conn.execute(
+            f"SELECT state_code, COUNT(DISTINCT plate), COUNT(*), SUM(amount) FROM challans "
+            f"WHERE payment_status IN ({placeholders}){where} GROUP BY state_code ORDER BY SUM(amount) DESC",
+            list(OUTSTANDING_STATUSES) + params).fetchall()
+
+    def flagged_vehicles(self, state=None, limit=100):
+        where, params = self._state_filter(state)
+        return self.conn.execute(
+            f"SELECT plate, owner_name, maker, model, blacklist_status, rc_status FROM vehicles "
+            f"WHERE blacklist_status = 'YES'{where} "
+            f"UNION SELECT plate, owner_name, maker, model, blacklist_status, rc_status FROM vehicles "
+            f"WHERE rc_active = 0{where} ORDER BY plate LIMIT ?",
+            params + params + [limit]).fetchall()
+
+    def top_sections(self, state=None, limit=10, outstanding_only=False):
+        where, params = self._state_filter(state)
+        if outstanding_only:
+            where += f" AND payment_status IN ({','.join('?' * len(OUTSTANDING_STATUSES))})"
+            params += list(OUTSTANDING_STATUSES)
+        return self.conn.execute(
+            f"SELECT offence_section, MAX(offence_desc), COUNT(*), SUM(amount) FROM challans "
+            f"WHERE 1 = 1{where} GROUP BY offence_section ORDER BY SUM(amount) DESC LIMIT ?",
+            params + [limit]).fetchall()
+
+    def expiring(self, field, within_days=30, state=None, limit=100, include_expired=False):
+        if field not in EXPIRY_FIELDS:
+            raise ValueError(f"Unknown expiry field: {field}")
+        where, params = self._state_filter(state)
+        today = datetime.now().strftime('%Y-%m-%d')
+        until = datetime.fromordinal(datetime.now().toordinal() + within_days).strftime('%Y-%m-%d')
+        lower = "IS NOT NULL" if include_expired else ">= ?"
+        lower_params = [] if include_expired else [today]
+        return self.conn.execute(
+            f"SELECT plate, owner_name, maker, model, {field} FROM vehicles "
+            f"WHERE {field} {lower} AND {field} <= ?{where} ORDER BY {field} LIMIT ?",
+            lower_params + [until] + params + [limit]).fetchall()
+
+    def counts(self):
+        vehicles = self.conn.execute("SELECT COUNT(*) FROM vehicles").fetchone()[0]
+        challans = self.conn.execute("SELECT COUNT(*) FROM challans").fetchone()[0]
+        return vehicles, challans
+
+def run_query(query, result_files, index_path='fleet_index.db', state=None, field='insurance_upto',
+              within=30, limit=20, include_expired=False, as_json=False, outstanding_only=False):
+    """ Answer a fleet query from stored results, refreshing the index first """
+    try:
+        index = FleetIndex(index_path)
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error opening fleet index: {str(e)}{Style.RESET_ALL}")
+        return None
+    
+    try:
+        for filename in result_files:
+            if os.path.exists(filename):
+                added = index.ingest(filename)
+                if added and not as_json:
+                    print(f"{Fore.YELLOW}[+] Indexed {added} new results from {filename}{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.RED}[!] Result file not found: {filename}{Style.RESET_ALL}")
+        
+        if query == 'outstanding':
+            headers = ["State", "Vehicles", "Challans", "Outstanding (₹)"]
+            rows = index.outstanding_by_state(state)
+        elif query == 'flagged':
+            headers = ["Plate", "Owner", "Maker", "Model", "Blacklist", "RC Status"]
+            rows = index.flagged_vehicles(state, limit)
+        elif query == 'top-sections':
+            headers = ["Section", "Description", "Challans", "Amount (₹)"]
+            rows = index.top_sections(state, limit, outstanding_only)
+        else:
+            headers = ["Plate", "Owner", "Maker", "Model", field.replace('_', ' ').title()]
+            rows = index.expiring(field, within, state, limit, include_expired)
+        
+        if as_json:
+            print(json.dumps([dict(zip(headers, row)) for row in rows], indent=2))
+        else:
+            vehicles, challans = index.counts()
+            print(f"\n{Fore.CYAN}[+] {query.upper()} ({vehicles} vehicles, {challans} challans indexed){Style.RESET_ALL}")
+            print(tabulate(rows, headers=headers, tablefmt="grid", floatfmt=".2f"))
+        return rows
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error running query: {str(e)}{Style.RESET_ALL}")
+        return None
+    finally:
+        index.close()
+
+def iter_result_rows(result_files, state=None):
+    """ One summary row per stored result, read lazily from JSON-lines result files """
+    for filename in result_files:
+        with open(filename, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                plate = record.get('plate', '')
+                if state and not plate.upper().startswith(state.upper()):
+                    continue
+                vehicle_info = record.get('vehicle_info') or {}
+                challan_data = record.get('challan_data')
+                challan_data = challan_data if isinstance(challan_data, list) else []
+                outstanding = sum(parse_amount(challan.get('amount')) for challan in challan_data
+                                  if str(challan.get('payment_status', '')).upper() in OUTSTANDING_STATUSES)
+                yield [plate, record.get('status', 'N/A'), vehicle_info.get('owner_name', 'N/A'),
+                       vehicle_info.get('maker', 'N/A'), vehicle_info.get('model', 'N/A'),
+                       vehicle_info.get('insurance_upto', 'N/A'), len(challan_data), f"{outstanding:.2f}"]
+
+def run_browse(result_files, state=None, page_size=0, plain=None):
+    """ Page through stored results one vehicle per row without loading the files """
+    headers = ["Plate", "Status", "Owner", "Maker", "Model", "Insurance Upto", "Challans", "Outstanding (₹)"]
+    try:
+        shown = render_table(headers, iter_result_rows(result_files, state), page_size=page_size, plain=plain)
+        if sys.stdout.isatty():
+            print(f"{Fore.GREEN}[+] {shown} vehicles shown{Style.RESET_ALL}")
+        return shown
+    except BrokenPipeError:
+        # The reader of a pipe (e.g. head) went away; point stdout at devnull so exit stays quiet
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return None
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error browsing results: {str(e)}{Style.RESET_ALL}")
+        return None
+
+# Expiry alerts
+# Days before an expiry date at which to alert (0 = on the day it lapses)
+ALERT_LEAD_DAYS = (30, 7, 1, 0)
+
+def parse_lead_days(spec):
+    """ '30,7,1,0' -> (30, 7, 1, 0) """
+    return tuple(int(days) for days in spec.split(',') if days.strip())
+
+def make_alert_hook(spec):
+    """ Build an alert hook from its command-line spec
+    http(s)://... POSTs {"alerts": [...]} to a local webhook, cmd:COMMAND runs a shell
+    command with one JSON alert per line on stdin, '-' prints to the console and
+    anything else (optionally file:PATH) appends JSON lines to a file. """
+    if spec.startswith(('http://', 'https://')):
+        def hook(alerts):
+            get_http_session().post(spec, json={'alerts': alerts}, timeout=5).raise_for_status()
+    elif spec.startswith('cmd:'):
+        def hook(alerts):
+            subprocess.run(spec[4:], shell=True, check=True, timeout=60, text=True,
+                           input=''.join(json.dumps(alert) + '\n' for alert in alerts))
+    elif spec == '-':
+        def hook(alerts):
+            for alert in alerts:
+                color = Fore.RED if alert['days_left'] <= 1 else Fore.YELLOW
+                when = (f"lapsed on {alert['expires']}" if alert['days_left'] < 0 else
+                        f"lapses on {alert['expires']} ({alert['days_left']} days left)")
+                print(f"{color}[!] {alert['plate']}: {alert['field'].replace('_', ' ')} {when}{Style.RESET_ALL}")
+    else:
+        path = spec[5:] if spec.startswith('file:') else spec
+        
+        def hook(alerts):
+            with open(path, 'a') as f:
+                f.write(''.join(json.dumps(alert) + '\n' for alert in alerts))
+    hook.spec = spec
+    return hook
+
+class ExpiryAlerts:
+    """ Time-ordered index of upcoming expiries across the fleet
+    A heap holds the next pending alert of every (plate, expiry field), keyed by the
+    day it is due, so what is due is a peek at the top rather than a scan of the
+    fleet. Refreshed vehicle records update it incrementally: a changed date pushes
+    a new event and the old one is dropped when it reaches the top. When an alert
+    fires, the event for its next (shorter) lead time is pushed; several lead times
+    that fall due together are collapsed into the shortest. Until hooks are
+    configured, update() is a no-op. """
+
+    def __init__(self, lead_days=ALERT_LEAD_DAYS, hooks=None):
+        self.configure(hooks or [], lead_days)
+        # plate -> [(expiry ordinal, last lead alerted or None) or None per EXPIRY_FIELDS]
+        self.tracked = {}
+        # (plate, field index) -> (expiry, lead) alerted in an earlier run, see load()
+        self.previously_sent = {}
+        self.heap = []
+        self.sent = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def configure(self, hooks, lead_days=ALERT_LEAD_DAYS):
+        self.hooks = list(hooks)
+        self.lead_days = sorted(set(lead_days), reverse=True)
+
+    @property
+    def enabled(self):
+        return bool(self.hooks)
+
+    def _due_lead(self, expiry, today, below=None):
+        """ Shortest lead (under below) already due today, else the next one to fall due """
+        leads = [lead for lead in self.lead_days if below is None or lead < below]
+        due = [lead for lead in leads if expiry - lead <= today]
+        if due:
+            return due[-1]
+        return leads[0] if leads else None
+
+    def _schedule(self, plate, index, expiry, today, below=None):
+        if expiry < today:
+            return False
+        lead = self._due_lead(expiry, today, below)
+        if lead is None:
+            return False
+        heapq.heappush(self.heap, (expiry - lead, plate, index, expiry, lead))
+        return expiry - lead <= today
+
+    def update(self, plate_number, vehicle_info, today=None):
+        """ Index the expiry dates of a freshly looked-up vehicle record """
+        if not self.enabled or not vehicle_info or is_unavailable(vehicle_info):
+            return
+        plate = normalize_plate(plate_number)
+        today = today or datetime.now().toordinal()
+        dates = [parse_record_date(vehicle_info.get(field)) for field in EXPIRY_FIELDS]
+        with self._cond:
+            slots = self.tracked.setdefault(plate, [None] * len(EXPIRY_FIELDS))
+            due_now = False
+            for index, date in enumerate(dates):
+                expiry = date.toordinal() if date else None
+                if (slots[index] or (None,))[0] == expiry:
+                    continue
+                if expiry is None:
+                    slots[index] = None
+                    continue
+                sent = self.previously_sent.pop((plate, index), None)
+                below = sent[1] if sent and sent[0] == expiry else None
+                slots[index] = (expiry, below)
+                due_now |= self._schedule(plate, index, expiry, today, below)
+            # Drop superseded events once they outnumber the live ones
+            if len(self.heap) > 2 * len(EXPIRY_FIELDS) * len(self.tracked) + 1024:
+                self._compact()
+            if due_now:
+                self._cond.notify()
+
+    def _live(self, event):
+        day, plate, index, expiry, lead = event
+        slot = self.tracked.get(plate, [None] * len(EXPIRY_FIELDS))[index]
+        return slot is not None and slot[0] == expiry and (slot[1] is None or lead < slot[1])
+
+    def _compact(self):
+        self.heap = [event for event in self.heap if self._live(event)]
+        heapq.heapify(self.heap)
+
+    def due(self, today=None):
+        """ Pop every alert due by today (a date ordinal) """
+        today = today or datetime.now().toordinal()
+        raised_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        alerts = []
+        with self._cond:
+            while self.heap and self.heap[0][0] <= today:
+                event = heapq.heappop(self.heap)
+                if not self._live(event):
+                    continue
+                day, plate, index, expiry, lead = event
+                # Lead times that went by unnoticed collapse into the shortest one due
+                lead = self._due_lead(expiry, today, lead + 1)
+                self.tracked[plate][index] = (expiry, lead)
+                self._schedule(plate, index, expiry, today, lead)
+                alerts.append({
+                    'plate': plate,
+                    'field': EXPIRY_FIELDS[index],
+                    'expires': datetime.fromordinal(expiry).strftime('%Y-%m-%d'),
+                    'days_left': expiry - today,
+                    'lead_days': lead,
+                    'raised_at': raised_at
+                })
+        return alerts
+
+    def dispatch(self, alerts):
+        """ Hand alerts to every hook; a failing hook does not stop the others """
+        if not alerts:
+            return 0
+        for hook in self.hooks:
+            try:
+                hook(alerts)
+            except Exception as e:
+                print(f"{Fore.RED}[!] Alert hook {hook.spec} failed: {str(e)}{Style.RESET_ALL}")
+                METRICS.inc('vech_alert_hook_errors_total', {'hook': hook.spec},
+                            help_text="Alert deliveries that failed by hook")
+        for alert in alerts:
+            METRICS.inc('vech_alerts_total', {'field': alert['field'], 'lead_days': alert['lead_days']},
+                        help_text="Expiry alerts raised by field and lead time")
+        self.sent += len(alerts)
+        return len(alerts)
+
+    def upcoming(self, limit=20):
+        """ The next pending alerts as (due, plate, field, expires, lead) without popping them """
+        with self._cond:
+            events = heapq.nsmallest(limit, filter(self._live, self.heap))
+        return [(datetime.fromordinal(day).strftime('%Y-%m-%d'), plate, EXPIRY_FIELDS[index],
+                 datetime.fromordinal(expiry).strftime('%Y-%m-%d'), lead)
+                for day, plate, index, expiry, lead in events]
+
+    def start(self, interval=60):
+        """ Deliver due alerts from a background thread (woken early by updates due today) """
+        def run():
+            while True:
+                with self._cond:
+                    if not self._stopped:
+                        self._cond.wait(interval)
+                    stopped = self._stopped
+                self.dispatch(self.due())
+                if stopped:
+                    return
+        
+        self._stopped = False
+        self._thread = threading.Thread(target=run, daemon=True, name='vech-alerts')
+        self._thread.start()
+
+    def stop(self):
+        """ Stop the background thread after a last delivery """
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+        self._thread = None
+
+    def load(self, path):
+        """ Remember which alerts an earlier run already sent (missing file is fine) """
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r') as f:
+            state = json.load(f)
+        with self._cond:
+            for plate, fields in state.items():
+                for field, (expires, lead) in fields.items():
+                    if field in EXPIRY_FIELDS:
+                        expiry = datetime.strptime(expires, '%Y-%m-%d').toordinal()
+                        self.previously_sent[(plate, EXPIRY_FIELDS.index(field))] = (expiry, lead)
+        return True
+
+    def save(self, path):
+        """ Store the alerts sent for expiries that have not lapsed yet """
+        today = datetime.now().toordinal()
+        with self._cond:
+            sent = dict(self.previously_sent)
+            for plate, slots in self.tracked.items():
+                for index, slot in enumerate(slots):
+                    if slot is not None and slot[1] is not None:
+                        sent[(plate, index)] = slot
+        state = {}
+        for (plate, index), (expiry, lead) in sent.items():
+            if expiry >= today:
+                state.setdefault(plate, {})[EXPIRY_FIELDS[index]] = [
+                    datetime.fromordinal(expiry).strftime('%Y-%m-%d'), lead]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, sort_keys=True)
+        os.replace(tmp_path, path)
+
+EXPIRY_ALERTS = ExpiryAlerts()
+
+def run_alerts(result_files, follow=False, interval=60, limit=20):
+    """ Index the expiry dates in stored results and deliver the alerts that are due
+    With follow, keep reading lines appended to the result files and deliver new
+    alerts as they fall due, until interrupted. """
+    offsets = {}
+    try:
+        while True:
+            indexed = 0
+            for filename in result_files:
+                if not os.path.exists(filename):
+                    continue
+                with open(filename, 'rb') as f:
+                    f.seek(offsets.get(filename, 0))
+                    for line in f:
+                        if not line.endswith(b'\n'):
+                            break  # partially written line; pick it up next time
+                        offsets[filename] = offsets.get(filename, 0) + len(line)
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        vehicle_info = record.get('vehicle_info')
+                        if isinstance(vehicle_info, dict):
+                            EXPIRY_ALERTS.update(record.get('plate') or vehicle_info.get('registration_number', ''),
+                                                 vehicle_info)
+                            indexed += 1
+            
+            sent = EXPIRY_ALERTS.dispatch(EXPIRY_ALERTS.due())
+            if indexed or sent or not follow:
+                print(f"{Fore.CYAN}[+] Indexed {indexed} records, sent {sent} alerts; "
+                      f"tracking {len(EXPIRY_ALERTS.tracked)} vehicles{Style.RESET_ALL}")
+            if not follow:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}[+] Stopped following results{Style.RESET_ALL}")
+    
+    upcoming = EXPIRY_ALERTS.upcoming(limit)
+    if upcoming:
+        print(f"\n{Fore.CYAN}[+] NEXT ALERTS{Style.RESET_ALL}")
+        print(tabulate(upcoming, headers=["Due", "Plate", "Field", "Expires", "Lead (days)"], tablefmt="grid"))
+    return EXPIRY_ALERTS.sent
+
+# Scraping pipeline: fetch threads -> bounded queue -> process-pool parsing
+def parse_scraped_page(step, kind, content, website, plate_number):
+    """ Parse one scraped page in a worker process
+    step 'form' extracts the lookup form, step 'result' extracts vehicle/challan data.
+    Returns (parsed, parse_seconds) """
+    started = time.perf_counter()
+    if step == 'form':
+        keywords = VEHICLE_FORM_KEYWORDS if kind == 'vehicle' else CHALLAN_FORM_KEYWORDS
+        parsed = extract_lookup_form(content, website, plate_number, keywords)
+    elif kind == 'vehicle':
+        parsed = parse_vehicle_details_html(content, plate_number)
+    else:
+        parsed = parse_challan_table_html(content) or None
+    return parsed, time.perf_counter() - started
+
+class StageStats:
+    """ Busy time and queue depth samples for one pipeline stage """
+
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy = 0.0
+        self.max_depth = 0
+        self.depth_total = 0
+        self.depth_samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.items += 1
+            self.busy += seconds
+
+    def sample_depth(self, depth):
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+            self.depth_total += depth
+            self.depth_samples += 1
+
+    def report(self, wall):
+        return {
+            'stage': self.name,
+            'workers': self.workers,
+            'items': self.items,
+            'busy_seconds': round(self.busy, 3),
+            'utilization': round(self.busy / (wall * self.workers), 3) if wall and self.workers else 0.0,
+            'avg_queue_depth': round(self.depth_total / self.depth_samples, 2) if self.depth_samples else 0.0,
+            'max_queue_depth': self.max_depth
+        }
+
+class ScrapePipeline:
+    """ High-concurrency scraping with HTML parsing offloaded to a process pool
+
+    Fetch threads only do network I/O and hand raw page bytes to a bounded parse
+    queue; dispatcher threads feed that queue to a process pool so BeautifulSoup
+    never holds the GIL of the fetch threads. When parsing falls behind, the parse
+    queue fills up and fetchers block (backpressure). The number of plates in
+    flight is capped, and the fetch queue is bounded by the same cap: each plate
+    in flight is a single task, so continuations queued by the workers themselves
+    never block on it. If the sink raises, no
+    more plates are submitted, the ones in flight finish without reaching the
+    sink and run() re-raises the error. """
+
+    def __init__(self, kind='vehicle', fetch_workers=16, parse_processes=None, queue_size=64, max_in_flight=None):
+        self.kind = kind
+        self.sites = VEHICLE_SCRAPE_SITES if kind == 'vehicle' else CHALLAN_SCRAPE_SITES
+        self.source = f"{kind}_scraping"
+        self.fetch_workers = fetch_workers
+        self.parse_processes = parse_processes or os.cpu_count() or 2
+        max_in_flight = max_in_flight or queue_size
+        self.fetch_queue = queue.Queue(maxsize=max_in_flight)
+        self.parse_queue = queue.Queue(maxsize=queue_size)
+        self.in_flight = threading.BoundedSemaphore(max_in_flight)
+        self.stats = {
+            'fetch': StageStats('fetch', fetch_workers),
+            'parse': StageStats('parse', self.parse_processes),
+            'sink': StageStats('sink', 1)
+        }
+        self._sink_lock = threading.Lock()
+        self._done = threading.Condition()
+        self._completed = 0
+        self._sink_error = None
+        self.found = 0
+
+    def _finish(self, plate_number, result, sink):
+        started = time.perf_counter()
+        try:
+            with self._sink_lock:
+                if self._sink_error is None:
+                    sink(plate_number, result)
+                    if result is not None:
+                        self.found += 1
+        except Exception as e:
+            log_event('pipeline_sink_failed', plate=plate_number, error=str(e))
+            self._sink_error = e
+        finally:
+            # The permit and the completion count must come back even if the sink failed
+            self.stats['sink'].record(time.perf_counter() - started)
+            self.in_flight.release()
+            with self._done:
+                self._completed += 1
+                self._done.notify_all()
+
+    def _next_site(self, plate_number, site_index, sink):
+        """ Move a plate on to the next site, or finish it when none are left """
+        if site_index + 1 < len(self.sites):
+            self.fetch_queue.put(('landing', plate_number, site_index + 1, None))
+        else:
+            self._finish(plate_number, None, sink)
+
+    def _fetch_worker(self, sink):
+        session = get_http_session()
+        while True:
+            task = self.fetch_queue.get()
+            if task is None:
+                return
+            step, plate_number, site_index, form = task
+            website = self.sites[site_index]
+            started = time.perf_counter()
+            content = None
+            try:
+                if step == 'landing':
+                    with source_span(self.source, website, stage='landing') as span:
+                        response = fetch_page(session, website)
+                        span.record_response(response)
+                else:
+                    action, form_data = form
+                    with source_span(self.source, action, stage='submit') as span:
+                        response = session.post(action, headers=SCRAPE_HEADERS, data=form_data, timeout=5)
+                        span.record_response(response)
+                if response.status_code == 200:
+                    content = response.content
+            except Exception:
+                content = None
+            self.stats['fetch'].record(time.perf_counter() - started)
+            
+            if content is None:
+                self._next_site(plate_number, site_index, sink)
+                continue
+            # Blocks while the parsers are behind
+            self.parse_queue.put(('form' if step == 'landing' else 'result', plate_number, site_index, content))
+            self.stats['parse'].sample_depth(self.parse_queue.qsize())
+
+    def _parse_dispatcher(self, pool, sink):
+        while True:
+            task = self.parse_queue.get()
+            if task is None:
+                return
+            step, plate_number, site_index, content = task
+            started = time.perf_counter()
+            try:
+                parsed, parse_seconds = pool.submit(parse_scraped_page, step, self.kind, content,
+                                                    self.sites[site_index], plate_number).result()
+                METRICS.observe('vech_source_parse_seconds', parse_seconds, {'source': self.source},
+                                buckets=PARSE_BUCKETS, help_text="Time spent decoding and parsing responses")
+            except Exception:
+                parsed = None
+            self.stats['parse'].record(time.perf_counter() - started)
+            
+            if parsed is None:
+                self._next_site(plate_number, site_index, sink)
+            elif step == 'form':
+                self.fetch_queue.put(('submit', plate_number, site_index, parsed))
+                self.stats['fetch'].sample_depth(self.fetch_queue.qsize())
+            else:
+                self._finish(plate_number, tag_source(parsed, self.source), sink)
+
+    def run(self, plates, sink):
+        """ Scrape every plate, calling sink(plate, result_or_None) as each completes
+        Returns the per-stage utilization report """
+        started = time.perf_counter()
+        submitted = 0
+        with ProcessPoolExecutor(max_workers=self.parse_processes) as pool:
+            fetchers = [threading.Thread(target=self._fetch_worker, args=(sink,), daemon=True)
+                        for _ in range(self.fetch_workers)]
+            dispatchers = [threading.Thread(target=self._parse_dispatcher, args=(pool, sink), daemon=True)
+                           for _ in range(self.parse_processes)]
+            for thread in fetchers + dispatchers:
+                thread.start()
+            
+            for plate_number in plates:
+                self.in_flight.acquire()
+                if self._sink_error is not None:
+                    self.in_flight.release()
+                    break
+                self.fetch_queue.put(('landing', plate_number, 0, None))
+                self.stats['fetch'].sample_depth(self.fetch_queue.qsize())
+                submitted += 1
+            
+            with self._done:
+                self._done.wait_for(lambda: self._completed >= submitted)
+            
+            for _ in fetchers:
+                self.fetch_queue.put(None)
+            for _ in dispatchers:
+                self.parse_queue.put(None)
+            for thread in fetchers + dispatchers:
+                thread.join()
+        
+        if self._sink_error is not None:
+            raise self._sink_error
+        wall = time.perf_counter() - started
+        return {
+            'plates': submitted,
+            'found': self.found,
+            'wall_seconds': round(wall, 3),
+            'stages': [stats.report(wall) for stats in self.stats.values()]
+        }
+
+def display_pipeline_report(report):
+    """ Display per-stage utilization of a pipeline run """
+    headers = ["Stage", "Workers", "Items", "Busy (s)", "Utilization", "Avg Queue", "Max Queue"]
+    data = [[stage['stage'], stage['workers'], stage['items'], stage['busy_seconds'],
+             f"{stage['utilization'] * 100:.1f}%", stage['avg_queue_depth'], stage['max_queue_depth']]
+            for stage in report['stages']]
+    print(f"\n{Fore.CYAN}[+] PIPELINE UTILIZATION{Style.RESET_ALL}")
+    print(tabulate(data, headers=headers, tablefmt="grid"))
+    if report.get('errors'):
+        print(f"{Fore.RED}[!] {report['errors']} plates failed inside the pipeline; run the same command again to retry them{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}[+] {report['found']} of {report['plates']} plates found in {report['wall_seconds']}s{Style.RESET_ALL}\n")
+
+def run_scrape_pipeline(input_file, output_file, kind='vehicle', fetch_workers=16, parse_processes=None, queue_size=64,
+                        dedup_capacity=None):
+    """ Scrape every (distinct) plate in input_file through the process-pool pipeline """
+    try:
+        reader = PlateReader(input_file, capacity=dedup_capacity)
+        plates = (plate.upper() for plate in reader if validate_license_plate(plate))
+        pipeline = ScrapePipeline(kind, fetch_workers, parse_processes, queue_size)
+        field = 'vehicle_info' if kind == 'vehicle' else 'challan_data'
+        
+        with open(output_file, 'w') as out:
+            def sink(plate_number, result):
+                out.write(json.dumps({'plate': plate_number, 'status': lookup_status(result),
+                                      field: result}) + '\n')
+            report = pipeline.run(plates, sink)
+        
+        reader.report()
+        display_pipeline_report(report)
+        print(f"{Fore.GREEN}[+] Results written to {output_file}{Style.RESET_ALL}")
+        return report
+    except Exception as e:
+        print(f"{Fore.RED}[!] Error in scraping pipeline: {str(e)}{Style.RESET_ALL}")
+        return None
+
+# Batch lookup pipeline: reader -> normalizer -> fetcher -> mapper -> sink over bounded queues
+class LookupPipeline:
+    """ Staged, backpressured batch lookup
+    Every queue between stages holds at most queue_size items, so a slow sink stalls
+    the mappers, slow mappers stall the fetchers and slow fetchers stall the reader.
+    Plates and results never pile up and memory stays flat however long the input
+    is. Queue depths are sampled for the final report and published as the
+    vech_pipeline_queue_depth gauge while the pipeline runs.
+
+    An exception while normalizing, fetching or mapping one plate is logged and
+    counted under 'errors', and the run carries on. An exception from the sink is
+    fatal: the pipeline stops reading, the remaining stages drain their queues
+    without doing any work, and run() re-raises the error. An interruption of
+    run() itself (Ctrl+C) stops the stages the same way and waits for them before
+    re-raising, so the sink is never called after run() has returned. """
+
+    def __init__(self, fetch_workers=8, map_workers=1, queue_size=64, skip=None,
+                 sample_interval=0.1, progress_interval=10.0):
+        self.fetch_workers = fetch_workers
+        self.map_workers = map_workers
+        self.queue_size = queue_size
+        self.skip = skip or (lambda plate_key: False)
+        self.sample_interval = sample_interval
+        self.progress_interval = progress_interval
+        # Each queue is named after the stage that consumes it
+        self.queues = {name: queue.Queue(maxsize=queue_size) for name in ('normalize', 'fetch', 'map', 'sink')}
+        self.stats = {
+            'read': StageStats('read', 1),
+            'normalize': StageStats('normalize', 1),
+            'fetch': StageStats('fetch', fetch_workers),
+            'map': StageStats('map', map_workers),
+            'sink': StageStats('sink', 1)
+        }
+        self.counts = {'read': 0, 'skipped': 0, 'invalid': 0, 'ok': 0, 'failed': 0, 'errors': 0}
+        self._done = threading.Event()
+        self._abort = threading.Event()
+        self._fatal = None
+        self._counts_lock = threading.Lock()
+
+    def depths(self):
+        """ Current number of items waiting in front of each stage """
+        return {name: q.qsize() for name, q in self.queues.items()}
+
+    def _stage(self, name, func, workers, downstream, downstream_workers):
+        """ Start the workers of one stage; the last one to finish closes the next queue """
+        inbox = self.queues[name]
+        remaining = [workers]
+        lock = threading.Lock()
+
+        def work():
+            while True:
+                item = inbox.get()
+                if item is None:
+                    break
+                if self._abort.is_set():
+                    # Shutting down: keep draining so nothing upstream blocks on put()
+                    continue
+                started = time.perf_counter()
+                try:
+                    func(item)
+                except Exception as e:
+                    self._failed(name, item, e)
+                self.stats[name].record(time.perf_counter() - started)
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last and downstream:
+                for _ in range(downstream_workers):
+                    self.queues[downstream].put(None)
+
+        threads = [threading.Thread(target=work, daemon=True, name=f'vech-{name}') for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _failed(self, name, item, error):
+        """ Count a per-item failure, or shut the pipeline down if the sink failed """
+        if name == 'sink':
+            log_event('pipeline_sink_failed', error=str(error))
+            if self._fatal is None:
+                self._fatal = error
+            self._abort.set()
+            return
+        with self._counts_lock:
+            self.counts['errors'] += 1
+        log_event('pipeline_item_failed', stage=name, item=repr(item)[:200], error=str(error))
+        print(f"{Fore.RED}[!] {name} stage failed on {item!r:.60}: {str(error)}{Style.RESET_ALL}")
+
+    def _normalize(self, plate_number):
+        plate_key = normalize_plate(plate_number)
+        if self.skip(plate_key):
+            self.counts['skipped'] += 1
+        elif not validate_license_plate(plate_number):
+            self.counts['invalid'] += 1
+            self.queues['sink'].put(('invalid', plate_key, plate_number, None, None))
+        else:
+            self.queues['fetch'].put((plate_key, plate_number))
+
+    def _fetch(self, item):
+        plate_key, plate_number = item
+        self.queues['map'].put((plate_key, plate_number, lookup_record(plate_number)))
+
+    def _map(self, item):
+        plate_key, plate_number, record = item
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        self.queues['sink'].put(('result', plate_key, plate_number, record, line))
+
+    def _monitor(self):
+        last_progress = time.perf_counter()
+        while True:
+            # One last sample after the run leaves the gauges at their final depths
+            finished = self._done.wait(self.sample_interval)
+            depths = self.depths()
+            for name, depth in depths.items():
+                self.stats[name].sample_depth(depth)
+                METRICS.set('vech_pipeline_queue_depth', depth, {'stage': name},
+                            help_text="Items waiting in front of each batch pipeline stage")
+            if time.perf_counter() - last_progress >= self.progress_interval:
+                last_progress = time.perf_counter()
+                done = self.counts['ok'] + self.counts['failed']
+                log_event('pipeline_progress', read=self.counts['read'], done=done, queue_depths=depths)
+                print(f"{Fore.CYAN}[+] {done} of {self.counts['read']} plates done | queues: "
+                      + ", ".join(f"{name}={depth}" for name, depth in depths.items()) + Style.RESET_ALL)
+            if finished:
+                return
+
+    def run(self, plates, sink):
+        """ Look up every plate, calling sink(kind, plate_key, plate, record, line) in the sink thread
+        kind is 'result' (line is the encoded JSON record) or 'invalid'. Returns the
+        per-stage utilization report. """
+        started = time.perf_counter()
+
+        def deliver(item):
+            kind, plate_key, plate_number, record, line = item
+            sink(kind, plate_key, plate_number, record, line)
+            if kind == 'result':
+                self.counts['ok' if record['status'] == 'ok' else 'failed'] += 1
+
+        threads = []
+        threads += self._stage('sink', deliver, 1, None, 0)
+        threads += self._stage('map', self._map, self.map_workers, 'sink', 1)
+        threads += self._stage('fetch', self._fetch, self.fetch_workers, 'map', self.map_workers)
+        threads += self._stage('normalize', self._normalize, 1, 'fetch', self.fetch_workers)
+        monitor = threading.Thread(target=self._monitor, daemon=True, name='vech-pipeline-monitor')
+        monitor.start()
+        
+        closed = False
+        try:
+            # The reader runs here; put() blocks while the normalizer is behind
+            plates = iter(plates)
+            while not self._abort.is_set():
+                read_started = time.perf_counter()
+                plate_number = next(plates, None)
+                if plate_number is None:
+                    break
+                self.stats['read'].record(time.perf_counter() - read_started)
+                self.counts['read'] += 1
+                self.queues['normalize'].put(plate_number)
+            self.queues['normalize'].put(None)
+            closed = True
+            for thread in threads:
+                thread.join()
+        except BaseException:
+            # Interrupted: the stages drain without working once _abort is set
+            self._abort.set()
+            if not closed:
+                self.queues['normalize'].put(None)
+            for thread in threads:
+                thread.join()
+            raise
+        finally:
+            self._done.set()
+            monitor.join()
+        
+        if self._fatal is not None:
+            raise self._fatal
+        wall = time.perf_counter() - started
+        return {
+            'plates': self.counts['read'],
+            'found': self.counts['ok'],
+            'errors': self.counts['errors'],
+            'wall_seconds': round(wall, 3),
+            'stages': [stats.report(wall) for stats in self.stats.values()]
+        }
+
+# Cache snapshots: compressed, versioned JSON lines for sharing warm state between nodes
+SNAPSHOT_FORMAT = 'vech-challan-snapshot'
+SNAPSHOT_VERSION = 1
+
+def read_snapshot_header(path):
+    """ The header of a snapshot file (raises ValueError if it is not a usable snapshot) """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        try:
+            header = json.loads(f.readline() or '{}')
+        except ValueError:
+            header = {}
+    if header.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f"{path} is not a cache snapshot")
+    if header.get('version', 0) > SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is snapshot version {header['version']}; this tool reads up to {SNAPSHOT_VERSION}")
+    return header
+
+def write_snapshot(out, base=None):
+    """ Write the lookup cache, source health and scraping form schemas to a binary file object
+    One gzip'd JSON line per entry, between a header and an 'end' trailer that holds
+    the counts (so a truncated file is noticed). With base (a snapshot header) only
+    cache entries and form schemas stored after base was taken are written, making
+    a delta; source health is small and always written whole. The header keeps the
+    exact creation time: rounded, it could fall after an entry the base missed and
+    the next delta would miss it too. Returns the header. """
+    created = time.time()
+    header = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION, 'id': f'{random.getrandbits(64):016x}',
+              'created': created, 'base': base['id'] if base else None}
+    since = base['created'] if base else 0
+    counts = {'vehicle': 0, 'challan': 0, 'health': 0, 'form': 0}
+    with gzip.GzipFile(fileobj=out, mode='wb', compresslevel=6) as compressed, \
+            io.BufferedWriter(compressed, 1 << 20) as buffered:
+        encode = json.JSONEncoder(separators=(',', ':'), default=str).encode
+        
+        def emit(entry):
+            buffered.write(encode(entry).encode('utf-8') + b'\n')
+        
+        emit(header)
+        for (kind, plate), stored_at, value in LOOKUP_CACHE.entries_since(since):
+            emit({'t': kind, 'k': plate, 'at': round(stored_at, 3), 'v': value})
+            counts[kind] += 1
+        for state, source, attempts, successes in SOURCE_ROUTER.health():
+            emit({'t': 'health', 'state': state, 'source': source, 'attempts': attempts, 'successes': successes})
+            counts['health'] += 1
+        for key, stored_at, schema in FORM_SCHEMAS.entries_since(since):
+            emit({'t': 'form', 'k': list(key), 'at': round(stored_at, 3), 'v': schema})
+            counts['form'] += 1
+        emit({'t': 'end', 'counts': counts})
+    header['counts'] = counts
+    return header
+
+def save_snapshot(path, base_path=None):
+    """ Write a snapshot file, a delta against the snapshot at base_path if given """
+    base = read_snapshot_header(base_path) if base_path else None
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as out:
+        header = write_snapshot(out, base)
+    os.replace(tmp_path, path)
+    return header
+
+def load_snapshot(path):
+    """ Apply a full or delta snapshot to this process's caches
+    Entries keep the time they were first stored: expired ones and ones older than
+    what is already cached are skipped, so loading a chain of deltas in any order,
+    or the same file twice, is harmless. Returns (header, counts). """
+    counts = {'vehicle': 0, 'challan': 0, 'health': 0, 'form': 0, 'skipped': 0}
+    header = read_snapshot_header(path)
+    complete = False
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        f.readline()
+        try:
+            for line in f:
+                entry = json.loads(line)
+                kind = entry.get('t')
+                if kind in ('vehicle', 'challan'):
+                    applied = LOOKUP_CACHE.restore((kind, entry['k']), entry['v'], entry['at'])
+                elif kind == 'health':
+                    applied = SOURCE_ROUTER.restore_health(entry['state'], entry['source'],
+                                                           entry['attempts'], entry['successes'])
+                elif kind == 'form':
+                    applied = FORM_SCHEMAS.restore(tuple(entry['k']), entry['v'], entry['at'])
+                elif kind == 'end':
+                    complete = True
+                    break
+                else:
+                    continue  # entry type from a newer tool
+                counts[kind if applied else 'skipped'] += 1
+        except (EOFError, ValueError):
+            pass  # cut off mid-stream or mid-line
+    if not complete:
+        print(f"{Fore.YELLOW}[!] Snapshot {path} is truncated; loaded the entries before the cut{Style.RESET_ALL}")
+    return header, counts
+
+def run_snapshot_info(paths):
+    """ Show what snapshot files contain and how deltas chain to their bases """
+    rows = []
+    for path in paths:
+        try:
+            header = read_snapshot_header(path)
+            counts = {}
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    pass
+                trailer = json.loads(line)
+                counts = trailer.get('counts', {}) if trailer.get('t') == 'end' else {}
+        except (OSError, ValueError, EOFError) as e:
+            print(f"{Fore.RED}[!] {path}: {str(e)}{Style.RESET_ALL}")
+            continue
+        rows.append([path, header['id'], header.get('base') or '-',
+                     datetime.fromtimestamp(header['created']).strftime('%Y-%m-%d %H:%M:%S'),
+                     counts.get('vehicle', '?'), counts.get('challan', '?'), counts.get('health', '?'),
+                     counts.get('form', '?'), f"{os.path.getsize(path) / 1024:.1f}"])
+    print(tabulate(rows, headers=["File", "Id", "Base", "Created", "Vehicles", "Challans",
+                                  "Health", "Forms", "Size (KB)"], tablefmt="grid"))
+    return rows
+
+# Local HTTP service
+SERVICE_MAX_BULK = 1000
+
+class LookupService:
+    """ Long-lived lookup service state: worker pool, pooled sessions and caches """
+
+    def __init__(self, workers=8, cache_ttl=3600, snapshot_token=None):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='vech-worker')
+        self.started = time.time()
+        # Snapshots carry cached owner details, so exporting them needs this token
+        self.snapshot_token = snapshot_token
+        LOOKUP_CACHE.ttl = cache_ttl
+
+    def _lookup(self, kind, plate_number):
+        """ Run one lookup on a worker thread and build its JSON payload """
+        if not validate_license_plate(plate_number):
+            return {'plate': plate_number, 'status': 'invalid'}
+        
+        if kind == 'lookup':
+            return fetch_vehicle_and_challan(plate_number, use_cache=True)
+        
+        result, cached = cached_lookup(kind, plate_number)
+        return {
+            'plate': plate_number.upper(),
+            'status': lookup_status(result),
+            'cached': cached,
+            'vehicle_info' if kind == 'vehicle' else 'challan_data': result
+        }
+
+    def lookup(self, kind, plate_number):
+        return self.executor.submit(self._lookup, kind, plate_number).result()
+
+    def bulk(self, kind, plates):
+        futures = [self.executor.submit(self._lookup, kind, plate) for plate in plates]
+        return [future.result() for future in futures]
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'version': VERSION,
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'workers': self.workers,
+            'cache': LOOKUP_CACHE.stats()
+        }
+
+    def snapshot_allowed(self, authorization):
+        """ True if an Authorization header carries the snapshot token """
+        if not self.snapshot_token or not authorization:
+            return False
+        scheme, _, token = authorization.partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(token.strip().encode(), self.snapshot_token.encode())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+class LookupRequestHandler(BaseHTTPRequestHandler):
+    """ JSON endpoints:
+    GET  /health, /metrics
+    GET  /snapshot[?since=<created>&base=<id>]   gzip'd cache snapshot (a delta with since);
+         needs "Authorization: Bearer <token>" and is off unless the service has a snapshot token
+    GET  /vehicle/<plate>, /challan/<plate>, /lookup/<plate>
+    POST /vehicle/bulk, /challan/bulk, /lookup/bulk   body: {"plates": [...]} """
+
+    server_version = f"VechChallan/{VERSION}"
+    protocol_version = 'HTTP/1.1'
+    kinds = ('vehicle', 'challan', 'lookup')
+
+    def log_message(self, format, *args):
+        log_event('http_request', client=self.client_address[0], message=format % args)
+
+    def _send(self, code, body, content_type='application/json'):
+        if isinstance(body, bytes):
+            data = body
+        elif isinstance(body, str):
+            data = body.encode('utf-8')
+        else:
+            data = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return code
+
+    def _route(self, method):
+        service = self.server.service
+        parts = [part for part in urlparse(self.path).path.split('/') if part]
+        
+        if method == 'GET' and parts == ['health']:
+            return self._send(200, service.health())
+        if method == 'GET' and parts == ['metrics']:
+            return self._send(200, METRICS.render(), 'text/plain; version=0.0.4')
+        if method == 'GET' and parts == ['snapshot']:
+            if not service.snapshot_token:
+                return self._send(403, {'error': 'snapshot export is disabled; start the service with --snapshot-token'})
+            if not service.snapshot_allowed(self.headers.get('Authorization')):
+                return self._send(401, {'error': 'snapshot export needs "Authorization: Bearer <token>"'})
+            query = parse_qs(urlparse(self.path).query)
+            try:
+                base = {'id': query.get('base', [None])[0], 'created': float(query['since'][0])} if 'since' in query else None
+            except ValueError:
+                return self._send(400, {'error': 'since must be the created time of the base snapshot'})
+            buffer = io.BytesIO()
+            write_snapshot(buffer, base)
+            return self._send(200, buffer.getvalue(), 'application/gzip')
+        if len(parts) != 2 or parts[0] not in self.kinds:
+            return self._send(404, {'error': 'not found'})
+        
+        kind = parts[0]
+        if method == 'GET':
+            result = service.lookup(kind, parts[1])
+            return self._send(400 if result.get('status') == 'invalid' else 200, result)
+        
+        if parts[1] != 'bulk':
+            return self._send(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            plates = json.loads(self.rfile.read(length) or b'{}').get('plates', [])
+        except (ValueError, AttributeError):
+            return self._send(400, {'error': 'expected a JSON body like {"plates": [...]}'})
+        if not isinstance(plates, list) or not all(isinstance(plate, str) for plate in plates):
+            return self._send(400, {'error': '"plates" must be a list of strings'})
+        if len(plates) > SERVICE_MAX_BULK:
+            return self._send(413, {'error': f'at most {SERVICE_MAX_BULK} plates per request'})
+        return self._send(200, {'results': service.bulk(kind, plates)})
+
+    def _handle(self, method):
+        started = time.perf_counter()
+        endpoint = (urlparse(self.path).path.strip('/').split('/') or [''])[0] or 'root'
+        code = 500
+        try:
+            code = self._route(method)
+        except Exception as e:
+            code = self._send(500, {'error': str(e)})
+        finally:
+            METRICS.inc('vech_http_requests_total', {'endpoint': endpoint, 'method': method, 'code': code},
+                        help_text="Service requests by endpoint, method and response code")
+            METRICS.observe('vech_http_request_seconds', time.perf_counter() - started, {'endpoint': endpoint},
+                            help_text="Service request latency")
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+def run_service(host='127.0.0.1', port=8080, workers=8, cache_ttl=3600, snapshot_token=None):
+    """ Serve lookups over HTTP until interrupted """
+    service = LookupService(workers, cache_ttl, snapshot_token)
+    server = ThreadingHTTPServer((host, port), LookupRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    print(f"{Fore.GREEN}[+] Serving on http://{host}:{server.server_address[1]} with {workers} workers{Style.RESET_ALL}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}[+] Shutting down service...{Style.RESET_ALL}")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+def print_banner():
+    """ Print the application banner """
+    banner = f"""
+{Fore.CYAN}
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║            INDIAN VEHICLE INFORMATION & CHALLAN             ║
+║                        VERIFICATION TOOL                     ║
+║                                                              ║
+║                   Version 2.0 | Enhanced Edition             ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+{Style.RESET_ALL}
+    """
+    print(banner)
+
+def parse_arguments(argv=None):
+    """ Parse command line arguments """
+    parser = argparse.ArgumentParser(
+        description=f"{TOOL_NAME} v{VERSION} - retrieve vehicle information and challan data from license plates",
+        epilog="Run without a command to start the interactive menu.")
+    parser.add_argument('--log-json', metavar='FILE',
+                        help="write a structured JSON event for every source attempt and lookup ('-' for stderr)")
+    parser.add_argument('--metrics-file', metavar='FILE',
+                        help="write counters and histograms in Prometheus text format on exit")
+    parser.add_argument('--profile', metavar='FILE', nargs='?', const='vech_profile.prof',
+                        help="profile the command and write a stats dump plus FILE_summary.txt "
+                             "(default: vech_profile.prof)")
+    parser.add_argument('--profile-mode', choices=['deterministic', 'sampling'], default='deterministic',
+                        help="deterministic (cProfile) or low-overhead stack sampling for long runs")
+    parser.add_argument('--profile-interval', type=float, default=0.01, metavar='SECONDS',
+                        help="sampling interval for --profile-mode sampling (default: 0.01)")
+    parser.add_argument('--merge-sources', action='store_true',
+                        help="query all vehicle sources concurrently and merge their fields by source trust")
+    parser.add_argument('--routes', metavar='FILE',
+                        help="load the learned per-RTO / per-state source routing table from FILE and save it on exit")
+    parser.add_argument('--page-cache', metavar='DIR',
+                        help="keep scraped landing pages in DIR and revalidate them with conditional requests")
+    parser.add_argument('--alert', action='append', metavar='HOOK',
+                        help="send expiry alerts for looked-up vehicles to HOOK: a file, cmd:COMMAND, "
+                             "an http:// webhook or - for the console (repeatable)")
+    parser.add_argument('--alert-lead', default=','.join(map(str, ALERT_LEAD_DAYS)), metavar='DAYS',
+                        help="comma separated days before an expiry to alert at (default: 30,7,1,0)")
+    parser.add_argument('--alert-state', metavar='FILE',
+                        help="remember sent alerts in FILE so later runs do not repeat them")
+    parser.add_argument('--load-snapshot', action='append', metavar='FILE',
+                        help="warm the caches from a snapshot before running; repeat for a base and its deltas")
+    parser.add_argument('--save-snapshot', metavar='FILE',
+                        help="write the caches to a compressed snapshot on exit")
+    parser.add_argument('--snapshot-base', metavar='FILE',
+                        help="make --save-snapshot a delta holding only what changed since this snapshot")
+    parser.add_argument('--no-routing', action='store_true',
+                        help="always walk the fixed source fallback chain instead of the routing table")
+    parser.add_argument('--strict', action='store_true',
+                        help="never generate placeholder data; report lookups no source answered as unavailable")
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    lookup_parser = subparsers.add_parser('lookup', help="look up a single vehicle and its challans")
+    lookup_parser.add_argument('plate', help="vehicle registration number")
+    lookup_parser.add_argument('--save', choices=sorted(SAVE_FORMATS), help="save the result in this format")
+    lookup_parser.add_argument('--page-size', type=int, help="page the challan table (0 for one screenful)")
+    lookup_parser.add_argument('--plain', action='store_true', help="tab-separated tables even on a terminal")
+    
+    batch_parser = subparsers.add_parser('batch', help="look up every plate listed in a file")
+    batch_parser.add_argument('input', help="text file with one registration number per line")
+    batch_parser.add_argument('-o', '--output', default='fleet_results.jsonl',
+                              help="JSON-lines result file (default: fleet_results.jsonl)")
+    batch_parser.add_argument('--reports', metavar='DIR', help="also write a text report per vehicle into DIR")
+    batch_parser.add_argument('--fresh', action='store_true',
+                              help="ignore the checkpoint journal of a previous run and start over")
+    batch_parser.add_argument('--workers', type=int, default=1,
+                              help="concurrent lookups through the bounded pipeline (default: 1, serial)")
+    batch_parser.add_argument('--queue-size', type=int, default=64,
+                              help="bound of each queue between pipeline stages (default: 64)")
+    batch_parser.add_argument('--dedup-capacity', type=int, metavar='N',
+                              help="deduplicate in bounded memory sized for N distinct plates (approximate: about 0.1%% of unique plates may be dropped)")
+    
+    challans_parser = subparsers.add_parser('challans', help="stream the challans of one plate as JSON lines")
+    challans_parser.add_argument('plate', help="vehicle registration number")
+    challans_parser.add_argument('-o', '--output', help="write to this file instead of stdout")
+    
+    coordinator_parser = subparsers.add_parser('coordinator', help="distribute plates to workers via a shared queue")
+    coordinator_parser.add_argument('--queue', default='work_queue.db', help="shared queue database (default: work_queue.db)")
+    coordinator_parser.add_argument('--enqueue', metavar='FILE', help="add the plates of FILE to the queue")
+    coordinator_parser.add_argument('--batch-size', type=int, default=50, help="plates per leased batch (default: 50)")
+    coordinator_parser.add_argument('--wait', action='store_true', help="wait until every batch is done")
+    coordinator_parser.add_argument('--merge', metavar='FILE', help="merge all worker results into FILE (JSON lines)")
+    
+    worker_parser = subparsers.add_parser('worker', help="lease and process plate batches from a shared queue")
+    worker_parser.add_argument('--queue', default='work_queue.db', help="shared queue database (default: work_queue.db)")
+    worker_parser.add_argument('--id', dest='worker_id', help="worker name (default: host-pid)")
+    worker_parser.add_argument('--lease', type=int, default=120, metavar='SECONDS',
+                               help="lease length, renewed by heartbeats every third of it (default: 120)")
+    
+    alerts_parser = subparsers.add_parser('alerts', help="alert on upcoming insurance/PUC/fitness/registration expiries")
+    alerts_parser.add_argument('results', nargs='*', default=['fleet_results.jsonl'],
+                               help="result files to index (default: fleet_results.jsonl)")
+    alerts_parser.add_argument('--follow', action='store_true',
+                               help="keep watching the result files for new lookups until interrupted")
+    alerts_parser.add_argument('--interval', type=float, default=60, metavar='SECONDS',
+                               help="how often to check for new results and due alerts (default: 60)")
+    alerts_parser.add_argument('--limit', type=int, default=20, help="pending alerts to list (default: 20)")
+    
+    snapshot_parser = subparsers.add_parser('snapshot', help="show what cache snapshot files contain")
+    snapshot_parser.add_argument('files', nargs='+', help="snapshot files written with --save-snapshot")
+    
+    routes_parser = subparsers.add_parser('routes', help="show a learned per-RTO / per-state source routing table")
+    routes_parser.add_argument('file', nargs='?', default='source_routes.json',
+                               help="routing table saved with --routes (default: source_routes.json)")
+    routes_parser.add_argument('--state', help="only show this state code and its RTOs")
+    
+    reports_parser = subparsers.add_parser('reports', help="render text reports for stored results in bulk")
+    reports_parser.add_argument('results', nargs='*', default=['fleet_results.jsonl'],
+                                help="result files to read (default: fleet_results.jsonl)")
+    reports_parser.add_argument('-o', '--output-dir', default='reports', help="report directory (default: reports)")
+    reports_parser.add_argument('--archive', metavar='ZIP', help="write all reports into one zip archive instead")
+    reports_parser.add_argument('--compress', action='store_true', help="deflate archive members")
+    reports_parser.add_argument('--workers', type=int, help="render processes (default: CPU count; 1 for serial)")
+    reports_parser.add_argument('--chunk-size', type=int, default=REPORT_CHUNK_SIZE,
+                                help=f"results per worker task (default: {REPORT_CHUNK_SIZE})")
+    
+    browse_parser = subparsers.add_parser('browse', help="page through stored results, one vehicle per row")
+    browse_parser.add_argument('results', nargs='*', default=['fleet_results.jsonl'],
+                               help="result files to read (default: fleet_results.jsonl)")
+    browse_parser.add_argument('--state', help="restrict to a state code such as DL or MH")
+    browse_parser.add_argument('--page-size', type=int, default=0,
+                               help="rows per page on a terminal (default: one screenful)")
+    browse_parser.add_argument('--plain', action='store_true', help="tab-separated output even on a terminal")
+    
+    query_parser = subparsers.add_parser('query', help="query stored batch results without re-querying the portals")
+    query_parser.add_argument('query', choices=['outstanding', 'flagged', 'top-sections', 'expiring'],
+                              help="outstanding fines by state, blacklisted/inactive vehicles, "
+                                   "top offence sections by amount, or upcoming expiries")
+    query_parser.add_argument('-r', '--results', action='append', metavar='FILE',
+                              help="JSON-lines result file to index (repeatable, default: fleet_results.jsonl)")
+    query_parser.add_argument('--index', default='fleet_index.db', help="index database (default: fleet_index.db)")
+    query_parser.add_argument('--state', help="restrict to a state code such as DL or MH")
+    query_parser.add_argument('--field', choices=EXPIRY_FIELDS, default='insurance_upto',
+                              help="expiry field for 'expiring' (default: insurance_upto)")
+    query_parser.add_argument('--within', type=int, default=30, metavar='DAYS',
+                              help="expiry window for 'expiring' (default: 30)")
+    query_parser.add_argument('--include-expired', action='store_true', help="also list already lapsed documents")
+    query_parser.add_argument('--outstanding-only', action='store_true',
+                              help="top-sections: count only unpaid and pending challans")
+    query_parser.add_argument('--limit', type=int, default=20, help="maximum rows (default: 20)")
+    query_parser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    
+    scrape_parser = subparsers.add_parser('scrape', help="scrape many plates with HTML parsing in a process pool")
+    scrape_parser.add_argument('input', help="text file with one registration number per line")
+    scrape_parser.add_argument('--kind', choices=['vehicle', 'challan'], default='vehicle', help="what to scrape")
+    scrape_parser.add_argument('-o', '--output', default='scrape_results.jsonl',
+                               help="JSON-lines result file (default: scrape_results.jsonl)")
+    scrape_parser.add_argument('--fetch-workers', type=int, default=16, help="network threads (default: 16)")
+    scrape_parser.add_argument('--parse-processes', type=int, help="parser processes (default: CPU count)")
+    scrape_parser.add_argument('--queue-size', type=int, default=64,
+                               help="bound of the queue between fetch and parse stages (default: 64)")
+    scrape_parser.add_argument('--dedup-capacity', type=int, metavar='N',
+                               help="deduplicate in bounded memory sized for N distinct plates (approximate: about 0.1%% of unique plates may be dropped)")
+    
+    serve_parser = subparsers.add_parser('serve', help="run a local HTTP lookup service")
+    serve_parser.add_argument('--host', default='127.0.0.1', help="address to bind (default: 127.0.0.1)")
+    serve_parser.add_argument('--port', type=int, default=8080, help="port to listen on (default: 8080)")
+    serve_parser.add_argument('--workers', type=int, default=8, help="lookup worker threads (default: 8)")
+    serve_parser.add_argument('--cache-ttl', type=int, default=3600, metavar='SECONDS',
+                              help="how long lookup results stay cached (default: 3600)")
+    serve_parser.add_argument('--snapshot-token', default=os.environ.get('VECH_SNAPSHOT_TOKEN'), metavar='TOKEN',
+                              help="enable GET /snapshot for clients sending this bearer token; snapshots hold "
+                                   "cached owner details (default: $VECH_SNAPSHOT_TOKEN, else disabled)")
+    
+    synth_parser = subparsers.add_parser('synth', help="generate a reproducible synthetic fleet for load tests")
+    synth_parser.add_argument('count', type=int, help="number of vehicles to generate")
+    synth_parser.add_argument('-o', '--output', default='synthetic_fleet.jsonl',
+                              help="JSON-lines output in the batch result format (default: synthetic_fleet.jsonl)")
+    synth_parser.add_argument('--seed', type=int, help="random seed; the same seed gives the same fleet")
+    synth_parser.add_argument('--batch-size', type=int, default=1000, help="records per written batch (default: 1000)")
+    synth_parser.add_argument('--plates-only', action='store_true', help="write only the plate numbers, one per line")
+    synth_parser.add_argument('--states', help="comma separated state codes to draw plates from (default: all known)")
+    synth_parser.add_argument('--challans', metavar='N:W,...',
+                              help="challan count distribution as count:weight pairs (default: 0-5 uniform)")
+    synth_parser.add_argument('--payment', metavar='STATUS:W,...',
+                              help="payment status distribution (default: PAID:1,UNPAID:1,PENDING:1)")
+    synth_parser.add_argument('--expiry-days', metavar='MIN:MAX',
+                              help="insurance/PUC expiry range in days from today (default: -365:730)")
+    
+    return parser.parse_args(argv)
+
+def run_command(args):
+    """ Dispatch the selected command """
+    if args.command == 'lookup':
+        run_lookup(args.plate, args.save, args.page_size, args.plain or None)
+    elif args.command == 'batch':
+        run_batch(args.input, args.output, args.reports, args.fresh, args.workers, args.queue_size,
+                  args.dedup_capacity)
+    elif args.command == 'challans':
+        run_challan_stream(args.plate, args.output)
+    elif args.command == 'coordinator':
+        run_coordinator(args.queue, args.enqueue, args.batch_size, args.wait, args.merge)
+    elif args.command == 'worker':
+        run_worker(args.queue, args.worker_id, args.lease)
+    elif args.command == 'routes':
+        run_routes(args.file, args.state)
+    elif args.command == 'alerts':
+        run_alerts(args.results, args.follow, args.interval, args.limit)
+    elif args.command == 'snapshot':
+        run_snapshot_info(args.files)
+    elif args.command == 'reports':
+        run_bulk_reports(args.results, args.output_dir, args.archive, args.workers, args.chunk_size, args.compress)
+    elif args.command == 'browse':
+        run_browse(args.results, args.state, args.page_size, args.plain or None)
+    elif args.command == 'query':
+        run_query(args.query, args.results or ['fleet_results.jsonl'], args.index, args.state, args.field,
+                  args.within, args.limit, args.include_expired, args.json, args.outstanding_only)
+    elif args.command == 'scrape':
+        run_scrape_pipeline(args.input, args.output, args.kind, args.fetch_workers,
+                            args.parse_processes, args.queue_size, args.dedup_capacity)
+    elif args.command == 'serve':
+        run_service(args.host, args.port, args.workers, args.cache_ttl, args.snapshot_token)
+    elif args.command == 'synth':
+        run_synthetic_fleet(
+            args.count, args.output, args.seed, args.batch_size, args.plates_only,
+            states=args.states.upper().split(',') if args.states else None,
+            challan_counts=parse_weights(args.challans, int) if args.challans else None,
+            payment_statuses=parse_weights(args.payment, str.upper) if args.payment else None,
+            expiry_days=tuple(int(days) for days in args.expiry_days.split(':')) if args.expiry_days else None)
+    else:
+        interactive_menu()
+
+def main(argv=None):
+    """ Main function to run the application """
+    args = parse_arguments(argv)
+    if args.log_json:
+        configure_structured_logging(args.log_json)
+    LOOKUP_OPTIONS['merge_sources'] = args.merge_sources
+    LOOKUP_OPTIONS['strict'] = args.strict
+    LOOKUP_OPTIONS['routing'] = not args.no_routing
+    if args.routes:
+        SOURCE_ROUTER.load(args.routes)
+    if args.page_cache:
+        PAGE_CACHE.open(args.page_cache)
+    if args.load_snapshot or args.save_snapshot:
+        LOOKUP_OPTIONS['cache'] = True
+        if args.command == 'serve':
+            LOOKUP_CACHE.ttl = args.cache_ttl
+        for path in args.load_snapshot or []:
+            started = time.perf_counter()
+            try:
+                header, counts = load_snapshot(path)
+            except (OSError, ValueError, EOFError) as e:
+                print(f"{Fore.RED}[!] Could not load snapshot {path}: {str(e)}{Style.RESET_ALL}")
+                continue
+            print(f"{Fore.GREEN}[+] Loaded snapshot {header['id']} in {time.perf_counter() - started:.2f}s: "
+                  f"{counts['vehicle']} vehicles, {counts['challan']} challan sets, {counts['health']} source "
+                  f"health rows, {counts['form']} form schemas ({counts['skipped']} stale){Style.RESET_ALL}")
+    if args.alert or args.command == 'alerts':
+        EXPIRY_ALERTS.configure([make_alert_hook(spec) for spec in args.alert or ['-']],
+                                parse_lead_days(args.alert_lead))
+        if args.alert_state:
+            EXPIRY_ALERTS.load(args.alert_state)
+        if args.command != 'alerts':
+            EXPIRY_ALERTS.start()
+    
+    try:
+        if args.profile:
+            with profiled(args.profile, args.profile_mode, args.profile_interval):
+                run_command(args)
+        else:
+            run_command(args)
+    finally:
+        if args.metrics_file:
+            write_metrics(args.metrics_file)
+        if args.routes and args.command != 'routes':
+            SOURCE_ROUTER.save(args.routes)
+        if args.page_cache:
+            PAGE_CACHE.report()
+        if args.save_snapshot:
+            try:
+                header = save_snapshot(args.save_snapshot, args.snapshot_base)
+                kind = f"delta of {header['base']}" if header['base'] else "snapshot"
+                print(f"{Fore.GREEN}[+] Wrote {kind} {header['id']} to {args.save_snapshot}: "
+                      f"{json.dumps(header['counts'])}{Style.RESET_ALL}")
+            except (OSError, ValueError, EOFError) as e:
+                print(f"{Fore.RED}[!] Could not write snapshot {args.save_snapshot}: {str(e)}{Style.RESET_ALL}")
+        if EXPIRY_ALERTS.enabled:
+            EXPIRY_ALERTS.stop()
+            if args.alert_state:
+                EXPIRY_ALERTS.save(args.alert_state)
+
+def interactive_menu():
+    """ Run the interactive menu """
+    print_banner()
+    
+    try:
+        while True:
+            print(f"\n{Fore.CYAN}[+] Main Menu{Style.RESET_ALL}")
+            print("1. Check Vehicle Information")
+            print("2. Check Challan Information")
+            print("3. Check Both Vehicle & Challan Information")
+            print("4. Exit")
+            
+            choice = input(f"\n{Fore.YELLOW}[+] Enter your choice (1-4): {Style.RESET_ALL}")
+            
+            if choice == '1':
+                # Vehicle Information Only
+                plate_number = input(f"{Fore.YELLOW}[+] Enter Vehicle Registration Number: {Style.RESET_ALL}")
+                if not validate_license_plate(plate_number):
+                    print(f"{Fore.RED}[!] Invalid vehicle number format! Please try again.{Style.RESET_ALL}")
+                    continue
+                
+                print(f"{Fore.YELLOW}[+] Fetching vehicle information...{Style.RESET_ALL}")
+                vehicle_info = lookup_vehicle_info(plate_number)
+                
+                if is_unavailable(vehicle_info):
+                    display_vehicle_info(vehicle_info)
+                elif vehicle_info:
+                    display_vehicle_info(vehicle_info)
                     
                     # Ask to save
                     save_choice = input(f"{Fore.YELLOW}[+] Do you want to save this information? (y/n): {Style.RESET_ALL}")
@@ -1094,14 +4915,16 @@ def main():
             elif choice == '2':
                 # Challan Information Only
                 plate_number = input(f"{Fore.YELLOW}[+] Enter Vehicle Registration Number: {Style.RESET_ALL}")
-                if not validate_plate_number(plate_number):
+                if not validate_license_plate(plate_number):
                     print(f"{Fore.RED}[!] Invalid vehicle number format! Please try again.{Style.RESET_ALL}")
                     continue
                 
                 print(f"{Fore.YELLOW}[+] Fetching challan information...{Style.RESET_ALL}")
-                challan_data = get_challan_data_from_api(plate_number)
+                challan_data = lookup_challan_data(plate_number)
                 
-                if challan_data is not None:
+                if is_unavailable(challan_data):
+                    display_challan_info(challan_data)
+                elif challan_data is not None:
                     display_challan_info(challan_data)
                     
                     # Ask to save
@@ -1123,19 +4946,24 @@ def main():
             elif choice == '3':
                 # Both Vehicle and Challan Information
                 plate_number = input(f"{Fore.YELLOW}[+] Enter Vehicle Registration Number: {Style.RESET_ALL}")
-                if not validate_plate_number(plate_number):
+                if not validate_license_plate(plate_number):
                     print(f"{Fore.RED}[!] Invalid vehicle number format! Please try again.{Style.RESET_ALL}")
                     continue
                 
-                print(f"{Fore.YELLOW}[+] Fetching vehicle information...{Style.RESET_ALL}")
-                vehicle_info = get_vehicle_info_from_api(plate_number)
+                print(f"{Fore.YELLOW}[+] Fetching vehicle and challan information...{Style.RESET_ALL}")
+                result = fetch_vehicle_and_challan(plate_number)
+                vehicle_info = result['vehicle_info']
+                challan_data = result['challan_data']
                 
-                print(f"{Fore.YELLOW}[+] Fetching challan information...{Style.RESET_ALL}")
-                challan_data = get_challan_data_from_api(plate_number)
+                # Each part is shown on its own, so one unavailable part doesn't hide the other
+                display_vehicle_info(vehicle_info)
+                display_challan_info(challan_data)
                 
-                if vehicle_info and challan_data is not None:
-                    display_vehicle_info(vehicle_info)
-                    display_challan_info(challan_data)
+                if is_unavailable(vehicle_info) and is_unavailable(challan_data):
+                    print(f"{Fore.RED}[!] Nothing to save: no source could answer for {plate_number.upper()}{Style.RESET_ALL}")
+                elif vehicle_info or challan_data is not None:
+                    vehicle_info = vehicle_info or {'registration_number': plate_number.upper()}
+                    challan_data = challan_data if challan_data is not None else []
                     
                     # Ask to save
                     save_choice = input(f"{Fore.YELLOW}[+] Do you want to save this information? (y/n): {Style.RESET_ALL}")